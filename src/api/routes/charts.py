@@ -2,9 +2,11 @@
 차트 생성 관련 API 라우트
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Path, Query
 from typing import Dict
+import asyncio
 import logging
+import math
 from datetime import datetime
 
 from ...core.data import StockDataFetcher, DataProcessor
@@ -15,10 +17,66 @@ from ...core.utils.exceptions import StockAnalysisError
 router = APIRouter(prefix="/charts", tags=["charts"])
 logger = logging.getLogger(__name__)
 
+@router.get("/indicators")
+async def get_latest_indicators(
+    tickers: str = Query(..., description="조회할 티커들 (쉼표로 구분, 예: AAPL,MSFT,005930.KS)"),
+    period: str = Query("1y", regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$")
+):
+    """여러 종목의 최신 차트 지표를 한 번에 계산합니다 (스크리닝용).
+
+    데이터는 동시에 조회하고, 지표는 종목 단위 병렬 커널로 한 번에 계산합니다.
+    조회에 실패한 종목은 errors에 담고 나머지 종목 결과는 그대로 반환합니다.
+    """
+    ticker_list = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+    if not ticker_list:
+        raise HTTPException(status_code=400, detail="티커를 하나 이상 입력하세요")
+
+    fetcher = StockDataFetcher()
+    processor = DataProcessor()
+    chart_analyzer = ChartAnalyzer()
+
+    # 데이터 조회 (종목별 실패는 모아서 보고)
+    fetched = await asyncio.gather(
+        *(fetcher.get_stock_data(ticker, period) for ticker in ticker_list),
+        return_exceptions=True,
+    )
+    frames = {}
+    errors = {}
+    for ticker, hist in zip(ticker_list, fetched):
+        if isinstance(hist, Exception):
+            errors[ticker] = str(hist)
+            continue
+        try:
+            frames[ticker] = processor.process_stock_data(hist)
+        except Exception as e:
+            errors[ticker] = str(e)
+
+    try:
+        indicators = chart_analyzer.calculate_technical_indicators_many(frames)
+    except Exception as e:
+        logger.error(f"Error calculating indicators for {list(frames)}: {str(e)}")
+        raise HTTPException(status_code=500, detail="내부 서버 오류")
+
+    results = {}
+    for ticker, values in indicators.items():
+        if not values:
+            errors[ticker] = "지표 계산에 필요한 데이터가 부족합니다"
+            continue
+        latest = {name: float(series.iloc[-1]) for name, series in values.items()}
+        # JSON에는 NaN을 쓸 수 없으므로 None으로 변환
+        results[ticker] = {name: (None if math.isnan(v) else v) for name, v in latest.items()}
+
+    return {
+        "period": period,
+        "timestamp": datetime.now(),
+        "results": results,
+        "errors": errors,
+    }
+
 @router.get("/{ticker}/{chart_type}", response_model=ChartData)
 async def get_chart(
     ticker: str,
-    chart_type: str = Query(..., regex="^(candlestick|price|technical)$"),
+    chart_type: str = Path(..., regex="^(candlestick|price|technical)$"),
     period: str = Query("1mo", regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$")
 ):
     """차트를 생성합니다."""
@@ -2,7 +2,21 @@
 핵심 분석 모듈
 """
 
-from .analysis.stock_analyzer import StockAnalyzer
-from .chart.analyzer import ChartAnalyzer
+import importlib
 
-__all__ = ['StockAnalyzer', 'ChartAnalyzer'] 
\ No newline at end of file
+# 패키지 import 시 plotly/scipy 등을 바로 불러오지 않도록 실제 접근 시점에 로드
+_LAZY_EXPORTS = {
+    'StockAnalyzer': '.analysis.stock_analyzer',
+    'ChartAnalyzer': '.chart.analyzer',
+}
+
+__all__ = ['StockAnalyzer', 'ChartAnalyzer']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
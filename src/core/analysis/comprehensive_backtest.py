@@ -5,13 +5,13 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
 import json
 import os
 import sys
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 import itertools
 import time
 
@@ -177,33 +177,7 @@ class ComprehensiveBacktester:
                 {"warmup": 75, "sentiment_period": 12, "sentiment_threshold": 0.28, "momentum_period": 25, "volume_weight": 0.45},
                 {"warmup": 85, "sentiment_period": 4, "sentiment_threshold": 0.42, "momentum_period": 6, "volume_weight": 0.55},
                 {"warmup": 90, "sentiment_period": 15, "sentiment_threshold": 0.22, "momentum_period": 30, "volume_weight": 0.15},
-                                {"warmup": 100, "sentiment_period": 20, "sentiment_threshold": 0.45, "momentum_period": 35, "volume_weight": 0.1}
-            ]
-        }
-            ],
-            "crypto_arbitrage": [
-                {"warmup": 50, "spread_threshold": 0.015, "momentum_period": 5, "mean_reversion_period": 20, "volume_threshold": 1.5},
-                {"warmup": 60, "spread_threshold": 0.020, "momentum_period": 8, "mean_reversion_period": 25, "volume_threshold": 2.0},
-                {"warmup": 70, "spread_threshold": 0.012, "momentum_period": 10, "mean_reversion_period": 15, "volume_threshold": 1.2},
-                {"warmup": 80, "spread_threshold": 0.025, "momentum_period": 12, "mean_reversion_period": 30, "volume_threshold": 2.5},
-                {"warmup": 55, "spread_threshold": 0.018, "momentum_period": 6, "mean_reversion_period": 22, "volume_threshold": 1.8},
-                {"warmup": 65, "spread_threshold": 0.022, "momentum_period": 9, "mean_reversion_period": 28, "volume_threshold": 1.6},
-                {"warmup": 75, "spread_threshold": 0.010, "momentum_period": 15, "mean_reversion_period": 12, "volume_threshold": 3.0},
-                {"warmup": 85, "spread_threshold": 0.030, "momentum_period": 4, "mean_reversion_period": 35, "volume_threshold": 1.3},
-                {"warmup": 90, "spread_threshold": 0.008, "momentum_period": 20, "mean_reversion_period": 10, "volume_threshold": 2.2},
-                {"warmup": 100, "spread_threshold": 0.035, "momentum_period": 25, "mean_reversion_period": 40, "volume_threshold": 1.1}
-            ],
-            "options_strategy": [
-                {"warmup": 60, "iv_period": 30, "volatility_threshold": 0.25, "strategy_type": "straddle", "profit_target": 0.15},
-                {"warmup": 70, "iv_period": 35, "volatility_threshold": 0.30, "strategy_type": "iron_condor", "profit_target": 0.12},
-                {"warmup": 80, "iv_period": 25, "volatility_threshold": 0.20, "strategy_type": "covered_call", "profit_target": 0.18},
-                {"warmup": 90, "iv_period": 40, "volatility_threshold": 0.35, "strategy_type": "protective_put", "profit_target": 0.10},
-                {"warmup": 65, "iv_period": 28, "volatility_threshold": 0.22, "strategy_type": "straddle", "profit_target": 0.20},
-                {"warmup": 75, "iv_period": 32, "volatility_threshold": 0.28, "strategy_type": "iron_condor", "profit_target": 0.14},
-                {"warmup": 85, "iv_period": 22, "volatility_threshold": 0.18, "strategy_type": "covered_call", "profit_target": 0.16},
-                {"warmup": 95, "iv_period": 45, "volatility_threshold": 0.40, "strategy_type": "protective_put", "profit_target": 0.08},
-                {"warmup": 100, "iv_period": 50, "volatility_threshold": 0.45, "strategy_type": "straddle", "profit_target": 0.25},
-                {"warmup": 110, "iv_period": 20, "volatility_threshold": 0.15, "strategy_type": "iron_condor", "profit_target": 0.22}
+                {"warmup": 100, "sentiment_period": 20, "sentiment_threshold": 0.45, "momentum_period": 35, "volume_weight": 0.1}
             ],
             "quantitative_factor": [
                 {"warmup": 60, "momentum_weight": 0.2, "mean_reversion_weight": 0.3, "volatility_weight": 0.15, "volume_weight": 0.1, "quality_weight": 0.15, "sentiment_weight": 0.1, "factor_threshold": 0.6},
@@ -226,16 +200,14 @@ class ComprehensiveBacktester:
             "momentum": MomentumStrategy(),
             "mean_reversion": MeanReversionStrategy(),
             "pattern": PatternStrategy(),
-            # 새로운 8개 고급 전략
+            # 새로운 7개 고급 전략
             "multi_timeframe": MultiTimeframeStrategy(),
             "volume_profile": VolumeProfileStrategy(),
             "market_regime": MarketRegimeStrategy(),
             "statistical_arbitrage": StatisticalArbitrageStrategy(),
             "quantitative_factor": QuantitativeFactorStrategy(),
             "machine_learning": MachineLearningStrategy(),
-            "sentiment_analysis": SentimentAnalysisStrategy(),
-            "crypto_arbitrage": CryptoArbitrageStrategy(),
-            "options_strategy": OptionsStrategy()
+            "sentiment_analysis": SentimentAnalysisStrategy()
         }
 
     async def get_processed_df_async(self, ticker: str, period: str = "3y") -> pd.DataFrame:
@@ -307,8 +279,13 @@ class ComprehensiveBacktester:
                 "status": "failed"
             }
 
-    async def run_comprehensive_backtest(self, progress_callback=None) -> Dict[str, Any]:
-        """종합 백테스트 실행"""
+    async def run_comprehensive_backtest(self, progress_callback=None,
+                                         max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """종합 백테스트 실행
+
+        종목별 전략 평가는 서로 독립적이므로 데이터를 수집하는 대로 프로세스 풀에 넘겨
+        종목 단위로 병렬 실행합니다 (max_workers=None이면 CPU 코어 수만큼).
+        """
         print("🚀 종합 백테스트 시작...")
         start_time = time.time()
         
@@ -320,54 +297,69 @@ class ComprehensiveBacktester:
         print(f"📊 총 백테스트 수행 예정: {total_tests:,}개")
         print(f"   - 섹터: {len(self.sector_stocks)}개")
         print(f"   - 종목: {sum(len(stocks) for stocks in self.sector_stocks.values())}개")
-        print(f"   - 전략: {len(self.strategies)}개 (기본 4개 + 새로운 9개, quantitative_factor 포함)")
+        print(f"   - 전략: {len(self.strategies)}개 (기본 4개 + 새로운 7개, quantitative_factor 포함)")
         print(f"   - 각 전략별 파라미터: 10개")
         completed_tests = 0
         
-        for sector, stocks in self.sector_stocks.items():
-            print(f"\n📊 {sector} 섹터 백테스트 시작...")
-            sector_results = []
-            
-            for ticker in stocks:
-                print(f"  📈 {ticker} 데이터 수집 중...")
-                
-                # 데이터 수집
-                df = await self.get_processed_df_async(ticker, "3y")
-                if df.empty:
-                    print(f"  ❌ {ticker} 데이터 수집 실패")
-                    completed_tests += len(self.strategies) * 10
-                    continue
+        # 종목마다 실행할 (전략, 파라미터) 조합과 진행 표시용 이름
+        jobs, job_labels = [], []
+        for strategy_name in self.strategies.keys():
+            for i, params in enumerate(self.strategy_params[strategy_name], 1):
+                jobs.append((strategy_name, params))
+                job_labels.append(f"{strategy_name} #{i}")
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_backtest_worker) as executor:
+            # 데이터 수집 (수집이 끝난 종목은 바로 백테스트 제출)
+            sector_futures = {}
+            for sector, stocks in self.sector_stocks.items():
+                print(f"\n📊 {sector} 섹터 백테스트 시작...")
+                sector_futures[sector] = []
                 
-                print(f"  ✅ {ticker} 데이터 수집 완료 ({len(df)}일)")
+                for ticker in stocks:
+                    print(f"  📈 {ticker} 데이터 수집 중...")
+                    
+                    df = await self.get_processed_df_async(ticker, "3y")
+                    if df.empty:
+                        print(f"  ❌ {ticker} 데이터 수집 실패")
+                        sector_futures[sector].append((ticker, None))
+                        continue
+                    
+                    print(f"  ✅ {ticker} 데이터 수집 완료 ({len(df)}일)")
+                    future = executor.submit(_run_ticker_backtests, ticker, df, jobs)
+                    sector_futures[sector].append((ticker, future))
+            
+            # 결과 수집 (섹터/종목 순서 유지)
+            for sector, futures in sector_futures.items():
+                sector_results = []
                 
-                for strategy_name in self.strategies.keys():
-                    strategy_params = self.strategy_params[strategy_name]
+                for ticker, future in futures:
+                    if future is None:  # 데이터 수집 실패
+                        completed_tests += len(jobs)
+                        continue
+                    try:
+                        results = await asyncio.wrap_future(future)
+                    except Exception as e:
+                        print(f"  ❌ 백테스트 실패: {ticker} - {e}")
+                        completed_tests += len(jobs)
+                        continue
                     
-                    for i, params in enumerate(strategy_params, 1):
-                        try:
-                            result = self.run_single_backtest(ticker, strategy_name, params, df)
-                            all_results.append(result)
-                            sector_results.append(result)
-                            
-                            completed_tests += 1
-                            
-                            if progress_callback:
-                                progress_callback(completed_tests, total_tests, 
-                                                f"{ticker} - {strategy_name} #{i}")
-                            
-                            # 진행상황 출력
-                            if completed_tests % 20 == 0:
-                                elapsed = time.time() - start_time
-                                progress = (completed_tests / total_tests) * 100
-                                print(f"  📈 진행률: {progress:.1f}% ({completed_tests}/{total_tests}) - 경과시간: {elapsed:.1f}초")
+                    all_results.extend(results)
+                    sector_results.extend(results)
+                    
+                    for label in job_labels:
+                        completed_tests += 1
                         
-                        except Exception as e:
-                            print(f"  ❌ 백테스트 실패: {ticker} - {strategy_name} #{i} - {e}")
-                            completed_tests += 1
-                            continue
-            
-            # 섹터 요약 생성
-            sector_summaries[sector] = self.create_sector_summary(sector_results)
+                        if progress_callback:
+                            progress_callback(completed_tests, total_tests, f"{ticker} - {label}")
+                        
+                        # 진행상황 출력
+                        if completed_tests % 20 == 0:
+                            elapsed = time.time() - start_time
+                            progress = (completed_tests / total_tests) * 100
+                            print(f"  📈 진행률: {progress:.1f}% ({completed_tests}/{total_tests}) - 경과시간: {elapsed:.1f}초")
+                
+                # 섹터 요약 생성
+                sector_summaries[sector] = self.create_sector_summary(sector_results)
         
         # 전략별 요약 생성
         for strategy_name in self.strategies.keys():
@@ -596,6 +588,30 @@ class ComprehensiveBacktester:
         return csv_filepath
 
 
+# 프로세스 풀 워커별 백테스터 (워커 초기화 시 한 번 생성)
+_worker_backtester = None
+
+
+def _init_backtest_worker():
+    """워커 프로세스 초기화: 종목 단위로 병렬화하므로 워커 내부 병렬 커널은 단일 스레드로 실행"""
+    global _worker_backtester
+    try:
+        import numba
+        numba.set_num_threads(1)
+    except ImportError:
+        pass
+    _worker_backtester = ComprehensiveBacktester()
+
+
+def _run_ticker_backtests(ticker: str, df: pd.DataFrame,
+                          jobs: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """한 종목에 대해 (전략, 파라미터) 조합을 순서대로 백테스트합니다 (워커 프로세스에서 실행)"""
+    return [
+        _worker_backtester.run_single_backtest(ticker, strategy_name, params, df)
+        for strategy_name, params in jobs
+    ]
+
+
 async def run_comprehensive_backtest():
     """종합 백테스트 실행 함수"""
     backtester = ComprehensiveBacktester()
@@ -5,7 +5,6 @@
 import asyncio
 import logging
 from typing import Dict, Any
-import yfinance as yf
 import pandas as pd
 from datetime import datetime
 
@@ -15,6 +14,7 @@ from .technical.volatility import VolatilityAnalyzer
 from .technical.trend import TrendAnalyzer
 from .financial.analyzer import FinancialAnalyzer
 from .financial.earnings import EarningsAnalyzer
+from ..data.fetcher import get_yfinance
 from ..utils.exceptions import (
     StockAnalysisError, InvalidTickerError, DataNotFoundError,
     ValidationError, NetworkError, EmptyDataError
@@ -45,7 +45,7 @@ class StockAnalyzer:
             
             try:
                 # 주식 데이터 가져오기
-                stock = yf.Ticker(ticker)
+                stock = get_yfinance().Ticker(ticker)
                 info = stock.info
                 hist = stock.history(period=period)
             except Exception as e:
@@ -117,7 +117,7 @@ class StockAnalyzer:
             ticker = ticker.upper()
             
             try:
-                stock = yf.Ticker(ticker)
+                stock = get_yfinance().Ticker(ticker)
                 info = stock.info
                 hist = stock.history(period="5d")
             except Exception as e:
@@ -0,0 +1,217 @@
+"""
+기술적 지표 계산용 NumPy 커널
+
+numba가 설치되어 있으면 JIT 컴파일되어 실행되고, 없으면 동일한 코드가
+순수 Python으로 동작합니다. 출력 배열은 입력과 같은 dtype(float32/float64)으로
+만들어지며, 누적 합/평균 같은 중간값은 float64 스칼라로 유지합니다.
+"""
+
+import numpy as np
+
+from ...utils.jit import njit, prange
+
+
+# compute_all 출력 컬럼 순서
+INDICATOR_KEYS = (
+    'ma_20', 'ma_50', 'ma_200', 'rsi', 'macd', 'signal', 'histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'k_percent', 'd_percent',
+)
+N_INDICATORS = len(INDICATOR_KEYS)
+
+
+@njit(cache=True)
+def rolling_mean(x, window):
+    """pandas rolling(window).mean()과 동일 (윈도우 내 NaN이 있으면 NaN)"""
+    n = x.size
+    out = np.full(n, np.nan, x.dtype)
+    total = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            total += v
+        if i >= window:
+            old = x[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+        if i >= window - 1 and nan_count == 0:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def rolling_mean_std(x, window):
+    """rolling(window).mean()과 rolling(window).std() (ddof=1)를 한 번의 순회로 계산합니다.
+
+    슬라이딩 Welford 갱신을 사용합니다. 입력에 NaN이 없어야 합니다.
+    """
+    n = x.size
+    mean_out = np.full(n, np.nan, x.dtype)
+    std_out = np.full(n, np.nan, x.dtype)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        v = x[i]
+        if i < window:
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+        else:
+            old = x[i - window]
+            prev_mean = mean
+            mean += (v - old) / window
+            m2 += (v - old) * (v - mean + old - prev_mean)
+        if i >= window - 1:
+            mean_out[i] = mean
+            std_out[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+    return mean_out, std_out
+
+
+@njit(cache=True)
+def rolling_min(x, window):
+    """pandas rolling(window).min()과 동일 (단조 덱, O(n))"""
+    n = x.size
+    out = np.full(n, np.nan, x.dtype)
+    dq = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -window
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            last_nan = i
+        else:
+            while tail > head and x[dq[tail - 1]] >= v:
+                tail -= 1
+            dq[tail] = i
+            tail += 1
+        while tail > head and dq[head] <= i - window:
+            head += 1
+        if i >= window - 1 and i - last_nan >= window:
+            out[i] = x[dq[head]]
+    return out
+
+
+@njit(cache=True)
+def rolling_max(x, window):
+    """pandas rolling(window).max()과 동일"""
+    return -rolling_min(-x, window)
+
+
+@njit(cache=True)
+def ewm_mean(x, span):
+    """pandas ewm(span=span).mean() (adjust=True)과 동일"""
+    n = x.size
+    out = np.empty(n, x.dtype)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        num = x[i] + decay * num
+        den = 1.0 + decay * den
+        out[i] = num / den
+    return out
+
+
+@njit(cache=True)
+def _fill_warmup(x, window):
+    """워밍업 구간(앞쪽 window-1개)을 첫 유효값으로 채웁니다 (선행 NaN에 대한 bfill)"""
+    x[:window - 1] = x[window - 1]
+
+
+@njit(cache=True)
+def compute_all(close, high, low, out):
+    """단일 종목의 차트 지표를 한 번에 계산하여 out[N_INDICATORS, T]에 기록합니다.
+
+    ChartAnalyzer.calculate_technical_indicators와 같은 결과를 냅니다. close에는 NaN이
+    없어야 하고 길이는 20 이상이어야 하며, 이 경우 NaN은 각 지표의 워밍업 구간에만
+    생기므로 전체 배열을 다시 훑지 않고 그 구간만 채웁니다.
+    """
+    n = close.size
+    ma_50_window = 50 if n >= 50 else 20
+    ma_200_window = 200 if n >= 200 else 20
+
+    # 볼린저 밴드 (20일 평균/표준편차 동시 계산, 평균은 MA20과 공유)
+    bb_mid, bb_std = rolling_mean_std(close, 20)
+    bb_upper = bb_mid + bb_std * 2
+    bb_lower = bb_mid - bb_std * 2
+
+    # 이동평균
+    ma_20 = bb_mid.copy()
+    ma_50 = rolling_mean(close, 50) if n >= 50 else ma_20.copy()
+    ma_200 = rolling_mean(close, 200) if n >= 200 else ma_20.copy()
+
+    # RSI (Wilder 평활: 첫 14개 구간은 단순평균으로 초기화한 뒤 avg = (avg*13 + x)/14)
+    rsi = np.empty(n, close.dtype)
+    rsi[:13] = 50.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        if i < 14:
+            # 첫 값(i=0)의 변화량은 0으로 보고 14개 창의 평균을 누적
+            avg_gain += gain / 14.0
+            avg_loss += loss / 14.0
+        else:
+            avg_gain = (avg_gain * 13.0 + gain) / 14.0
+            avg_loss = (avg_loss * 13.0 + loss) / 14.0
+        if i >= 13:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss + 1e-10))
+
+    # MACD
+    macd = ewm_mean(close, 12) - ewm_mean(close, 26)
+    signal = ewm_mean(macd, 9)
+    histogram = macd - signal
+
+    # 스토캐스틱
+    low_14 = rolling_min(low, 14)
+    high_14 = rolling_max(high, 14)
+    k = np.empty(n, close.dtype)
+    for i in range(n):
+        den = high_14[i] - low_14[i]
+        if den == 0:
+            den = 1e-10
+        v = 100.0 * (close[i] - low_14[i]) / den
+        if np.isnan(v):
+            v = 50.0
+        k[i] = min(max(v, 0.0), 100.0)
+    d_pct = rolling_mean(k, 3)
+
+    for col in (ma_20, bb_upper, bb_mid, bb_lower):
+        _fill_warmup(col, 20)
+    _fill_warmup(ma_50, ma_50_window)
+    _fill_warmup(ma_200, ma_200_window)
+
+    out[0] = ma_20
+    out[1] = ma_50
+    out[2] = ma_200
+    out[3] = rsi
+    out[4] = macd
+    out[5] = signal
+    out[6] = histogram
+    out[7] = bb_upper
+    out[8] = bb_mid
+    out[9] = bb_lower
+    out[10] = k
+    out[11] = d_pct
+
+
+@njit(parallel=True, cache=True)
+def compute_all_batch(closes, highs, lows, offsets):
+    """여러 종목을 종목 단위로 병렬 계산합니다.
+
+    길이가 다른 종목들을 이어 붙인 1차원 배열과 각 종목의 시작 위치(offsets,
+    길이 종목수+1)를 받아 (N_INDICATORS, 전체 길이) 배열을 반환합니다.
+    """
+    out = np.empty((N_INDICATORS, closes.size), closes.dtype)
+    for t in prange(offsets.size - 1):
+        start = offsets[t]
+        end = offsets[t + 1]
+        compute_all(closes[start:end], highs[start:end], lows[start:end], out[:, start:end])
+    return out
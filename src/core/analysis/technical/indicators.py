@@ -2,7 +2,9 @@
 기술적 분석 모듈
 """
 
+import numpy as np
 import pandas as pd
+from scipy.signal import lfilter
 from typing import Dict, Any
 
 class TechnicalAnalyzer:
@@ -31,13 +33,26 @@ class TechnicalAnalyzer:
             "interpretation": TechnicalAnalyzer._interpret_rsi(current_rsi)
         }
     
+    @staticmethod
+    def _ema(values: np.ndarray, span: int) -> np.ndarray:
+        """ewm(span=span).mean() (adjust=True)을 IIR 필터(lfilter)로 계산합니다."""
+        decay = 1.0 - 2.0 / (span + 1.0)
+        weighted_sum = lfilter([1.0], [1.0, -decay], values)
+        weight_total = (1.0 - decay ** np.arange(1, len(values) + 1)) / (1.0 - decay)
+        return weighted_sum / weight_total
+
     @staticmethod
     def calculate_macd(close_prices: pd.Series) -> Dict[str, Any]:
         """MACD를 계산합니다."""
-        ema_12 = close_prices.ewm(span=12).mean()
-        ema_26 = close_prices.ewm(span=26).mean()
-        macd = ema_12 - ema_26
-        signal = macd.ewm(span=9).mean()
+        values = close_prices.to_numpy(dtype=float)
+        if np.isnan(values).any():
+            # NaN이 있으면 pandas의 NaN 가중치 처리를 그대로 사용
+            macd = close_prices.ewm(span=12).mean() - close_prices.ewm(span=26).mean()
+            signal = macd.ewm(span=9).mean()
+        else:
+            macd_values = TechnicalAnalyzer._ema(values, 12) - TechnicalAnalyzer._ema(values, 26)
+            macd = pd.Series(macd_values, index=close_prices.index)
+            signal = pd.Series(TechnicalAnalyzer._ema(macd_values, 9), index=close_prices.index)
         histogram = macd - signal
         
         return {
@@ -2,7 +2,7 @@
 백테스트 패키지 초기화
 """
 
-from .engine import BacktestEngine
+from .engine import BacktestEngine, EquityCurve
 from .metrics import compute_metrics
 
-__all__ = ["BacktestEngine", "compute_metrics"]
+__all__ = ["BacktestEngine", "EquityCurve", "compute_metrics"]
@@ -4,7 +4,20 @@
 from __future__ import annotations
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
+from dataclasses import dataclass
+
+@dataclass
+class EquityCurve:
+    """자산 곡선 (날짜/자산가치 병렬 배열)"""
+    dates: pd.Index
+    equities: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.equities)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"equity": self.equities}, index=pd.Index(self.dates, name="date"))
 
 class BacktestEngine:
     
@@ -38,19 +51,14 @@ class BacktestEngine:
             
             # compute_signals의 결과에서 action 컬럼 추출
             if 'action' in signals_result.columns:
-                signal_df = signals_result[['action']].copy()
+                signal_df = signals_result[['action']]
             else:
                 # action 컬럼이 없으면 기본 HOLD로 설정
                 signal_df = pd.DataFrame(index=data.index)
                 signal_df['action'] = 'HOLD'
             
-            # 백테스트 실행
-            trades_df, equity_df = self.run(data, signal_df, initial_capital, fee_bps=10.0, slippage_bps=5.0)
-            
-            # 결과 포맷팅
-            trades = trades_df.to_dict('records') if not trades_df.empty else []
-            equity_curve = equity_df.to_dict('records') if not equity_df.empty else []
-            final_capital = equity_df['equity'].iloc[-1] if not equity_df.empty else initial_capital
+            # 백테스트 실행 (DataFrame 변환 없이 리스트 그대로 사용)
+            trades, equity_curve, final_capital = self._simulate(data, signal_df, initial_capital, fee_bps=10.0, slippage_bps=5.0)
             
             return {
                 "trades": trades,
@@ -64,48 +72,60 @@ class BacktestEngine:
             return {"trades": [], "equity_curve": [], "final_capital": initial_capital, "initial_capital": initial_capital}
     
     def run(self, df: pd.DataFrame, signals: pd.DataFrame, initial_capital: float = 100000, fee_bps: float = 10.0, slippage_bps: float = 10.0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """백테스트를 실행하고 (체결 내역, 자산 곡선)을 DataFrame으로 반환합니다."""
+        trades, equity, _ = self._simulate(df, signals, initial_capital, fee_bps, slippage_bps)
+        trades_df = pd.DataFrame(trades)
+        return trades_df, equity.to_frame()
+
+    def _simulate(self, df: pd.DataFrame, signals: pd.DataFrame, initial_capital: float = 100000, fee_bps: float = 10.0, slippage_bps: float = 10.0) -> Tuple[List[Dict[str, Any]], EquityCurve, float]:
+        """체결 시뮬레이션 본체. (체결 리스트, 자산 곡선, 최종 자산)을 반환합니다."""
         if df.empty or signals.empty:
             raise ValueError("데이터/시그널이 비어있습니다")
 
-        data = df.copy()
-        sig = signals.copy()
-
-        # 체결 룰: 신호 발생 다음 날 시가에 체결
-        data["signal"] = sig["action"].reindex(data.index).fillna("HOLD")
-        data["signal_shift"] = data["signal"].shift(1).fillna("HOLD")
+        # 체결 룰: 신호 발생 다음 날 시가에 체결 (입력 DataFrame은 변경하지 않음)
+        signal = signals["action"].reindex(df.index).fillna("HOLD").to_numpy()
+        signal_shift = np.concatenate([["HOLD"], signal[:-1]])
+        dates = df.index
+        open_arr = df["Open"].to_numpy()
+        close_arr = df["Close"].to_numpy()
 
         pos = 0  # 1: 롱, -1: 숏, 0: 없음 (여기서는 롱/현금만 사용)
         cash = initial_capital
         shares = 0.0
-        equity = []
+        equity = np.empty(max(len(df) - 1, 0), dtype=np.float64)
         trades = []
+        fee_mult = (fee_bps + slippage_bps) / 10000.0
+
+        # 체결이 일어날 수 있는 봉만 순회하고, 그 사이 구간의 자산가치는 버퍼에 구간 단위로 기록
+        event_idx = np.flatnonzero((signal_shift == "BUY") | (signal_shift == "SELL"))
+        seg_start = 1
 
-        for i in range(1, len(data)):
-            today = data.index[i]
-            prev = data.index[i-1]
-            open_px = data["Open"].iloc[i]
-            close_prev = data["Close"].iloc[i-1]
-            action = data["signal_shift"].iloc[i]
+        for i in event_idx[event_idx >= 1]:
+            # 자산가치(종가 기준 평가): 직전 체결 이후 ~ 이번 봉 전날까지
+            equity[seg_start-1:i-1] = cash + shares * close_arr[seg_start:i]
+            seg_start = i
+
+            today = dates[i]
+            open_px = open_arr[i]
+            action = signal_shift[i]
 
             if action == "BUY" and pos == 0:
                 # 매수 체결
-                fee = open_px * (fee_bps + slippage_bps) / 10000.0
+                fee = open_px * fee_mult
                 shares = cash / (open_px + fee)
                 cash = 0.0
                 pos = 1
                 trades.append({"date": today, "action": "BUY", "price": open_px, "shares": shares})
             elif action == "SELL" and pos == 1:
                 # 청산 체결
-                fee = open_px * (fee_bps + slippage_bps) / 10000.0
+                fee = open_px * fee_mult
                 cash = shares * (open_px - fee)
                 trades.append({"date": today, "action": "SELL", "price": open_px, "shares": shares})
                 shares = 0.0
                 pos = 0
 
-            # 자산가치(종가 기준 평가)
-            eq = cash + shares * data["Close"].iloc[i]
-            equity.append({"date": today, "equity": eq})
+        equity[seg_start-1:] = cash + shares * close_arr[seg_start:]
 
-        equity_df = pd.DataFrame(equity).set_index("date")
-        trades_df = pd.DataFrame(trades)
-        return trades_df, equity_df
+        equity_curve = EquityCurve(dates=dates[1:], equities=equity)
+        final_capital = float(equity[-1]) if len(equity) else initial_capital
+        return trades, equity_curve, final_capital
@@ -2,10 +2,15 @@
 백테스트 성과 지표 계산
 """
 from __future__ import annotations
+import logging
 import pandas as pd
 import numpy as np
 from typing import Dict
 
+from .engine import EquityCurve
+
+logger = logging.getLogger(__name__)
+
 def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 252) -> Dict[str, float]:
     """백테스트 결과로부터 성과 지표를 계산합니다.
     
@@ -40,7 +45,9 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
         
         # equity 시계열 생성
         try:
-            if isinstance(equity_curve[0], dict):
+            if isinstance(equity_curve, EquityCurve):
+                equity_values = equity_curve.equities
+            elif isinstance(equity_curve[0], dict):
                 if 'equity' in equity_curve[0]:
                     equity_values = [item['equity'] for item in equity_curve]
                 elif 'portfolio_value' in equity_curve[0]:
@@ -50,33 +57,34 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
             else:
                 equity_values = equity_curve
             
-            eq = pd.Series(equity_values)
+            eq = np.asarray(equity_values, dtype=np.float64)
         except Exception as e:
-            print(f"Equity 데이터 파싱 중 오류: {e}")
+            logger.error("Equity 데이터 파싱 중 오류: %s", e)
             return {
                 "cagr": 0.0, "volatility": 0.0, "sharpe_ratio": 0.0,
                 "max_drawdown": 0.0, "win_rate": 0.0, "total_trades": 0
             }
         
         # CAGR 계산
-        periods = len(equity_values)
-        if periods > 1 and equity_values[0] > 0:
+        periods = len(eq)
+        if periods > 1 and eq[0] > 0:
             years = periods / freq
             if years > 0:
-                cagr = ((equity_values[-1] / equity_values[0]) ** (1 / years) - 1) * 100
+                cagr = ((eq[-1] / eq[0]) ** (1 / years) - 1) * 100
             else:
                 cagr = 0.0
         else:
             cagr = 0.0
         
         # 변동성 및 샤프 비율 계산
-        if len(eq) > 1:
-            returns = eq.pct_change().fillna(0)
-            volatility = returns.std() * np.sqrt(freq) * 100
-            sharpe_ratio = returns.mean() / (returns.std() + 1e-9) * np.sqrt(freq) if returns.std() > 0 else 0
+        if periods > 1:
+            returns = _pct_returns(eq)
+            returns_std = returns.std(ddof=1)
+            volatility = returns_std * np.sqrt(freq) * 100
+            sharpe_ratio = returns.mean() / (returns_std + 1e-9) * np.sqrt(freq) if returns_std > 0 else 0
             
             # 최대 낙폭 계산
-            cummax = eq.cummax()
+            cummax = np.maximum.accumulate(eq)
             drawdown = (eq / cummax - 1) * 100
             max_drawdown = drawdown.min()
         else:
@@ -86,10 +94,6 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
         
         # 승률 계산
         if trades:
-            # 모든 액션 타입 확인
-            action_types = set(t.get('action', 'UNKNOWN') for t in trades)
-            print(f"발견된 액션 타입들: {action_types}")
-            
             buy_trades = [t for t in trades if t.get('action') == 'BUY']
             sell_trades = [t for t in trades if t.get('action') == 'SELL']
             
@@ -97,22 +101,25 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
             if len(buy_trades) == 0 or len(sell_trades) == 0:
                 buy_trades_alt = [t for t in trades if t.get('action', '').upper() in ['BUY', 'LONG', 'ENTER', '1']]
                 sell_trades_alt = [t for t in trades if t.get('action', '').upper() in ['SELL', 'SHORT', 'EXIT', '-1', '0']]
-                print(f"대안 검색 - 매수형: {len(buy_trades_alt)}, 매도형: {len(sell_trades_alt)}")
+                logger.debug("대안 검색 - 매수형: %d, 매도형: %d", len(buy_trades_alt), len(sell_trades_alt))
                 if len(buy_trades_alt) > 0 or len(sell_trades_alt) > 0:
                     buy_trades = buy_trades_alt
                     sell_trades = sell_trades_alt
             
             # 디버깅 정보 출력
-            print(f"거래 데이터 분석 - 총 거래: {len(trades)}, 매수: {len(buy_trades)}, 매도: {len(sell_trades)}")
-            if len(trades) > 0:
-                print(f"첫 번째 거래: {trades[0]}")
-                print(f"마지막 거래: {trades[-1]}")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("거래 데이터 분석 - 총 거래: %d, 매수: %d, 매도: %d", len(trades), len(buy_trades), len(sell_trades))
+                logger.debug("첫 번째 거래: %s", trades[0])
+                logger.debug("마지막 거래: %s", trades[-1])
             
             winning_trades = 0
             total_trade_pairs = 0
             
-            # 시간순으로 거래 정렬
-            all_trades = sorted(trades, key=lambda x: x.get('date', ''))
+            # 시간순으로 거래 정렬 (날짜 없는 거래는 맨 앞, 동일 시각은 원래 순서 유지)
+            trade_dates = pd.to_datetime([t.get('date') for t in trades], utc=True, errors='coerce')
+            order = np.argsort(trade_dates.asi8, kind='stable')
+            all_trades = [trades[i] for i in order]
             
             # 매수-매도 쌍 찾기 (실제 거래 순서 기준)
             position = 0
@@ -132,10 +139,11 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
                         winning_trades += 1
                     total_trade_pairs += 1
                     position = 0
-                    print(f"거래 완료 - 매수: {buy_price:.2f}, 매도: {price:.2f}, 수익: {((price/buy_price - 1)*100):.2f}%")
+                    if debug_enabled:
+                        logger.debug("거래 완료 - 매수: %.2f, 매도: %.2f, 수익: %.2f%%", buy_price, price, (price / buy_price - 1) * 100)
             
             win_rate = (winning_trades / total_trade_pairs * 100) if total_trade_pairs > 0 else 0
-            print(f"승률 계산 결과 - 승리 거래: {winning_trades}/{total_trade_pairs}, 승률: {win_rate:.1f}%")
+            logger.debug("승률 계산 결과 - 승리 거래: %d/%d, 승률: %.1f%%", winning_trades, total_trade_pairs, win_rate)
         else:
             win_rate = 0.0
         
@@ -149,21 +157,34 @@ def compute_metrics(results_or_equity, data: pd.DataFrame = None, freq: int = 25
         }
         
     except Exception as e:
-        print(f"성과 지표 계산 중 오류: {e}")
+        logger.error("성과 지표 계산 중 오류: %s", e)
         return {
             "cagr": 0.0, "volatility": 0.0, "sharpe_ratio": 0.0,
             "max_drawdown": 0.0, "win_rate": 0.0, "total_trades": 0
         }
 
 
+def _pct_returns(eq: np.ndarray) -> np.ndarray:
+    """pct_change().fillna(0)의 NumPy 버전"""
+    rets = np.zeros_like(eq)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rets[1:] = eq[1:] / eq[:-1] - 1
+    rets[np.isnan(rets)] = 0.0
+    return rets
+
+
 def compute_metrics_legacy(equity: pd.DataFrame, freq: int = 252) -> Dict[str, float]:
     """기존 방식의 성과 지표 계산 (하위 호환성)"""
-    eq = equity["equity"].astype(float)
-    rets = eq.pct_change().fillna(0)
-    cagr = (eq.iloc[-1] / eq.iloc[0]) ** (freq / len(eq)) - 1 if len(eq) > 1 else 0.0
-    vol = rets.std() * np.sqrt(freq)
-    sharpe = rets.mean() / (rets.std() + 1e-9) * np.sqrt(freq)
-    cummax = eq.cummax()
+    eq = equity["equity"].to_numpy(dtype=np.float64)
+    if len(eq) == 0:
+        # 빈 equity 곡선 (1봉 입력 등): 수익률/낙폭을 정의할 수 없음
+        return {"CAGR": 0.0, "Volatility": np.nan, "Sharpe": np.nan, "MaxDrawdown": np.nan}
+    rets = _pct_returns(eq)
+    cagr = (eq[-1] / eq[0]) ** (freq / len(eq)) - 1 if len(eq) > 1 else 0.0
+    rets_std = rets.std(ddof=1) if len(rets) > 1 else np.nan
+    vol = rets_std * np.sqrt(freq)
+    sharpe = rets.mean() / (rets_std + 1e-9) * np.sqrt(freq)
+    cummax = np.maximum.accumulate(eq)
     dd = (eq / cummax - 1)
     maxdd = dd.min()
     return {
@@ -0,0 +1,63 @@
+"""
+차트 렌더링용 NumPy 커널
+
+numba가 설치되어 있으면 JIT 컴파일되어 실행되고, 없으면 동일한 코드가
+순수 Python으로 동작합니다.
+"""
+
+import numpy as np
+
+from ..utils.jit import njit
+
+
+@njit(cache=True)
+def up_down_index(a, b):
+    """a[i] >= b[i]이면 0, 아니면(NaN 포함) 1인 int8 배열 (상승/하락 색상 인덱스)"""
+    n = a.size
+    out = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        out[i] = 0 if a[i] >= b[i] else 1
+    return out
+
+
+@njit(cache=True)
+def lttb_indices(y, n_out):
+    """Largest-Triangle-Three-Buckets 다운샘플링으로 남길 위치(오름차순)를 반환합니다.
+
+    x는 등간격(0..n-1)으로 보고, 처음과 마지막 점은 항상 포함합니다.
+    """
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    bucket = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # 다음 버킷의 평균점
+        next_start = int((i + 1) * bucket) + 1
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(next_start, next_end):
+            avg_x += j
+            avg_y += y[j]
+        count = next_end - next_start
+        avg_x /= count
+        avg_y /= count
+
+        # 현재 버킷에서 (이전 선택점, 다음 버킷 평균점)과 만드는 삼각형이 가장 큰 점 선택
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        ay = y[a]
+        max_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((a - avg_x) * (y[j] - ay) - (a - j) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                best = j
+        out[i + 1] = best
+        a = best
+    out[n_out - 1] = n - 1
+    return out
@@ -2,20 +2,56 @@
 차트 분석 및 생성을 위한 통합 모듈
 """
 
-import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import asyncio
+import functools
+import hashlib
+import weakref
 import numpy as np
-from typing import Dict, Any, List, Tuple
-from scipy import stats
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Any, List, Optional, Tuple
 from scipy.signal import find_peaks
 
 from .renderers import ChartRenderer
 from .formatters import ChartFormatters
 from .styles import ChartStyles
 from ..analysis.technical.indicators import TechnicalAnalyzer
+from ..data.fetcher import get_yfinance
+from ..analysis.technical import _kernels
+
+
+# 피보나치 되돌림 비율 (0.0 = 최고가, 1.0 = 최저가)
+_FIBONACCI_RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+# 차트에 표시하는 중간 레벨(23.6% ~ 78.6%)의 선 색상
+_FIBONACCI_COLORS = (
+    'rgba(156, 39, 176, 0.6)',
+    'rgba(103, 58, 183, 0.6)',
+    'rgba(63, 81, 181, 0.8)',
+    'rgba(33, 150, 243, 0.6)',
+    'rgba(0, 188, 212, 0.6)',
+)
+
+
+class _FrameRef:
+    """DataFrame 지문(key)으로만 비교되는 약한 참조 래퍼 (lru_cache 키 용도)"""
+    __slots__ = ('key', 'df_ref')
+    
+    def __init__(self, key: Tuple, df: pd.DataFrame):
+        self.key = key
+        self.df_ref = weakref.ref(df)
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _FrameRef) and self.key == other.key
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_technical_indicators(frame: _FrameRef) -> Dict[str, pd.Series]:
+    return ChartAnalyzer._compute_technical_indicators(frame.df_ref())
 
 
 class ChartAnalyzer:
@@ -30,85 +66,119 @@ class ChartAnalyzer:
     async def get_stock_data(self, ticker: str, period: str = "1y") -> pd.DataFrame:
         """주식 데이터를 가져옵니다."""
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
+            stock = get_yfinance().Ticker(ticker)
+            # 동기 네트워크 호출은 스레드로 넘겨 이벤트 루프를 막지 않음
+            hist = await asyncio.to_thread(stock.history, period=period)
             return hist
         except Exception as e:
             raise Exception(f"데이터 조회 실패: {str(e)}")
     
     def calculate_technical_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """기술적 지표를 계산합니다."""
+        """기술적 지표를 계산합니다.
+
+        같은 데이터(인덱스와 OHLC 값이 모두 동일)에 대한 반복 호출은 LRU 캐시된 결과를
+        재사용합니다. 캐시된 Series는 공유되므로
+        호출자에게는 복사본을 돌려줍니다.
+        """
         # 데이터 유효성 검사
         if df.empty:
             return {}
-            
-        close = df['Close'].dropna()
-        high = df['High'].dropna()
-        low = df['Low'].dropna()
         
-        if len(close) < 20:  # 최소 데이터 길이 확인
-            return {}
+        key = self._frame_key(df)
+        return {name: series.copy() for name, series in _cached_technical_indicators(_FrameRef(key, df)).items()}
+    
+    @staticmethod
+    def _frame_key(df: pd.DataFrame) -> Tuple:
+        """지표 캐시용 DataFrame 지문
+
+        인덱스와 OHLC 전체 값을 행 단위로 해싱하므로 중간 봉만 수정(수정주가 반영 등)되거나
+        다른 종목인 경우에도 캐시가 잘못 재사용되지 않습니다.
+        """
+        row_hashes = pd.util.hash_pandas_object(df[['Open', 'High', 'Low', 'Close']], index=True)
+        digest = hashlib.blake2b(row_hashes.to_numpy().tobytes(), digest_size=16).digest()
+        return (len(df), digest)
+    
+    @staticmethod
+    def _indicator_inputs(df: pd.DataFrame) -> Optional[Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]]:
+        """지표 계산용 (인덱스, 종가, 고가, 저가) 배열. 데이터가 부족하면 None
+
+        차트 표시용 지표에는 float32 정밀도로 충분하므로 float32로 변환해
+        커널이 다루는 메모리 양을 절반으로 줄입니다.
+        """
+        if df.empty:
+            return None
+        index = df.index
+        close = df['Close'].to_numpy(dtype=np.float32)
+        high = df['High'].to_numpy(dtype=np.float32)
+        low = df['Low'].to_numpy(dtype=np.float32)
         
-        # 이동평균
-        ma_20 = close.rolling(window=20).mean()
-        ma_50 = close.rolling(window=50).mean() if len(close) >= 50 else ma_20
-        ma_200 = close.rolling(window=200).mean() if len(close) >= 200 else ma_20
-        
-        # RSI
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        
-        # 0으로 나누는 것 방지
-        rs = gain / (loss + 1e-10)
-        rsi = 100 - (100 / (1 + rs))
-        rsi = rsi.fillna(50)  # NaN 값을 50으로 대체
-        
-        # MACD
-        ema_12 = close.ewm(span=12).mean()
-        ema_26 = close.ewm(span=26).mean()
-        macd = ema_12 - ema_26
-        signal = macd.ewm(span=9).mean()
-        histogram = macd - signal
-        
-        # 볼린저 밴드
-        bb_20 = close.rolling(window=20).mean()
-        bb_std = close.rolling(window=20).std()
-        bb_upper = bb_20 + (bb_std * 2)
-        bb_lower = bb_20 - (bb_std * 2)
-        
-        # 스토캐스틱
-        try:
-            low_14 = low.rolling(window=14).min()
-            high_14 = high.rolling(window=14).max()
-            
-            # 분모가 0이 되는 것 방지
-            denominator = high_14 - low_14
-            denominator = denominator.replace(0, 1e-10)
-            
-            k_percent = 100 * ((close - low_14) / denominator)
-            k_percent = k_percent.fillna(50).clip(0, 100)  # 0-100 범위로 제한
-            d_percent = k_percent.rolling(window=3).mean()
-        except Exception:
-            # 스토캐스틱 계산 실패 시 기본값 사용
-            k_percent = pd.Series([50] * len(close), index=close.index)
-            d_percent = pd.Series([50] * len(close), index=close.index)
+        # 종가가 NaN인 행 제외 (NaN이 없으면 복사 없이 그대로 사용)
+        valid = ~np.isnan(close)
+        if not valid.all():
+            index, close, high, low = index[valid], close[valid], high[valid], low[valid]
         
+        if len(close) < 20:  # 최소 데이터 길이 확인
+            return None
+        return index, close, high, low
+    
+    @staticmethod
+    def _indicators_from_block(index: pd.Index, block: np.ndarray) -> Dict[str, pd.Series]:
+        """커널 출력 (N_INDICATORS, T) 배열을 지표별 Series로 감쌉니다."""
         return {
-            'ma_20': ma_20.fillna(ma_20.mean()),
-            'ma_50': ma_50.fillna(ma_50.mean()),
-            'ma_200': ma_200.fillna(ma_200.mean()),
-            'rsi': rsi,
-            'macd': macd.fillna(0),
-            'signal': signal.fillna(0),
-            'histogram': histogram.fillna(0),
-            'bb_upper': bb_upper.fillna(bb_upper.mean()),
-            'bb_middle': bb_20.fillna(bb_20.mean()),
-            'bb_lower': bb_lower.fillna(bb_lower.mean()),
-            'k_percent': k_percent,
-            'd_percent': d_percent
+            key: pd.Series(block[j], index=index)
+            for j, key in enumerate(_kernels.INDICATOR_KEYS)
         }
     
+    @staticmethod
+    def _compute_technical_indicators(df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """기술적 지표 계산 본체 (이동평균, RSI, MACD, 볼린저 밴드, 스토캐스틱)
+
+        모든 지표는 _kernels.compute_all에서 종가/고가/저가를 한 번에 처리해 계산합니다.
+        이동평균/볼린저 밴드의 워밍업 구간은 첫 유효값으로, RSI의 워밍업 구간은 50으로,
+        스토캐스틱 %K의 NaN은 50으로 채워집니다.
+        """
+        inputs = ChartAnalyzer._indicator_inputs(df)
+        if inputs is None:
+            return {}
+        index, close, high, low = inputs
+        
+        block = np.empty((_kernels.N_INDICATORS, len(close)), dtype=close.dtype)
+        _kernels.compute_all(close, high, low, block)
+        return ChartAnalyzer._indicators_from_block(index, block)
+    
+    def calculate_technical_indicators_many(self, symbols_df_map: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, pd.Series]]:
+        """여러 종목의 기술적 지표를 한 번에 계산합니다 (종목 단위 병렬 처리).
+
+        결과는 종목별로 calculate_technical_indicators와 동일합니다.
+        """
+        results: Dict[str, Dict[str, pd.Series]] = {}
+        symbols, indexes, closes, highs, lows = [], [], [], [], []
+        
+        for symbol, df in symbols_df_map.items():
+            inputs = self._indicator_inputs(df)
+            if inputs is None:
+                results[symbol] = {}
+                continue
+            symbols.append(symbol)
+            indexes.append(inputs[0])
+            closes.append(inputs[1])
+            highs.append(inputs[2])
+            lows.append(inputs[3])
+        
+        if not symbols:
+            return results
+        
+        offsets = np.zeros(len(closes) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(c) for c in closes])
+        out = _kernels.compute_all_batch(
+            np.concatenate(closes), np.concatenate(highs), np.concatenate(lows), offsets
+        )
+        
+        for t, symbol in enumerate(symbols):
+            results[symbol] = self._indicators_from_block(indexes[t], out[:, offsets[t]:offsets[t + 1]])
+        
+        return results
+    
     def create_candlestick_chart(self, df: pd.DataFrame, ticker: str, indicators: Dict[str, pd.Series]) -> go.Figure:
         """캔들스틱 차트를 생성합니다."""
         # 서브플롯 생성 (가격, 거래량, RSI, MACD)
@@ -160,19 +230,16 @@ class ChartAnalyzer:
         """간단한 가격 차트를 생성합니다."""
         fig = go.Figure()
         
-        # 거래량 (오버레이) 추가
-        fig.add_trace(
+        fig.add_traces([
+            # 거래량 (오버레이)
             go.Bar(
                 x=df.index,
                 y=df['Volume'],
                 name='거래량',
                 yaxis='y2',
                 opacity=0.3
-            )
-        )
-        
-        # 종가 라인 차트 추가
-        fig.add_trace(
+            ),
+            # 종가 라인 차트
             go.Scatter(
                 x=df.index,
                 y=df['Close'],
@@ -180,7 +247,7 @@ class ChartAnalyzer:
                 name='종가',
                 line=dict(color='#1f77b4', width=2)
             )
-        )
+        ])
         
         # 포맷팅 및 스타일링 적용
         fig = self.formatters.add_korean_weekday_hover(fig)
@@ -226,97 +293,116 @@ class ChartAnalyzer:
         low_peaks, _ = find_peaks(-low_prices, distance=window//2)
         
         # 저항선 계산 (최고점들)
-        resistance_levels = []
+        resistance_levels = np.empty(0)
         if len(high_peaks) >= 2:
-            resistance_prices = high_prices[high_peaks]
-            # 빈도 기반으로 주요 저항선 찾기
-            for price in resistance_prices:
-                count = np.sum(np.abs(resistance_prices - price) <= price * 0.02)  # 2% 범위
-                if count >= 2:  # 최소 2번 이상 터치된 레벨
-                    resistance_levels.append(price)
+            resistance_levels = self._cluster_price_levels(high_prices[high_peaks])
         
         # 지지선 계산 (최저점들)
-        support_levels = []
+        support_levels = np.empty(0)
         if len(low_peaks) >= 2:
-            support_prices = low_prices[low_peaks]
-            for price in support_prices:
-                count = np.sum(np.abs(support_prices - price) <= price * 0.02)  # 2% 범위
-                if count >= 2:  # 최소 2번 이상 터치된 레벨
-                    support_levels.append(price)
-        
-        # 중복 제거 및 정렬
-        resistance_levels = sorted(list(set([round(r, 2) for r in resistance_levels])), reverse=True)
-        support_levels = sorted(list(set([round(s, 2) for s in support_levels])))
+            support_levels = self._cluster_price_levels(low_prices[low_peaks])
         
+        # _cluster_price_levels 결과는 np.unique로 정렬/중복 제거된 오름차순 배열
+        # 저항선은 가장 높은 3개(내림차순), 지지선은 가장 높은 3개(오름차순, 현재가에 가까운 순)
         return {
-            'resistance': resistance_levels[:3],  # 상위 3개만
-            'support': support_levels[-3:]  # 하위 3개만
+            'resistance': resistance_levels[::-1][:3].tolist(),
+            'support': support_levels[-3:].tolist()
         }
     
-    def calculate_fibonacci_levels(self, df: pd.DataFrame, lookback: int = 100) -> Dict[str, float]:
-        """피보나치 되돌림 레벨을 계산합니다."""
+    @staticmethod
+    def _cluster_price_levels(prices: np.ndarray, tolerance: float = 0.02) -> np.ndarray:
+        """피크 가격을 로그 가격 2% 구간으로 묶어, 2번 이상 터치된 구간의 평균 가격을 반환합니다."""
+        prices = prices[prices > 0]
+        if len(prices) == 0:
+            return np.empty(0)
+        bins = np.floor(np.log(prices) / np.log1p(tolerance)).astype(np.int64)
+        _, inverse, counts = np.unique(bins, return_inverse=True, return_counts=True)
+        means = np.bincount(inverse, weights=prices) / counts
+        return np.unique(np.round(means[counts >= 2], 2))
+    
+    def calculate_fibonacci_levels(self, df: pd.DataFrame, lookback: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """피보나치 되돌림 레벨을 계산합니다.
+
+        (비율 배열, 가격 배열)을 반환합니다. 비율은 0.0(최고가)부터 1.0(최저가)까지입니다.
+        """
         if len(df) < lookback:
             lookback = len(df)
         
-        recent_data = df.tail(lookback)
-        high_price = recent_data['High'].max()
-        low_price = recent_data['Low'].min()
+        # tail() DataFrame 없이 배열 끝부분에서 바로 최고/최저가 계산
+        high_price = np.nanmax(df['High'].to_numpy(dtype=float)[-lookback:])
+        low_price = np.nanmin(df['Low'].to_numpy(dtype=float)[-lookback:])
         
-        diff = high_price - low_price
+        levels = high_price - (high_price - low_price) * _FIBONACCI_RATIOS
+        levels[-1] = low_price
         
-        fibonacci_levels = {
-            '0.0': high_price,
-            '23.6': high_price - (diff * 0.236),
-            '38.2': high_price - (diff * 0.382),
-            '50.0': high_price - (diff * 0.5),
-            '61.8': high_price - (diff * 0.618),
-            '78.6': high_price - (diff * 0.786),
-            '100.0': low_price
-        }
-        
-        return fibonacci_levels
+        return _FIBONACCI_RATIOS, levels
     
     def calculate_price_channels(self, df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
         """가격 채널을 계산합니다."""
         # 선형 회귀 기반 채널
         close = df['Close']
-        x = np.arange(len(close))
         
-        # 채널 계산을 위한 롤링 윈도우
-        upper_channel = pd.Series(index=close.index, dtype=float)
-        lower_channel = pd.Series(index=close.index, dtype=float)
-        middle_channel = pd.Series(index=close.index, dtype=float)
+        # 채널 계산을 위한 롤링 윈도우 (numpy 배열에 채운 뒤 마지막에 한 번만 Series로 감쌈)
+        upper_channel = np.full(len(close), np.nan)
+        lower_channel = np.full_like(upper_channel, np.nan)
+        middle_channel = np.full_like(upper_channel, np.nan)
         
-        for i in range(window, len(close)):
-            y = close.iloc[i-window:i].values
+        if len(close) > window:
+            # i번째 값은 직전 window개(i-window ~ i-1) 구간의 회귀로 계산
+            y = sliding_window_view(close.to_numpy(dtype=float), window)[:-1]
             x_window = np.arange(window)
+            x_centered = x_window - x_window.mean()
+            sxx = (x_centered ** 2).sum()
             
-            # 선형 회귀
-            slope, intercept, _, _, std_err = stats.linregress(x_window, y)
+            # 모든 구간의 선형 회귀를 한 번에 계산
+            y_mean = y.mean(axis=1)
+            slope = (y - y_mean[:, None]) @ x_centered / sxx
+            intercept = y_mean - slope * x_window.mean()
             
             # 채널 계산
-            residuals = y - (slope * x_window + intercept)
-            std_residuals = np.std(residuals)
+            residuals = y - (slope[:, None] * x_window + intercept[:, None])
+            std_residuals = residuals.std(axis=1)
             
             current_x = window - 1
             middle_value = slope * current_x + intercept
             
-            middle_channel.iloc[i] = middle_value
-            upper_channel.iloc[i] = middle_value + (2 * std_residuals)
-            lower_channel.iloc[i] = middle_value - (2 * std_residuals)
+            middle_channel[window:] = middle_value
+            upper_channel[window:] = middle_value + (2 * std_residuals)
+            lower_channel[window:] = middle_value - (2 * std_residuals)
         
         return {
-            'upper': upper_channel.bfill(),
-            'middle': middle_channel.bfill(),
-            'lower': lower_channel.bfill()
+            'upper': pd.Series(upper_channel, index=close.index).bfill(),
+            'middle': pd.Series(middle_channel, index=close.index).bfill(),
+            'lower': pd.Series(lower_channel, index=close.index).bfill()
         }
     
-    def create_advanced_price_chart(self, df: pd.DataFrame, ticker: str) -> go.Figure:
-        """고급 가격 차트를 생성합니다 (채널, 지지저항선, 피보나치 포함)."""
+    @staticmethod
+    def _append_hline(shapes: List[dict], annotations: List[dict], y: float,
+                      line: dict, text: str, x: int, yanchor: str) -> None:
+        """fig.add_hline과 같은 수평선 shape와 주석을 목록에 추가합니다."""
+        shapes.append(dict(
+            type='line', xref='x domain', yref='y',
+            x0=0, x1=1, y0=y, y1=y, line=line
+        ))
+        annotations.append(dict(
+            text=text, showarrow=False, xref='x domain', yref='y',
+            x=x, y=y, xanchor='right', yanchor=yanchor
+        ))
+    
+    def create_advanced_price_chart(self, df: pd.DataFrame, ticker: str,
+                                    indicators: Optional[Dict[str, pd.Series]] = None) -> go.Figure:
+        """고급 가격 차트를 생성합니다 (채널, 지지저항선, 피보나치 포함).
+
+        indicators가 주어지면 이동평균을 다시 계산하지 않고 재사용합니다.
+        """
         fig = go.Figure()
+        # trace/수평선은 목록으로 모아 마지막에 한 번에 추가 (호출마다 반복되는 검증 회피)
+        traces = []
+        shapes = []
+        annotations = []
         
         # 캔들스틱 차트 추가
-        fig.add_trace(
+        traces.append(
             go.Candlestick(
                 x=df.index,
                 open=df['Open'],
@@ -336,7 +422,7 @@ class ChartAnalyzer:
             channels = self.calculate_price_channels(df)
             
             # 상단 채널
-            fig.add_trace(
+            traces.append(
                 go.Scatter(
                     x=df.index,
                     y=channels['upper'],
@@ -348,7 +434,7 @@ class ChartAnalyzer:
             )
             
             # 중간 채널 (추세선)
-            fig.add_trace(
+            traces.append(
                 go.Scatter(
                     x=df.index,
                     y=channels['middle'],
@@ -360,7 +446,7 @@ class ChartAnalyzer:
             )
             
             # 하단 채널
-            fig.add_trace(
+            traces.append(
                 go.Scatter(
                     x=df.index,
                     y=channels['lower'],
@@ -381,68 +467,64 @@ class ChartAnalyzer:
             
             # 저항선 추가
             for i, resistance in enumerate(support_resistance['resistance']):
-                fig.add_hline(
-                    y=resistance,
+                self._append_hline(
+                    shapes, annotations, resistance,
                     line=dict(color='rgba(244, 67, 54, 0.7)', width=2, dash='dot'),
-                    annotation_text=f'저항선 {i+1}: {resistance:.2f}',
-                    annotation_position='top right'
+                    text=f'저항선 {i+1}: {resistance:.2f}',
+                    x=1, yanchor='bottom'
                 )
             
             # 지지선 추가
             for i, support in enumerate(support_resistance['support']):
-                fig.add_hline(
-                    y=support,
+                self._append_hline(
+                    shapes, annotations, support,
                     line=dict(color='rgba(76, 175, 80, 0.7)', width=2, dash='dot'),
-                    annotation_text=f'지지선 {i+1}: {support:.2f}',
-                    annotation_position='bottom right'
+                    text=f'지지선 {i+1}: {support:.2f}',
+                    x=1, yanchor='top'
                 )
         except Exception as e:
             print(f"지지저항선 계산 오류: {e}")
         
         # 피보나치 되돌림 레벨 추가
         try:
-            fib_levels = self.calculate_fibonacci_levels(df)
+            fib_ratios, fib_prices = self.calculate_fibonacci_levels(df)
             
-            fib_colors = {
-                '23.6': 'rgba(156, 39, 176, 0.6)',
-                '38.2': 'rgba(103, 58, 183, 0.6)',
-                '50.0': 'rgba(63, 81, 181, 0.8)',
-                '61.8': 'rgba(33, 150, 243, 0.6)',
-                '78.6': 'rgba(0, 188, 212, 0.6)'
-            }
-            
-            for level, price in fib_levels.items():
-                if level in fib_colors:
-                    fig.add_hline(
-                        y=price,
-                        line=dict(color=fib_colors[level], width=1, dash='longdash'),
-                        annotation_text=f'Fib {level}%: {price:.2f}',
-                        annotation_position='left'
-                    )
+            # 양 끝(0%, 100%)을 제외한 중간 레벨만 표시
+            for ratio, price, color in zip(fib_ratios[1:-1], fib_prices[1:-1], _FIBONACCI_COLORS):
+                self._append_hline(
+                    shapes, annotations, price,
+                    line=dict(color=color, width=1, dash='longdash'),
+                    text=f'Fib {ratio * 100:.1f}%: {price:.2f}',
+                    x=0, yanchor='middle'
+                )
         except Exception as e:
             print(f"피보나치 레벨 계산 오류: {e}")
         
         # 이동평균선 추가
         try:
-            # 20일 이동평균
-            ma20 = df['Close'].rolling(window=20).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=ma20,
-                    mode='lines',
-                    name='MA20',
-                    line=dict(color='rgba(255, 87, 34, 0.8)', width=1),
-                    hovertemplate='MA20: %{y:.2f}<extra></extra>'
+            if indicators is None:
+                indicators = self.calculate_technical_indicators(df)
+            
+            # 20일 이동평균 (워밍업 구간 제외)
+            if 'ma_20' in indicators:
+                ma20 = indicators['ma_20'].iloc[19:]
+                traces.append(
+                    go.Scatter(
+                        x=ma20.index,
+                        y=ma20,
+                        mode='lines',
+                        name='MA20',
+                        line=dict(color='rgba(255, 87, 34, 0.8)', width=1),
+                        hovertemplate='MA20: %{y:.2f}<extra></extra>'
+                    )
                 )
-            )
             
             # 50일 이동평균
-            if len(df) >= 50:
-                ma50 = df['Close'].rolling(window=50).mean()
-                fig.add_trace(
+            if 'ma_50' in indicators and len(indicators['ma_50']) >= 50:
+                ma50 = indicators['ma_50'].iloc[49:]
+                traces.append(
                     go.Scatter(
-                        x=df.index,
+                        x=ma50.index,
                         y=ma50,
                         mode='lines',
                         name='MA50',
@@ -453,47 +535,14 @@ class ChartAnalyzer:
         except Exception as e:
             print(f"이동평균 계산 오류: {e}")
         
-        # 레이아웃 설정
-        fig.update_layout(
-            title=f'{ticker} - 고급 차트 분석 (채널, 지지저항선, 피보나치)',
-            yaxis_title='가격',
-            xaxis_title='날짜',
-            template='plotly_white',
-            height=700,
-            showlegend=True,
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor="rgba(255,255,255,0.8)",
-                bordercolor="rgba(0,0,0,0.2)",
-                borderwidth=1
-            ),
-            xaxis=dict(
-                rangeslider=dict(visible=False),
-                type='date'
-            ),
-            yaxis=dict(
-                fixedrange=False
-            )
-        )
+        fig.add_traces(traces)
         
-        # 범위 선택 버튼 추가
+        # 레이아웃 설정 (범위 선택 버튼 포함, 클래스 상수 재사용)
         fig.update_layout(
-            xaxis=dict(
-                rangeselector=dict(
-                    buttons=list([
-                        dict(count=1, label="1M", step="month", stepmode="backward"),
-                        dict(count=3, label="3M", step="month", stepmode="backward"),
-                        dict(count=6, label="6M", step="month", stepmode="backward"),
-                        dict(count=1, label="1Y", step="year", stepmode="backward"),
-                        dict(step="all")
-                    ])
-                ),
-                rangeslider=dict(visible=False),
-                type="date"
-            )
+            title=f'{ticker} - 고급 차트 분석 (채널, 지지저항선, 피보나치)',
+            shapes=shapes,
+            annotations=annotations,
+            **self.styles.ADVANCED_LAYOUT
         )
         
         return fig
@@ -515,7 +564,7 @@ class ChartAnalyzer:
                 'candlestick': self.create_candlestick_chart(df, ticker, indicators),
                 'price': self.create_price_chart(df, ticker),
                 'technical': self.create_technical_analysis_chart(df, ticker, indicators),
-                'advanced_price': self.create_advanced_price_chart(df, ticker)
+                'advanced_price': self.create_advanced_price_chart(df, ticker, indicators)
             }
             
             return charts
@@ -2,9 +2,18 @@
 차트 데이터 포맷팅을 위한 모듈
 """
 
+import functools
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict
 
+# dayofweek(월=0) 순서의 한글 요일
+_WEEKDAY_ARR = np.array(['월', '화', '수', '목', '금', '토', '일'], dtype=object)
+
+# Candlestick hovertemplate 지원 여부 (plotly 6 이상)
+_CANDLESTICK_HOVERTEMPLATE = hasattr(go.Candlestick, 'hovertemplate')
+
 class ChartFormatters:
     @staticmethod
     def get_korean_weekday(weekday_num: str) -> str:
@@ -39,44 +48,53 @@ class ChartFormatters:
         return f"{date_str}({ChartFormatters.get_korean_weekday(weekday)})<br>{indicator_name}: {value:.2f}"
     
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_currency_symbol(ticker: str) -> str:
-        """티커에 따른 통화 기호를 반환합니다."""
+        """티커에 따른 통화 기호를 반환합니다 (티커별로 캐시)."""
         return "￦" if ticker.endswith('.KS') else "$"
     
+    @staticmethod
+    def format_date_labels(x) -> np.ndarray:
+        """x축 날짜들을 'YYYY.MM.DD(요일)' 문자열 배열로 한 번에 변환합니다."""
+        idx = pd.DatetimeIndex(x)
+        return idx.strftime('%Y.%m.%d').to_numpy(dtype=object) + '(' + _WEEKDAY_ARR[idx.dayofweek] + ')'
+    
+    @staticmethod
+    def get_korean_weekdays(x) -> np.ndarray:
+        """x축 날짜들의 한글 요일 배열을 반환합니다."""
+        return _WEEKDAY_ARR[pd.DatetimeIndex(x).dayofweek]
+    
     def add_korean_weekday_hover(self, fig: go.Figure) -> go.Figure:
-        """차트의 모든 trace에 한글 요일 hover 텍스트를 추가합니다."""
+        """차트의 모든 trace에 한글 요일 hover 텍스트를 추가합니다.
+
+        요일만 customdata로 넘기고 나머지는 hovertemplate에서 포맷팅하므로 점마다
+        문자열을 만들지 않습니다 (hovertemplate이 없는 plotly 5.x의 캔들스틱만 예외).
+        """
         for trace in fig.data:
             if hasattr(trace, 'x') and trace.x is not None:
-                if isinstance(trace, go.Candlestick):
-                    # 캔들스틱의 경우 hover 텍스트 설정
-                    hover_texts = []
-                    for x, o, h, l, c in zip(trace.x, trace.open, trace.high, trace.low, trace.close):
-                        weekday = x.strftime('%w')
-                        date_str = x.strftime('%Y.%m.%d')
-                        hover_text = self.format_price_hover(date_str, weekday, o, h, l, c)
-                        hover_texts.append(hover_text)
-                    trace.text = hover_texts
+                if isinstance(trace, go.Candlestick) and _CANDLESTICK_HOVERTEMPLATE:
+                    # 캔들스틱의 경우 OHLC는 trace 값을 그대로 사용
+                    trace.customdata = self.get_korean_weekdays(trace.x)
+                    trace.hovertemplate = (
+                        '%{x|%Y.%m.%d}(%{customdata})<br>시가: %{open:.2f}<br>고가: %{high:.2f}'
+                        '<br>저가: %{low:.2f}<br>종가: %{close:.2f}<extra></extra>'
+                    )
+                elif isinstance(trace, go.Candlestick):
+                    # plotly 5.x의 Candlestick은 hovertemplate을 지원하지 않으므로 hover 텍스트 설정
+                    labels = self.format_date_labels(trace.x)
+                    trace.text = [
+                        f"{d}<br>시가: {o:.2f}<br>고가: {h:.2f}<br>저가: {l:.2f}<br>종가: {c:.2f}"
+                        for d, o, h, l, c in zip(labels, trace.open, trace.high, trace.low, trace.close)
+                    ]
                     trace.hoverinfo = 'text'
                 elif isinstance(trace, go.Bar):
                     # 거래량 바 차트의 경우
-                    hover_texts = []
-                    for x, v in zip(trace.x, trace.y):
-                        weekday = x.strftime('%w')
-                        date_str = x.strftime('%Y.%m.%d')
-                        hover_text = self.format_volume_hover(date_str, weekday, v)
-                        hover_texts.append(hover_text)
-                    trace.text = hover_texts
-                    trace.hoverinfo = 'text'
-                elif isinstance(trace, go.Scatter) and trace.name in ['RSI', 'MACD', 'Signal']:
+                    trace.customdata = self.get_korean_weekdays(trace.x)
+                    trace.hovertemplate = '%{x|%Y.%m.%d}(%{customdata})<br>거래량: %{y:,.0f}<extra></extra>'
+                elif isinstance(trace, (go.Scatter, go.Scattergl)) and trace.name in ['RSI', 'MACD', 'Signal']:
                     # RSI와 MACD의 경우
-                    hover_texts = []
-                    for x, y in zip(trace.x, trace.y):
-                        weekday = x.strftime('%w')
-                        date_str = x.strftime('%Y.%m.%d')
-                        hover_text = self.format_indicator_hover(date_str, weekday, trace.name, y)
-                        hover_texts.append(hover_text)
-                    trace.text = hover_texts
-                    trace.hoverinfo = 'text'
+                    trace.customdata = self.get_korean_weekdays(trace.x)
+                    trace.hovertemplate = f'%{{x|%Y.%m.%d}}(%{{customdata}})<br>{trace.name}: %{{y:.2f}}<extra></extra>'
                 else:
                     # 나머지 요소들은 hover 정보 숨김
                     trace.hoverinfo = 'skip'
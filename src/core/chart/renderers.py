@@ -3,17 +3,43 @@
 """
 
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Optional
 from .styles import ChartStyles
 from .formatters import ChartFormatters
+from ._kernels import up_down_index, lttb_indices
 
 class ChartRenderer:
     def __init__(self):
         self.styles = ChartStyles()
         self.formatters = ChartFormatters()
     
+    def _scatter_cls(self, n_points: int):
+        """포인트 수가 많은 선은 WebGL(Scattergl), 그 외에는 SVG(Scatter) trace 클래스를 반환합니다."""
+        return go.Scattergl if n_points > self.styles.WEBGL_MIN_POINTS else go.Scatter
+    
+    def _lttb_index(self, y: pd.Series) -> Optional[np.ndarray]:
+        """포인트가 MAX_LINE_POINTS를 넘으면 LTTB로 남길 위치를, 아니면 None을 반환합니다."""
+        if len(y) <= self.styles.MAX_LINE_POINTS:
+            return None
+        return lttb_indices(y.to_numpy(dtype=float), self.styles.MAX_LINE_POINTS)
+    
+    def _line_xy(self, y: pd.Series, x=None, idx: Optional[np.ndarray] = None):
+        """선 trace용 (x, y). 긴 시리즈는 LTTB로 다운샘플링합니다 (idx가 주어지면 그 위치 사용).
+
+        y는 Series 대신 NumPy 배열로 넘겨 plotly가 배열을 그대로 직렬화하도록 합니다.
+        x(DatetimeIndex)는 시간대 정보를 유지하도록 인덱스 그대로 둡니다.
+        """
+        if x is None:
+            x = y.index
+        values = y.to_numpy()
+        if idx is None:
+            idx = self._lttb_index(y)
+            if idx is None:
+                return x, values
+        return x[idx], values[idx]
+    
     def add_moving_averages(self, fig: go.Figure, df: pd.DataFrame, 
                            indicators: Dict[str, pd.Series], row: int = 1, col: int = 1):
         """이동평균선을 차트에 추가합니다."""
@@ -22,14 +48,18 @@ class ChartRenderer:
                    ('ma_200', 'MA200', 'red')]
         
         for ma_key, ma_name, color in ma_types:
-            if ma_key in indicators and not indicators[ma_key].empty:
-                # NaN 값 제거 및 유효성 검사
-                ma_data = indicators[ma_key].dropna()
-                if len(ma_data) > 0:
+            if ma_key in indicators:
+                # 한 번의 NaN 검사로 유효성 확인 (NaN이 없으면 새 Series를 만들지 않음)
+                ma_data = indicators[ma_key]
+                valid = ~np.isnan(ma_data.to_numpy(dtype=float))
+                if valid.any():
+                    if not valid.all():
+                        ma_data = ma_data[valid]
+                    ma_x, ma_y = self._line_xy(ma_data)
                     fig.add_trace(
-                        go.Scatter(
-                            x=ma_data.index,
-                            y=ma_data,
+                        self._scatter_cls(len(ma_data))(
+                            x=ma_x,
+                            y=ma_y,
                             mode='lines',
                             name=ma_name,
                             line=dict(color=color, width=1),
@@ -43,68 +73,77 @@ class ChartRenderer:
         """볼린저 밴드를 차트에 추가합니다."""
         bb_keys = ['bb_upper', 'bb_middle', 'bb_lower']
         
-        # 모든 BB 지표가 있고 유효한지 확인
-        if all(key in indicators and not indicators[key].empty for key in bb_keys):
-            try:
-                # NaN 값 처리
-                bb_upper = indicators['bb_upper'].dropna()
-                bb_middle = indicators['bb_middle'].dropna()
-                bb_lower = indicators['bb_lower'].dropna()
-                
-                if len(bb_upper) > 0 and len(bb_middle) > 0 and len(bb_lower) > 0:
-                    # BB 하단
-                    fig.add_trace(
-                        go.Scatter(
-                            x=bb_lower.index,
-                            y=bb_lower,
-                            mode='lines',
-                            name='BB 하단',
-                            line=dict(color='gray', width=1, dash='dash'),
-                            hoverinfo='skip'
-                        ),
-                        row=row, col=col
-                    )
-                    
-                    # BB 상단 (fill 적용)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=bb_upper.index,
-                            y=bb_upper,
-                            mode='lines',
-                            name='BB 상단',
-                            line=dict(color='gray', width=1, dash='dash'),
-                            fill='tonexty',
-                            fillcolor='rgba(128,128,128,0.1)',
-                            hoverinfo='skip'
-                        ),
-                        row=row, col=col
-                    )
-                    
-                    # BB 중앙선
-                    fig.add_trace(
-                        go.Scatter(
-                            x=bb_middle.index,
-                            y=bb_middle,
-                            mode='lines',
-                            name='BB 중앙',
-                            line=dict(color='purple', width=1),
-                            hoverinfo='skip'
-                        ),
-                        row=row, col=col
-                    )
-            except Exception as e:
-                print(f"볼린저 밴드 추가 중 오류: {e}")
-                pass
+        # 모든 BB 지표가 있는지 확인
+        if not all(key in indicators and not indicators[key].empty for key in bb_keys):
+            return
+        
+        # NaN 값 처리 (세 밴드는 NaN 위치가 같으므로 한 번에 제거하고 인덱스 공유)
+        bb_df = pd.concat(
+            {key: indicators[key] for key in bb_keys}, axis=1
+        ).dropna()
+        if bb_df.empty:
+            return
+        bb_upper = bb_df['bb_upper']
+        bb_middle = bb_df['bb_middle']
+        bb_lower = bb_df['bb_lower']
+        
+        # 세 밴드에 같은 다운샘플링 위치를 적용 (밴드 사이 채우기가 어긋나지 않도록)
+        bb_idx = self._lttb_index(bb_middle)
+        traces = []
+        
+        # BB 하단
+        lower_x, lower_y = self._line_xy(bb_lower, idx=bb_idx)
+        traces.append(
+            self._scatter_cls(len(bb_df))(
+                x=lower_x,
+                y=lower_y,
+                mode='lines',
+                name='BB 하단',
+                line=dict(color='gray', width=1, dash='dash'),
+                hoverinfo='skip'
+            )
+        )
+        
+        # BB 상단 (fill 적용)
+        upper_x, upper_y = self._line_xy(bb_upper, idx=bb_idx)
+        traces.append(
+            self._scatter_cls(len(bb_df))(
+                x=upper_x,
+                y=upper_y,
+                mode='lines',
+                name='BB 상단',
+                line=dict(color='gray', width=1, dash='dash'),
+                fill='tonexty',
+                fillcolor='rgba(128,128,128,0.1)',
+                hoverinfo='skip'
+            )
+        )
+        
+        # BB 중앙선
+        middle_x, middle_y = self._line_xy(bb_middle, idx=bb_idx)
+        traces.append(
+            self._scatter_cls(len(bb_df))(
+                x=middle_x,
+                y=middle_y,
+                mode='lines',
+                name='BB 중앙',
+                line=dict(color='purple', width=1),
+                hoverinfo='skip'
+            )
+        )
+        
+        # 세 trace를 한 번에 추가 (add_trace마다 반복되는 검증 회피)
+        fig.add_traces(traces, rows=row, cols=col)
     
     def add_candlestick(self, fig: go.Figure, df: pd.DataFrame, row: int = 1, col: int = 1):
         """캔들스틱 차트를 추가합니다."""
         fig.add_trace(
             go.Candlestick(
                 x=df.index,
-                open=df['Open'],
-                high=df['High'],
-                low=df['Low'],
-                close=df['Close'],
+                open=df['Open'].to_numpy(),
+                high=df['High'].to_numpy(),
+                low=df['Low'].to_numpy(),
+                close=df['Close'].to_numpy(),
                 name='가격',
                 **self.styles.get_candlestick_style()
             ),
@@ -118,7 +157,7 @@ class ChartRenderer:
         fig.add_trace(
             go.Bar(
                 x=df.index,
-                y=df['Volume'],
+                y=df['Volume'].to_numpy(),
                 name='거래량',
                 marker_color=colors,
                 opacity=0.7
@@ -130,10 +169,11 @@ class ChartRenderer:
                 row: int = 3, col: int = 1):
         """RSI 차트를 추가합니다."""
         if 'rsi' in indicators:
+            rsi_x, rsi_y = self._line_xy(indicators['rsi'], x=df.index)
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=indicators['rsi'],
+                self._scatter_cls(len(indicators['rsi']))(
+                    x=rsi_x,
+                    y=rsi_y,
                     mode='lines',
                     name='RSI',
                     line=dict(color=self.styles.COLORS['rsi'], width=2)
@@ -150,47 +190,48 @@ class ChartRenderer:
                  row: int = 4, col: int = 1):
         """MACD 차트를 추가합니다."""
         if 'macd' in indicators:
+            traces = []
+            
             # MACD 라인
-            fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=indicators['macd'],
+            macd_x, macd_y = self._line_xy(indicators['macd'], x=df.index)
+            traces.append(
+                self._scatter_cls(len(indicators['macd']))(
+                    x=macd_x,
+                    y=macd_y,
                     mode='lines',
                     name='MACD',
                     line=dict(color=self.styles.COLORS['macd'], width=2)
-                ),
-                row=row, col=col
+                )
             )
             
             # Signal 라인
-            fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=indicators['signal'],
+            signal_x, signal_y = self._line_xy(indicators['signal'], x=df.index)
+            traces.append(
+                self._scatter_cls(len(indicators['signal']))(
+                    x=signal_x,
+                    y=signal_y,
                     mode='lines',
                     name='Signal',
                     line=dict(color=self.styles.COLORS['signal'], width=2)
-                ),
-                row=row, col=col
+                )
             )
             
             # MACD 히스토그램
-            colors_hist = [
-                self.styles.COLORS['histogram_up'] if h >= 0 
-                else self.styles.COLORS['histogram_down']
-                for h in indicators['histogram']
-            ]
+            hist = indicators['histogram'].to_numpy()
+            colors_hist = self.styles.HISTOGRAM_COLOR_ARR[up_down_index(hist, np.zeros_like(hist))]
             
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     x=df.index,
-                    y=indicators['histogram'],
+                    y=hist,
                     name='Histogram',
                     marker_color=colors_hist,
                     opacity=0.7
-                ),
-                row=row, col=col
+                )
             )
+            
+            # MACD/Signal/히스토그램을 한 번에 추가
+            fig.add_traces(traces, rows=row, cols=col)
     
     def update_layout(self, fig: go.Figure, ticker: str, chart_type: str = 'candlestick'):
         """차트 레이아웃을 설정합니다."""
@@ -210,13 +251,8 @@ class ChartRenderer:
     
     def update_axes(self, fig: go.Figure, ticker: str, rows: int, cols: int):
         """축 레이블과 형식을 설정합니다."""
-        # X축 날짜 형식 설정
-        for i in range(1, rows + 1):
-            for j in range(1, cols + 1):
-                fig.update_xaxes(
-                    tickformat='%Y.%m.%d',
-                    row=i, col=j
-                )
+        # X축 날짜 형식 설정 (모든 서브플롯의 x축을 한 번에 갱신)
+        fig.update_xaxes(tickformat='%Y.%m.%d')
         
         # Y축 레이블 설정 (캔들스틱 차트의 경우)
         if rows == 4 and cols == 1:
@@ -228,15 +264,12 @@ class ChartRenderer:
     
     def add_volume_bars(self, fig: go.Figure, df: pd.DataFrame, row: int = 1, col: int = 1):
         """거래량 바 차트를 추가합니다."""
-        colors = [
-            self.styles.COLORS['volume_up'] if close >= open else self.styles.COLORS['volume_down']
-            for close, open in zip(df['Close'], df['Open'])
-        ]
+        colors = self.styles.get_volume_colors(df)
         
         fig.add_trace(
             go.Bar(
                 x=df.index,
-                y=df['Volume'],
+                y=df['Volume'].to_numpy(),
                 name='거래량',
                 marker_color=colors,
                 opacity=0.7
@@ -247,10 +280,11 @@ class ChartRenderer:
     def add_rsi(self, fig: go.Figure, indicators: Dict[str, pd.Series], row: int = 1, col: int = 1):
         """RSI 지표를 추가합니다."""
         if 'rsi' in indicators:
+            rsi_x, rsi_y = self._line_xy(indicators['rsi'])
             fig.add_trace(
-                go.Scatter(
-                    x=indicators['rsi'].index,
-                    y=indicators['rsi'],
+                self._scatter_cls(len(indicators['rsi']))(
+                    x=rsi_x,
+                    y=rsi_y,
                     mode='lines',
                     name='RSI',
                     line=dict(color='violet', width=2)
@@ -271,7 +305,7 @@ class ChartRenderer:
             fig.add_trace(
                 go.Scatter(
                     x=df.index,
-                    y=df['Close'],
+                    y=df['Close'].to_numpy(),
                     mode='lines',
                     name='가격',
                     line=dict(color='black', width=2)
@@ -285,27 +319,31 @@ class ChartRenderer:
     def add_stochastic(self, fig: go.Figure, indicators: Dict[str, pd.Series], row: int = 1, col: int = 1):
         """스토캐스틱 지표를 추가합니다."""
         if 'k_percent' in indicators:
-            fig.add_trace(
-                go.Scatter(
-                    x=indicators['k_percent'].index,
-                    y=indicators['k_percent'],
+            traces = []
+            k_x, k_y = self._line_xy(indicators['k_percent'])
+            traces.append(
+                self._scatter_cls(len(indicators['k_percent']))(
+                    x=k_x,
+                    y=k_y,
                     mode='lines',
                     name='%K',
                     line=dict(color='blue', width=2)
-                ),
-                row=row, col=col
+                )
             )
             
-            fig.add_trace(
-                go.Scatter(
-                    x=indicators['d_percent'].index,
-                    y=indicators['d_percent'],
+            d_x, d_y = self._line_xy(indicators['d_percent'])
+            traces.append(
+                self._scatter_cls(len(indicators['d_percent']))(
+                    x=d_x,
+                    y=d_y,
                     mode='lines',
                     name='%D',
                     line=dict(color='red', width=2)
-                ),
-                row=row, col=col
+                )
             )
             
+            # %K/%D를 한 번에 추가
+            fig.add_traces(traces, rows=row, cols=col)
+            
             fig.add_hline(y=80, line_dash="dash", line_color="red", row=row, col=col)
             fig.add_hline(y=20, line_dash="dash", line_color="green", row=row, col=col)
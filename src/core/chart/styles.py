@@ -2,7 +2,12 @@
 차트 스타일링을 위한 모듈
 """
 
-from typing import Dict, Any
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+from .formatters import ChartFormatters
+from ._kernels import up_down_index
 
 class ChartStyles:
     # 차트 색상
@@ -22,6 +27,10 @@ class ChartStyles:
         'histogram_down': '#ef5350'
     }
     
+    # 상승/하락 색상 배열 (up_down_index 결과로 인덱싱)
+    VOLUME_COLOR_ARR = np.array([COLORS['volume_up'], COLORS['volume_down']], dtype=object)
+    HISTOGRAM_COLOR_ARR = np.array([COLORS['histogram_up'], COLORS['histogram_down']], dtype=object)
+    
     # 차트 기본 설정
     LAYOUT_DEFAULTS = {
         'template': 'plotly_white',
@@ -30,6 +39,45 @@ class ChartStyles:
         'xaxis_rangeslider_visible': False
     }
     
+    # 고급 가격 차트 레이아웃 (채널, 지지저항선, 피보나치)
+    ADVANCED_LAYOUT = {
+        'yaxis_title': '가격',
+        'xaxis_title': '날짜',
+        'template': 'plotly_white',
+        'height': 700,
+        'showlegend': True,
+        'legend': dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01,
+            bgcolor="rgba(255,255,255,0.8)",
+            bordercolor="rgba(0,0,0,0.2)",
+            borderwidth=1
+        ),
+        'xaxis': dict(
+            rangeselector=dict(
+                buttons=[
+                    dict(count=1, label="1M", step="month", stepmode="backward"),
+                    dict(count=3, label="3M", step="month", stepmode="backward"),
+                    dict(count=6, label="6M", step="month", stepmode="backward"),
+                    dict(count=1, label="1Y", step="year", stepmode="backward"),
+                    dict(step="all")
+                ]
+            ),
+            rangeslider=dict(visible=False),
+            type='date'
+        ),
+        'yaxis': dict(
+            fixedrange=False
+        )
+    }
+    
+    # 이 개수를 넘는 지표 선은 SVG 대신 WebGL(Scattergl)로 렌더링
+    WEBGL_MIN_POINTS = 1000
+    # 지표 선에 그릴 최대 포인트 수 (초과 시 LTTB 다운샘플링, 화면 가로 픽셀 수 수준)
+    MAX_LINE_POINTS = 2000
+    
     # 라인 스타일
     LINE_STYLES = {
         'ma': dict(width=1),
@@ -37,95 +85,113 @@ class ChartStyles:
         'indicator': dict(width=2)
     }
     
+    # 캔들스틱 스타일 (읽기 전용, 호출마다 새 dict를 만들지 않음)
+    CANDLESTICK_STYLE = MappingProxyType({
+        'increasing_line_color': COLORS['up'],
+        'decreasing_line_color': COLORS['down']
+    })
+    
+    # 차트 타입별 서브플롯 레이아웃 (읽기 전용)
+    SUBPLOT_LAYOUTS = MappingProxyType({
+        'candlestick': MappingProxyType({
+            'rows': 4,
+            'cols': 1,
+            'shared_xaxes': True,
+            'vertical_spacing': 0.05,
+            'subplot_titles': ('가격 차트', '거래량', 'RSI', 'MACD'),
+            'row_heights': [0.5, 0.15, 0.15, 0.2]
+        }),
+        'technical': MappingProxyType({
+            'rows': 2,
+            'cols': 2,
+            'subplot_titles': ('RSI', 'MACD', '볼린저 밴드', '스토캐스틱'),
+            # make_subplots는 specs로 list/dict만 허용
+            'specs': [[{"secondary_y": False}, {"secondary_y": False}],
+                      [{"secondary_y": False}, {"secondary_y": False}]]
+        })
+    })
+    
     @staticmethod
-    def get_candlestick_style() -> Dict[str, Any]:
+    def get_candlestick_style() -> Mapping[str, Any]:
         """캔들스틱 차트 스타일을 반환합니다."""
-        return {
-            'increasing_line_color': ChartStyles.COLORS['up'],
-            'decreasing_line_color': ChartStyles.COLORS['down']
-        }
+        return ChartStyles.CANDLESTICK_STYLE
     
     @staticmethod
     def get_volume_colors(df):
         """거래량 바 차트의 색상을 반환합니다."""
-        return [
-            ChartStyles.COLORS['volume_up'] if close >= open else ChartStyles.COLORS['volume_down']
-            for close, open in zip(df['Close'], df['Open'])
-        ]
+        idx = up_down_index(df['Close'].to_numpy(dtype=float), df['Open'].to_numpy(dtype=float))
+        return ChartStyles.VOLUME_COLOR_ARR[idx].tolist()
     
     @staticmethod
-    def get_subplot_layout(chart_type: str) -> Dict[str, Any]:
+    def get_subplot_layout(chart_type: str) -> Mapping[str, Any]:
         """차트 타입에 따른 서브플롯 레이아웃을 반환합니다."""
-        layouts = {
-            'candlestick': {
-                'rows': 4,
-                'cols': 1,
-                'shared_xaxes': True,
-                'vertical_spacing': 0.05,
-                'subplot_titles': ('가격 차트', '거래량', 'RSI', 'MACD'),
-                'row_heights': [0.5, 0.15, 0.15, 0.2]
-            },
-            'technical': {
-                'rows': 2,
-                'cols': 2,
-                'subplot_titles': ('RSI', 'MACD', '볼린저 밴드', '스토캐스틱'),
-                'specs': [[{"secondary_y": False}, {"secondary_y": False}],
-                         [{"secondary_y": False}, {"secondary_y": False}]]
-            }
-        }
-        return layouts.get(chart_type, {})
+        return ChartStyles.SUBPLOT_LAYOUTS.get(chart_type, MappingProxyType({}))
     
     def apply_chart_layout(self, fig, ticker: str, chart_type: str = 'candlestick'):
-        """차트에 레이아웃과 스타일을 적용합니다."""
-        titles = {
-            'candlestick': f'{ticker} 주식 차트 분석',
-            'price': f'{ticker} 가격 및 거래량',
-            'technical': f'{ticker} 기술적 지표 분석'
-        }
-        
-        heights = {
-            'candlestick': 800,
-            'technical': 600,
-            'price': 500
-        }
-        
-        # 가격 차트의 경우 특별 설정
-        if chart_type == 'price':
-            currency_symbol = "￦" if ticker.endswith('.KS') else "$"
-            fig.update_layout(
-                title=titles.get(chart_type, f'{ticker} 차트'),
-                xaxis_title='날짜',
-                yaxis_title=f'가격 ({currency_symbol})',
-                yaxis2=dict(
-                    title='거래량',
-                    overlaying='y',
-                    side='right'
-                ),
-                height=heights.get(chart_type, 600),
-                xaxis=dict(tickformat='%Y.%m.%d'),
-                **self.LAYOUT_DEFAULTS
-            )
-        else:
-            fig.update_layout(
-                title=titles.get(chart_type, f'{ticker} 차트'),
-                height=heights.get(chart_type, 600),
-                **self.LAYOUT_DEFAULTS
-            )
-            
-            # X축 날짜 형식 설정
-            if chart_type == 'candlestick':
-                for i in range(1, 5):
-                    fig.update_xaxes(tickformat='%Y.%m.%d', row=i, col=1)
-                    
-                # Y축 레이블
-                currency_symbol = "￦" if ticker.endswith('.KS') else "$"
-                fig.update_yaxes(title_text=f"가격 ({currency_symbol})", row=1, col=1)
-                fig.update_yaxes(title_text="거래량", row=2, col=1)
-                fig.update_yaxes(title_text="RSI", row=3, col=1)
-                fig.update_yaxes(title_text="MACD", row=4, col=1)
-            elif chart_type == 'technical':
-                for i in range(1, 3):
-                    for j in range(1, 3):
-                        fig.update_xaxes(tickformat='%Y.%m.%d', row=i, col=j)
-        
+        """차트에 레이아웃과 스타일을 적용합니다 (차트 타입별 레이아웃 함수로 분기)."""
+        _LAYOUT_BUILDERS.get(chart_type, _build_default_layout)(fig, ticker)
         return fig
+
+
+def _build_default_layout(fig, ticker: str):
+    """알 수 없는 차트 타입의 기본 레이아웃"""
+    fig.update_layout(
+        title=f'{ticker} 차트',
+        height=600,
+        **ChartStyles.LAYOUT_DEFAULTS
+    )
+
+
+def _build_price_layout(fig, ticker: str):
+    """가격 차트 레이아웃 (거래량 보조 축 포함)"""
+    currency_symbol = ChartFormatters.get_currency_symbol(ticker)
+    fig.update_layout(
+        title=f'{ticker} 가격 및 거래량',
+        xaxis_title='날짜',
+        yaxis_title=f'가격 ({currency_symbol})',
+        yaxis2=dict(
+            title='거래량',
+            overlaying='y',
+            side='right'
+        ),
+        height=500,
+        xaxis=dict(tickformat='%Y.%m.%d'),
+        **ChartStyles.LAYOUT_DEFAULTS
+    )
+
+
+def _build_candlestick_layout(fig, ticker: str):
+    """캔들스틱(가격/거래량/RSI/MACD) 차트 레이아웃"""
+    fig.update_layout(
+        title=f'{ticker} 주식 차트 분석',
+        height=800,
+        **ChartStyles.LAYOUT_DEFAULTS
+    )
+    
+    # X축 날짜 형식 설정 (모든 서브플롯의 x축을 한 번에 갱신)
+    fig.update_xaxes(tickformat='%Y.%m.%d')
+    
+    # Y축 레이블
+    currency_symbol = ChartFormatters.get_currency_symbol(ticker)
+    fig.update_yaxes(title_text=f"가격 ({currency_symbol})", row=1, col=1)
+    fig.update_yaxes(title_text="거래량", row=2, col=1)
+    fig.update_yaxes(title_text="RSI", row=3, col=1)
+    fig.update_yaxes(title_text="MACD", row=4, col=1)
+
+
+def _build_technical_layout(fig, ticker: str):
+    """기술적 지표(2x2) 차트 레이아웃"""
+    fig.update_layout(
+        title=f'{ticker} 기술적 지표 분석',
+        height=600,
+        **ChartStyles.LAYOUT_DEFAULTS
+    )
+    fig.update_xaxes(tickformat='%Y.%m.%d')
+
+
+# 차트 타입별 레이아웃 함수
+_LAYOUT_BUILDERS = {
+    'price': _build_price_layout,
+    'candlestick': _build_candlestick_layout,
+    'technical': _build_technical_layout,
+}
@@ -1,6 +1,6 @@
 from .fetcher import StockDataFetcher
 from .processor import DataProcessor
 from .cache import DataCache
-from .point_in_time_financials import PointInTimeFinancialData, point_in_time_financials
+from .point_in_time_financials import PITFinancials, PointInTimeFinancialData, point_in_time_financials
 
-__all__ = ['StockDataFetcher', 'DataProcessor', 'DataCache', 'PointInTimeFinancialData', 'point_in_time_financials']
+__all__ = ['StockDataFetcher', 'DataProcessor', 'DataCache', 'PITFinancials', 'PointInTimeFinancialData', 'point_in_time_financials']
@@ -0,0 +1,145 @@
+"""
+데이터 전처리용 NumPy 커널
+
+numba가 설치되어 있으면 JIT 컴파일되어 실행되고, 없으면 동일한 코드가
+순수 Python으로 동작합니다.
+"""
+
+import numpy as np
+
+from ..utils.jit import njit
+
+
+@njit(cache=True)
+def _quantile_linear(values, q):
+    """pandas Series.quantile(q) (linear 보간)과 동일한 값을 반환합니다.
+
+    정렬 대신 np.partition 선택(O(n))을 사용합니다.
+    values는 NaN이 없고 비어 있지 않아야 합니다.
+    """
+    n = values.size
+    pos = q * (n - 1)
+    k = int(np.floor(pos))
+    part = np.partition(values, k)
+    lo = part[k]
+    if k + 1 >= n:
+        return np.float64(lo)
+    hi = part[k + 1:].min()
+    # numpy와 같게 두 값의 차이는 입력 dtype으로, 보간은 float64로 계산
+    diff = np.float64(hi - lo)
+    a = np.float64(lo)
+    b = np.float64(hi)
+    t = pos - k
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
+
+
+@njit(cache=True)
+def iqr_clip(x, out, factor):
+    """IQR 기준(Q1 - factor*IQR, Q3 + factor*IQR) 밖의 값을 경계값으로 바꿔 out(float64)에 쓰고
+    바뀐 개수를 반환합니다.
+
+    pandas의 quantile(0.25/0.75) + clip과 같은 결과를 냅니다. NaN은 분위수 계산에서
+    제외되고 그대로 유지되며, 유효값이 없으면 값을 그대로 복사합니다.
+    """
+    valid = x[~np.isnan(x)]
+    lower = -np.inf
+    upper = np.inf
+    if valid.size > 0:
+        q1 = _quantile_linear(valid, 0.25)
+        q3 = _quantile_linear(valid, 0.75)
+        iqr = q3 - q1
+        lower = q1 - factor * iqr
+        upper = q3 + factor * iqr
+    clipped = 0
+    for i in range(x.size):
+        v = np.float64(x[i])
+        if v < lower:
+            v = lower
+            clipped += 1
+        elif v > upper:
+            v = upper
+            clipped += 1
+        out[i] = v
+    return clipped
+
+
+@njit(cache=True, error_model='numpy')
+def returns_and_volatility(close, window, annualization):
+    """일간 수익률, 누적 수익률, 연율화 변동성을 한 번의 순회로 계산합니다.
+
+    pandas의 pct_change(), (1 + r).cumprod() - 1, r.rolling(window).std() * annualization과
+    같은 결과를 냅니다. 수익률 두 컬럼은 입력 dtype으로, 변동성은 float64로 반환합니다.
+    변동성은 pandas roll_var와 같은 Kahan 보정 Welford 갱신으로 구간을 밀며 계산합니다.
+    """
+    n = close.size
+    daily = np.empty(n, close.dtype)
+    cumulative = np.empty(n, close.dtype)
+    volatility = np.empty(n, np.float64)
+    # 연산마다 입력 dtype으로 반올림하기 위한 버퍼 (float32 입력에서 pandas와 같은 값 유지)
+    step = np.empty(1, close.dtype)
+    prod = np.ones(1, close.dtype)
+
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    same_count = 0
+    prev_value = np.nan
+    for i in range(n):
+        # 일간 수익률 (결측값은 채우지 않음)
+        if i == 0:
+            daily[i] = np.nan
+        else:
+            step[0] = close[i] / close[i - 1]
+            daily[i] = step[0] - 1
+
+        # 누적 수익률 (NaN 위치는 건너뛰고 곱을 이어감)
+        r = daily[i]
+        if np.isnan(r):
+            cumulative[i] = np.nan
+        else:
+            step[0] = r + 1
+            prod[0] = prod[0] * step[0]
+            cumulative[i] = prod[0] - 1
+
+        # 구간에서 빠지는 값 제거
+        if i >= window:
+            old = np.float64(daily[i - window])
+            if np.isfinite(old):
+                nobs -= 1
+                if nobs:
+                    prev_mean = mean - comp_remove
+                    y = old - comp_remove
+                    t = y - mean
+                    comp_remove = t + mean - y
+                    mean = mean - t / nobs
+                    ssqdm = ssqdm - (old - prev_mean) * (old - mean)
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+
+        # 새 값 추가 (pandas rolling과 같이 inf는 결측으로 취급)
+        val = np.float64(r)
+        if np.isfinite(val):
+            nobs += 1
+            if val == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = val
+            prev_mean = mean - comp_add
+            y = val - comp_add
+            t = y - mean
+            comp_add = t + mean - y
+            mean = mean + t / nobs
+            ssqdm = ssqdm + (val - prev_mean) * (val - mean)
+
+        if nobs >= window and nobs > 1:
+            var = 0.0 if same_count >= nobs else ssqdm / (nobs - 1)
+            volatility[i] = (np.sqrt(var) if not var < 0 else 0.0) * annualization
+        else:
+            volatility[i] = np.nan
+    return daily, cumulative, volatility
@@ -2,23 +2,27 @@
 데이터 캐싱을 위한 모듈
 """
 
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 import pandas as pd
-from datetime import datetime, timedelta
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 class DataCache:
-    def __init__(self, max_age: int = 300):  # 기본 5분
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.max_age = max_age
+    def __init__(self, max_age: int = 300, max_size: int = 128):  # 기본 5분, 128개
+        # LRU 순서 유지 (가장 최근에 사용한 항목이 끝)
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_age = float(max_age)
+        self.max_size = max_size
     
     def get(self, key: str) -> Optional[Any]:
         """캐시된 데이터를 가져옵니다."""
         if key in self.cache:
             entry = self.cache[key]
-            if (datetime.now() - entry['timestamp']).total_seconds() < self.max_age:
+            if time.monotonic() - entry['timestamp'] < self.max_age:
+                self.cache.move_to_end(key)
                 return entry['data']
             else:
                 # 캐시 만료
@@ -29,8 +33,12 @@ class DataCache:
         """데이터를 캐시에 저장합니다."""
         self.cache[key] = {
             'data': value,
-            'timestamp': datetime.now()
+            'timestamp': time.monotonic()  # 시스템 시계 변경에 영향받지 않는 단조 시간(초)
         }
+        self.cache.move_to_end(key)
+        # 최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
         logger.debug(f"데이터가 캐시에 저장되었습니다: {key}")
     
     def clear(self, key: Optional[str] = None):
@@ -47,13 +55,15 @@ class DataCache:
         """캐시 항목이 유효한지 확인합니다."""
         if key in self.cache:
             entry = self.cache[key]
-            return (datetime.now() - entry['timestamp']).total_seconds() < self.max_age
+            return time.monotonic() - entry['timestamp'] < self.max_age
         return False
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계를 반환합니다."""
         total_items = len(self.cache)
-        valid_items = sum(1 for k in self.cache.keys() if self.is_valid(k))
+        # 현재 시각은 한 번만 읽고 항목을 한 번만 순회
+        now = time.monotonic()
+        valid_items = sum(1 for entry in self.cache.values() if now - entry['timestamp'] < self.max_age)
         
         return {
             'total_items': total_items,
@@ -2,18 +2,157 @@
 주식 데이터 수집을 위한 모듈
 """
 
-import yfinance as yf
+import asyncio
+import functools
+import importlib
+import os
+from collections import OrderedDict
+import re
+import time
+import weakref
+from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from datetime import datetime, timedelta
 import logging
 from ..utils.exceptions import DataNotFoundError, NetworkError
 
 logger = logging.getLogger(__name__)
 
+# 디스크 캐시 권장 위치와 유효 시간(초) - 디스크 캐시는 cache_dir을 지정했을 때만 사용
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'stock-analysis'
+DISK_CACHE_MAX_AGE = 24 * 60 * 60
+
+# 메모리 캐시에 보관할 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+_MEMORY_CACHE_MAX_SIZE = 128
+
+# 동시에 실행할 수 있는 yfinance 요청 수
+_YF_MAX_CONCURRENCY = 8
+# 이벤트 루프별 세마포어 (Semaphore는 처음 사용한 루프에 묶이므로 루프마다 따로 생성)
+_yf_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+@functools.cache
+def get_yfinance():
+    """yfinance 모듈을 처음 사용할 때 불러옵니다 (requests/lxml 등 import 비용을 실제 조회 시점으로 미룸)"""
+    return importlib.import_module('yfinance')
+
+
+def get_yfinance_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프에서 yfinance 동시 요청 수를 제한하는 세마포어를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    sem = _yf_semaphores.get(loop)
+    if sem is None:
+        sem = _yf_semaphores[loop] = asyncio.Semaphore(_YF_MAX_CONCURRENCY)
+    return sem
+
+
+def _downcast_ohlcv(hist: pd.DataFrame) -> pd.DataFrame:
+    """OHLC 가격은 float32로, 거래량은 값 범위가 허용되면 int32로 변환합니다.
+
+    캐시에 보관하는 DataFrame의 메모리와 이후 지표 계산에서 읽는 바이트 수를 줄입니다.
+    """
+    dtypes = {col: np.float32 for col in ('Open', 'High', 'Low', 'Close') if col in hist.columns}
+    if 'Volume' in hist.columns:
+        volume = hist['Volume'].to_numpy()
+        # NaN이 있거나 int32 범위를 넘으면 원래 타입 유지
+        if len(volume) and not np.isnan(volume.astype(float)).any() \
+                and volume.min() >= 0 and volume.max() <= np.iinfo(np.int32).max:
+            dtypes['Volume'] = np.int32
+    return hist.astype(dtypes) if dtypes else hist
+
+
 class StockDataFetcher:
-    def __init__(self):
-        self.cache = {}  # 간단한 메모리 캐시
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_cache_size: int = _MEMORY_CACHE_MAX_SIZE):
+        """디스크 캐시는 cache_dir을 지정한 경우에만 사용합니다 (기본값 None: 사용 안 함).
+
+        예: StockDataFetcher(cache_dir=DEFAULT_CACHE_DIR). 디스크 캐시를 켜면 파일이
+        DISK_CACHE_MAX_AGE(24시간) 동안 재사용되므로, 그 사이에는 최대 하루 전에 받은
+        데이터가 반환될 수 있습니다.
+        """
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()  # LRU 메모리 캐시
+        self.max_cache_size = max_cache_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._inflight: Dict[str, asyncio.Task] = {}  # 진행 중인 조회 (캐시 키 -> Task)
+    
+    async def _fetch_once(self, cache_key: str, fetch: Callable[[], Any]) -> Any:
+        """yfinance 호출을 스레드에서 실행합니다.
+
+        같은 키로 동시에 들어온 요청은 진행 중인 하나의 호출 결과를 함께 기다립니다.
+        """
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._run_in_thread(lambda: self._load_or_fetch(cache_key, fetch))
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # 한 호출자가 취소되어도 다른 대기자의 조회는 계속되도록 shield
+        return await asyncio.shield(task)
+    
+    @staticmethod
+    async def _run_in_thread(fetch: Callable[[], Any]) -> Any:
+        """블로킹 네트워크 호출을 스레드에서 실행하여 이벤트 루프를 막지 않습니다."""
+        async with get_yfinance_semaphore():
+            return await asyncio.to_thread(fetch)
+    
+    def _cache_get(self, cache_key: str) -> Any:
+        """메모리 캐시 조회 (적중 시 최근 사용 항목으로 이동)"""
+        value = self.cache.get(cache_key)
+        if value is not None:
+            self.cache.move_to_end(cache_key)
+        return value
+    
+    def _cache_set(self, cache_key: str, value: Any):
+        """메모리 캐시에 저장하고 최대 크기를 넘으면 가장 오래된 항목을 제거합니다."""
+        self.cache[cache_key] = value
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.max_cache_size:
+            self.cache.popitem(last=False)
+    
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        """파일 이름에 쓸 수 없는 문자를 '_'로 바꿉니다."""
+        return re.sub(r'[^0-9A-Za-z._^=-]', '_', name)
+    
+    def _disk_path(self, cache_key: str) -> Path:
+        """캐시 키에 대한 디스크 캐시 파일 경로
+
+        키마다 파일 하나를 덮어쓰며, 만료 여부는 파일 수정 시각으로 판단합니다.
+        """
+        return self.cache_dir / f"{self._safe_name(cache_key)}.pkl"
+    
+    def _load_or_fetch(self, cache_key: str, fetch: Callable[[], Any]) -> Any:
+        """디스크 캐시에 유효 시간 내에 받은 데이터가 있으면 읽고, 없으면 조회 후 저장합니다.
+
+        스레드에서 실행되므로 파일 입출력도 이벤트 루프를 막지 않습니다.
+        """
+        if self.cache_dir is None:
+            return fetch()
+        
+        path = self._disk_path(cache_key)
+        try:
+            if path.exists() and time.time() - path.stat().st_mtime < DISK_CACHE_MAX_AGE:
+                logger.debug(f"디스크 캐시를 사용합니다: {path}")
+                return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"디스크 캐시 읽기 실패 ({path}): {e}")
+        
+        data = fetch()
+        
+        # 빈 결과는 저장하지 않음 (호출 측에서 DataNotFoundError 처리)
+        if data is not None and len(data) > 0:
+            tmp_path = path.with_name(path.name + '.tmp')
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                pd.to_pickle(data, tmp_path)
+                os.replace(tmp_path, path)  # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 원자적 교체
+            except OSError as e:
+                logger.warning(f"디스크 캐시 저장 실패 ({path}): {e}")
+                tmp_path.unlink(missing_ok=True)  # 쓰다 만 임시 파일을 남기지 않음
+        return data
     
     async def get_stock_data(self, ticker: str, period: str = "1y") -> pd.DataFrame:
         """주식 데이터를 가져옵니다."""
@@ -21,19 +160,20 @@ class StockDataFetcher:
             cache_key = f"{ticker}_{period}"
             
             # 캐시된 데이터가 있는지 확인
-            cached_data = self.cache.get(cache_key)
+            cached_data = self._cache_get(cache_key)
             if cached_data is not None:
                 logger.info(f"캐시된 데이터를 사용합니다: {ticker}")
                 return cached_data
             
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
+            hist = await self._fetch_once(
+                cache_key, lambda: _downcast_ohlcv(get_yfinance().Ticker(ticker).history(period=period))
+            )
             
             if hist.empty:
                 raise DataNotFoundError(f"티커 {ticker}에 대한 데이터를 찾을 수 없습니다")
             
             # 데이터 캐시에 저장
-            self.cache[cache_key] = hist
+            self._cache_set(cache_key, hist)
             
             return hist
             
@@ -48,19 +188,18 @@ class StockDataFetcher:
             cache_key = f"{ticker}_info"
             
             # 캐시된 데이터가 있는지 확인
-            cached_info = self.cache.get(cache_key)
+            cached_info = self._cache_get(cache_key)
             if cached_info is not None:
                 logger.info(f"캐시된 정보를 사용합니다: {ticker}")
                 return cached_info
             
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = await self._fetch_once(cache_key, lambda: get_yfinance().Ticker(ticker).info)
             
             if not info:
                 raise DataNotFoundError(f"티커 {ticker}에 대한 정보를 찾을 수 없습니다")
             
             # 데이터 캐시에 저장
-            self.cache[cache_key] = info
+            self._cache_set(cache_key, info)
             
             return info
             
@@ -76,8 +215,23 @@ class StockDataFetcher:
             keys_to_delete = [k for k in self.cache.keys() if k.startswith(f"{ticker}_")]
             for key in keys_to_delete:
                 del self.cache[key]
+            safe_ticker = self._safe_name(ticker)
+            self._clear_disk_cache(f"{safe_ticker}_*.pkl")
+            self._clear_disk_cache(f"{safe_ticker}_*.pkl.tmp")
             logger.info(f"{ticker} 캐시가 초기화되었습니다.")
         else:
             # 전체 캐시 삭제
             self.cache.clear()
+            self._clear_disk_cache("*.pkl")
+            self._clear_disk_cache("*.pkl.tmp")
             logger.info("전체 캐시가 초기화되었습니다.")
+    
+    def _clear_disk_cache(self, pattern: str):
+        """패턴에 맞는 디스크 캐시 파일을 삭제합니다."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob(pattern):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"디스크 캐시 삭제 실패 ({path}): {e}")
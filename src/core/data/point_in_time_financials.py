@@ -5,22 +5,144 @@ Point-in-Time 재무데이터 수집 및 관리
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
+import os
+import re
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 import asyncio
 import logging
+from dataclasses import dataclass
+from .fetcher import DEFAULT_CACHE_DIR, DISK_CACHE_MAX_AGE, get_yfinance, get_yfinance_semaphore
 
 logger = logging.getLogger(__name__)
 
+# get_financial_data_at_date가 반환하는 재무지표 (순서 유지)
+METRIC_COLS = (
+    'pe_ratio', 'pb_ratio', 'ps_ratio', 'roe', 'roa', 'debt_to_equity',
+    'current_ratio', 'quick_ratio', 'profit_margin', 'operating_margin',
+    'revenue_growth', 'earnings_growth', 'dividend_yield',
+    'book_value_per_share', 'earnings_per_share', 'free_cash_flow_per_share',
+)
+
+
+@dataclass(slots=True, frozen=True)
+class PITFinancials:
+    """특정 발표일 기준 재무지표 (계산되지 않은 지표는 None, 값이 없는 분기는 NaN)"""
+    report_date: pd.Timestamp
+    pe_ratio: Optional[float] = None
+    pb_ratio: Optional[float] = None
+    ps_ratio: Optional[float] = None
+    roe: Optional[float] = None
+    roa: Optional[float] = None
+    debt_to_equity: Optional[float] = None
+    current_ratio: Optional[float] = None
+    quick_ratio: Optional[float] = None
+    profit_margin: Optional[float] = None
+    operating_margin: Optional[float] = None
+    revenue_growth: Optional[float] = None
+    earnings_growth: Optional[float] = None
+    dividend_yield: Optional[float] = None
+    book_value_per_share: Optional[float] = None
+    earnings_per_share: Optional[float] = None
+    free_cash_flow_per_share: Optional[float] = None
+
+
+def _statement_rows(statement: Optional[pd.DataFrame], labels: List[str], quarters: pd.Index):
+    """재무제표에서 여러 항목을 한 번의 reindex로 읽어 (항목 x 분기) float 배열과,
+    값이 있고 0이 아닌 위치 마스크를 반환 (없는 항목/분기는 NaN, False)"""
+    shape = (len(labels), len(quarters))
+    if statement is None:
+        return np.full(shape, np.nan), np.zeros(shape, dtype=bool)
+    values = statement.reindex(index=labels, columns=quarters).to_numpy(dtype=np.float64)
+    present = pd.Index(labels).isin(statement.index)[:, None] & quarters.isin(statement.columns)[None, :]
+    return values, present & (values != 0)
+
+
+def _masked_divide(numerator, denominator, mask: np.ndarray):
+    """mask인 위치만 나눗셈을 수행하고 나머지는 NaN으로 채운 (값 배열, mask) 반환"""
+    out = np.full(mask.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=mask)
+    return out, mask
+
+
+def _shift_back(values: np.ndarray, mask: np.ndarray, periods: int):
+    """periods만큼 과거(뒤쪽 컬럼) 값을 현재 위치로 당긴 배열과 마스크 (범위 밖은 NaN/False)"""
+    shifted = np.full(values.shape, np.nan)
+    shifted_mask = np.zeros(mask.shape, dtype=bool)
+    shifted[:-periods] = values[periods:]
+    shifted_mask[:-periods] = mask[periods:]
+    return shifted, shifted_mask
+
+
+def _trailing_dividends(stock) -> Optional[pd.Series]:
+    """최근 1년간 지급된 주당 배당금 (조회 실패 시 None)
+
+    get_dividends(period=...)를 지원하지 않는 yfinance 버전에서는 전체 배당 이력에서
+    최근 1년 구간만 잘라 사용합니다.
+    """
+    try:
+        return stock.get_dividends(period='1y')
+    except TypeError:  # period 인자를 지원하지 않는 버전
+        pass
+    except Exception as e:
+        logger.debug("배당 이력 조회 실패: %s", e)
+        return None
+    
+    try:
+        dividends = stock.dividends
+    except Exception as e:
+        logger.debug("배당 이력 조회 실패: %s", e)
+        return None
+    if dividends is None or dividends.empty:
+        return dividends
+    since = pd.Timestamp.now(tz=dividends.index.tz) - pd.DateOffset(years=1)
+    return dividends[dividends.index >= since]
+
+
+def _quote_fields(stock) -> Dict[str, Any]:
+    """재무비율 계산에 필요한 시세 항목을 info와 같은 키로 반환
+
+    무거운 info 대신 fast_info(1년 시세 차트 한 번)에서 현재가/발행주식수/시가총액을 읽습니다.
+    fast_info에서 현재가나 발행주식수를 얻지 못한 경우에만 info를 조회합니다.
+    
+    배당수익률은 두 경로 모두 trailingAnnualDividendYield 키에 최근 12개월 주당 배당금 합계 /
+    현재가를 소수(0.004 = 0.4%)로 담습니다. info의 dividendYield는 yfinance 버전에 따라
+    퍼센트 단위이고 정의도 달라(예상 배당 기준) 사용하지 않습니다.
+    """
+    try:
+        fast_info = stock.fast_info
+        current_price = fast_info.get('lastPrice')
+        shares_outstanding = fast_info.get('shares')
+    except Exception as e:
+        logger.debug("fast_info 조회 실패, info로 대체: %s", e)
+        return stock.info
+    if not current_price or not shares_outstanding:
+        return stock.info
+    
+    dividends = _trailing_dividends(stock)
+    dividend_total = float(dividends.sum()) if dividends is not None and len(dividends) else 0.0
+    return {
+        'currentPrice': current_price,
+        'sharesOutstanding': shares_outstanding,
+        'marketCap': fast_info.get('marketCap'),
+        'trailingAnnualDividendYield': dividend_total / current_price if dividend_total else None,
+    }
+
 
 class PointInTimeFinancialData:
     """Point-in-Time 재무데이터 관리 클래스"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR / 'financials'):
+        """cache_dir이 None이면 디스크 캐시를 사용하지 않습니다."""
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self._cache = {}  # ticker -> DataFrame 캐시
+        self._report_dates = {}  # ticker -> 정렬된 발표일 배열 (datetime64[ns], 이진 탐색용)
+        self._rows = {}  # ticker -> 발표일 순서의 PITFinancials 리스트 (조회 시 위치로 바로 반환)
+        self._inflight: Dict[str, asyncio.Task] = {}  # 진행 중인 수집 (ticker -> Task)
         
-    async def get_financial_data_at_date(self, ticker: str, target_date: datetime) -> Optional[Dict[str, Any]]:
+    async def get_financial_data_at_date(self, ticker: str, target_date: datetime) -> Optional[PITFinancials]:
         """
         특정 날짜에 실제로 알 수 있었던 재무정보를 반환
         
@@ -29,113 +151,130 @@ class PointInTimeFinancialData:
             target_date: 기준 날짜
             
         Returns:
-            해당 시점에 알 수 있었던 재무정보 딕셔너리
+            해당 시점에 알 수 있었던 재무정보 (PITFinancials)
         """
         try:
-            # 캐시된 데이터가 있으면 사용
-            if ticker in self._cache:
-                financial_history = self._cache[ticker]
-            else:
-                # 재무데이터 수집 및 캐시
-                financial_history = await self._fetch_financial_history(ticker)
-                self._cache[ticker] = financial_history
+            # 캐시에 없으면 재무데이터 수집 및 캐시
+            if ticker not in self._cache:
+                await self._load_history(ticker)
+            financial_history = self._cache[ticker]
             
             if financial_history is None or financial_history.empty:
                 return None
             
-            # target_date 이전에 발표된 가장 최신 데이터 찾기
-            available_data = financial_history[financial_history.index <= target_date]
+            if target_date.tzinfo is not None:
+                raise TypeError("발표일(tz-naive)과 tz-aware 날짜는 비교할 수 없습니다")
             
-            if available_data.empty:
-                return None
+            # target_date 이전에 발표된 가장 최신 데이터 위치 (정렬된 발표일에서 이진 탐색)
+            pos = np.searchsorted(
+                self._report_dates[ticker], np.datetime64(target_date, 'ns'), side='right'
+            ) - 1
             
-            # 가장 최신 데이터 반환
-            latest_data = available_data.iloc[-1]
+            if pos < 0:
+                return None
             
-            return {
-                'report_date': latest_data.name,
-                'pe_ratio': latest_data.get('pe_ratio'),
-                'pb_ratio': latest_data.get('pb_ratio'),
-                'ps_ratio': latest_data.get('ps_ratio'),
-                'roe': latest_data.get('roe'),
-                'roa': latest_data.get('roa'),
-                'debt_to_equity': latest_data.get('debt_to_equity'),
-                'current_ratio': latest_data.get('current_ratio'),
-                'quick_ratio': latest_data.get('quick_ratio'),
-                'profit_margin': latest_data.get('profit_margin'),
-                'operating_margin': latest_data.get('operating_margin'),
-                'revenue_growth': latest_data.get('revenue_growth'),
-                'earnings_growth': latest_data.get('earnings_growth'),
-                'dividend_yield': latest_data.get('dividend_yield'),
-                'book_value_per_share': latest_data.get('book_value_per_share'),
-                'earnings_per_share': latest_data.get('earnings_per_share'),
-                'free_cash_flow_per_share': latest_data.get('free_cash_flow_per_share')
-            }
+            # 가장 최신 데이터 반환 (저장 시 미리 만든 행을 위치로 바로 읽음)
+            return self._rows[ticker][pos]
             
         except Exception as e:
             logger.error(f"재무데이터 조회 중 오류 ({ticker}, {target_date}): {e}")
             return None
     
+    async def prefetch(self, tickers: List[str]):
+        """
+        여러 종목의 재무데이터 이력을 동시에 수집하여 캐시에 저장
+        백테스트 시작 전에 호출하면 이후 get_financial_data_at_date는 캐시 조회만 수행
+        
+        Args:
+            tickers: 종목 코드 리스트
+        """
+        pending = list(dict.fromkeys(t for t in tickers if t not in self._cache))
+        if not pending:
+            return
+        
+        await asyncio.gather(*(self._load_history(t) for t in pending))
+        
+        logger.info(f"재무데이터 일괄 수집 완료: {len(pending)}개 종목")
+    
+    async def _load_history(self, ticker: str):
+        """재무데이터 이력을 수집하여 캐시에 저장
+        
+        같은 종목으로 동시에 들어온 요청은 진행 중인 하나의 수집 결과를 함께 기다립니다.
+        """
+        task = self._inflight.get(ticker)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(ticker))
+            self._inflight[ticker] = task
+            task.add_done_callback(lambda _: self._inflight.pop(ticker, None))
+        # 한 호출자가 취소되어도 다른 대기자의 수집은 계속되도록 shield
+        await asyncio.shield(task)
+    
+    async def _fetch_and_store(self, ticker: str):
+        """재무데이터 이력을 수집한 뒤 캐시에 저장"""
+        self._store(ticker, await self._fetch_financial_history(ticker))
+    
+    def _store(self, ticker: str, history: Optional[pd.DataFrame]):
+        """수집한 재무데이터 이력과 조회용 발표일 배열/행 목록을 캐시에 저장"""
+        self._cache[ticker] = history
+        if history is not None:
+            self._report_dates[ticker] = history.index.values.astype('datetime64[ns]')
+            cols = [col for col in METRIC_COLS if col in history.columns]
+            self._rows[ticker] = [
+                PITFinancials(report_date, **dict(zip(cols, values)))
+                for report_date, values in zip(history.index, history[cols].to_numpy().tolist())
+            ]
+    
+    @staticmethod
+    def _download_statements(ticker: str):
+        """yfinance에서 시세 정보와 분기 재무제표를 조회 (블로킹, 스레드에서 실행)"""
+        stock = get_yfinance().Ticker(ticker)
+        quarterly_financials = stock.quarterly_financials
+        # 재무제표가 없는 종목(ETF, 지수 등)은 시세 정보를 조회하지 않음
+        quote = _quote_fields(stock) if quarterly_financials is not None and not quarterly_financials.empty else {}
+        return (
+            quote,
+            quarterly_financials,
+            stock.quarterly_balance_sheet,
+            stock.quarterly_cashflow,
+        )
+    
     async def _fetch_financial_history(self, ticker: str) -> Optional[pd.DataFrame]:
         """
         종목의 과거 재무데이터 이력을 수집
         분기별 발표 일정을 고려하여 Point-in-Time 데이터 생성
         """
         try:
-            stock = yf.Ticker(ticker)
+            # 디스크 캐시에 최근 수집한 이력이 있으면 사용
+            df = await asyncio.to_thread(self._load_disk_cache, ticker)
+            if df is not None:
+                return df
             
-            # 기본 정보 및 재무제표 수집
-            info = stock.info
-            quarterly_financials = stock.quarterly_financials
-            quarterly_balance_sheet = stock.quarterly_balance_sheet
-            quarterly_cashflow = stock.quarterly_cashflow
+            # 시세 정보 및 재무제표 수집 (네트워크 호출은 스레드에서 실행하여 여러 종목을 동시에 조회)
+            async with get_yfinance_semaphore():
+                quote, quarterly_financials, quarterly_balance_sheet, quarterly_cashflow = \
+                    await asyncio.to_thread(self._download_statements, ticker)
             
             if quarterly_financials is None or quarterly_financials.empty:
                 logger.warning(f"재무데이터를 찾을 수 없음: {ticker}")
                 return None
             
-            # 분기별 데이터를 시계열로 정리
-            financial_timeline = []
-            
-            # 분기별 컬럼 순회 (최신부터 과거 순서)
-            for quarter_date in quarterly_financials.columns:
-                try:
-                    # 분기 종료일 기준으로 발표일 추정
-                    report_date = self._estimate_report_date(quarter_date)
-                    
-                    # 해당 분기의 재무지표 수집
-                    financial_metrics = await self._extract_financial_metrics(
-                        stock, info, quarterly_financials, quarterly_balance_sheet, 
-                        quarterly_cashflow, quarter_date
-                    )
-                    
-                    if financial_metrics:
-                        financial_metrics['quarter_end'] = quarter_date
-                        financial_timeline.append({
-                            'report_date': report_date,
-                            'data': financial_metrics
-                        })
-                        
-                except Exception as e:
-                    logger.warning(f"분기 데이터 처리 중 오류 ({ticker}, {quarter_date}): {e}")
-                    continue
+            # 전체 분기의 재무지표를 한 번에 계산 (분기 종료일 인덱스, 최신부터 과거 순서)
+            metrics = self._extract_financial_metrics(
+                quote, quarterly_financials, quarterly_balance_sheet, quarterly_cashflow
+            )
             
-            if not financial_timeline:
+            if metrics is None:
                 return None
             
-            # DataFrame으로 변환 (발표일 기준으로 인덱스 설정)
-            df_data = []
-            for item in financial_timeline:
-                row_data = item['data'].copy()
-                row_data['report_date'] = item['report_date']
-                df_data.append(row_data)
+            # 분기 종료일 기준으로 발표일 추정 후 발표일을 인덱스로 설정
+            metrics['quarter_end'] = metrics.index
+            metrics.index = self._estimate_report_dates(metrics.index).rename('report_date')
+            # 재무비율은 유효숫자가 많지 않으므로 float32로 보관 (캐시 메모리와 조회 대역폭 절반)
+            df = metrics.sort_index().astype(
+                {col: np.float32 for col in metrics.columns if col != 'quarter_end'}
+            )
             
-            if not df_data:
-                return None
-            
-            df = pd.DataFrame(df_data)
-            df['report_date'] = pd.to_datetime(df['report_date'])
-            df = df.set_index('report_date').sort_index()
+            await asyncio.to_thread(self._save_disk_cache, ticker, df)
             
             logger.info(f"재무데이터 수집 완료: {ticker} ({len(df)}개 분기)")
             return df
@@ -144,139 +283,155 @@ class PointInTimeFinancialData:
             logger.error(f"재무데이터 수집 중 오류 ({ticker}): {e}")
             return None
     
-    def _estimate_report_date(self, quarter_end_date: datetime) -> datetime:
+    def _disk_path(self, ticker: str) -> Path:
+        """종목의 재무데이터 이력 디스크 캐시 파일 경로"""
+        safe_ticker = re.sub(r'[^0-9A-Za-z._^=-]', '_', ticker)
+        return self.cache_dir / f"{safe_ticker}.pkl"
+    
+    def _load_disk_cache(self, ticker: str) -> Optional[pd.DataFrame]:
+        """디스크 캐시가 유효 시간 안에 저장되었으면 읽어서 반환 (스레드에서 실행)"""
+        if self.cache_dir is None:
+            return None
+        
+        path = self._disk_path(ticker)
+        try:
+            if path.exists() and time.time() - path.stat().st_mtime < DISK_CACHE_MAX_AGE:
+                logger.debug(f"재무데이터 디스크 캐시를 사용합니다: {path}")
+                return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"재무데이터 디스크 캐시 읽기 실패 ({path}): {e}")
+        return None
+    
+    def _save_disk_cache(self, ticker: str, df: pd.DataFrame):
+        """재무데이터 이력을 디스크 캐시에 저장 (스레드에서 실행)"""
+        if self.cache_dir is None:
+            return
+        
+        path = self._disk_path(ticker)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)  # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 원자적 교체
+        except OSError as e:
+            logger.warning(f"재무데이터 디스크 캐시 저장 실패 ({path}): {e}")
+    
+    def _estimate_report_dates(self, quarter_end_dates: pd.Index) -> pd.DatetimeIndex:
         """
-        분기 종료일을 기준으로 실제 발표일 추정
+        분기 종료일들을 기준으로 실제 발표일을 한 번에 추정
         일반적으로 분기 종료 후 45-60일 후 발표
         """
-        try:
-            quarter_end = pd.to_datetime(quarter_end_date)
-            
-            # 분기별 발표일 추정
-            if quarter_end.month == 3:  # 1분기
-                report_date = datetime(quarter_end.year, 5, 15)
-            elif quarter_end.month == 6:  # 2분기  
-                report_date = datetime(quarter_end.year, 8, 15)
-            elif quarter_end.month == 9:  # 3분기
-                report_date = datetime(quarter_end.year, 11, 15)
-            elif quarter_end.month == 12:  # 4분기
-                report_date = datetime(quarter_end.year + 1, 3, 31)
-            else:
-                # 기본값: 분기 종료 후 60일
-                report_date = quarter_end + timedelta(days=60)
-            
-            return report_date
-            
-        except Exception:
-            # 예외 발생 시 기본값 반환
-            return pd.to_datetime(quarter_end_date) + timedelta(days=60)
+        quarter_end = pd.DatetimeIndex(quarter_end_dates)
+        month = quarter_end.month.to_numpy()
+        is_q4 = month == 12
+        
+        # 분기별 발표월 (1분기 5/15, 2분기 8/15, 3분기 11/15, 4분기 다음해 3/31), 그 외는 0
+        report_month = np.select([month == 3, month == 6, month == 9, is_q4], [5, 8, 11, 3], 0)
+        has_schedule = report_month > 0
+        scheduled = pd.DatetimeIndex(pd.to_datetime({
+            'year': quarter_end.year.to_numpy() + is_q4,
+            'month': np.where(has_schedule, report_month, 1),
+            'day': np.where(is_q4, 31, 15),
+        }))
+        
+        # 기본값: 분기 종료 후 60일
+        return (quarter_end + timedelta(days=60)).where(~has_schedule, scheduled)
     
-    async def _extract_financial_metrics(
+    def _extract_financial_metrics(
         self, 
-        stock, 
         info: Dict, 
         financials: pd.DataFrame, 
         balance_sheet: pd.DataFrame,
-        cashflow: pd.DataFrame, 
-        quarter_date
-    ) -> Optional[Dict[str, float]]:
-        """특정 분기의 재무지표 추출"""
-        try:
-            metrics = {}
-            
-            # 현재 주가 정보에서 일부 비율 계산
-            current_price = info.get('currentPrice', info.get('regularMarketPrice'))
-            shares_outstanding = info.get('sharesOutstanding')
-            market_cap = info.get('marketCap')
-            
-            # 손익계산서에서 추출
-            if quarter_date in financials.columns:
-                total_revenue = financials.loc['Total Revenue', quarter_date] if 'Total Revenue' in financials.index else None
-                net_income = financials.loc['Net Income', quarter_date] if 'Net Income' in financials.index else None
-                operating_income = financials.loc['Operating Income', quarter_date] if 'Operating Income' in financials.index else None
-                
-                # 수익성 지표
-                if total_revenue and total_revenue != 0:
-                    if net_income:
-                        metrics['profit_margin'] = float(net_income / total_revenue)
-                    if operating_income:
-                        metrics['operating_margin'] = float(operating_income / total_revenue)
-                
-                # EPS 계산
-                if net_income and shares_outstanding:
-                    eps = net_income / shares_outstanding
-                    metrics['earnings_per_share'] = float(eps)
-                    
-                    # P/E 비율 계산
-                    if current_price and eps != 0:
-                        metrics['pe_ratio'] = float(current_price / eps)
-            
-            # 대차대조표에서 추출  
-            if quarter_date in balance_sheet.columns:
-                total_assets = balance_sheet.loc['Total Assets', quarter_date] if 'Total Assets' in balance_sheet.index else None
-                total_equity = balance_sheet.loc['Total Stockholder Equity', quarter_date] if 'Total Stockholder Equity' in balance_sheet.index else None
-                total_debt = balance_sheet.loc['Total Debt', quarter_date] if 'Total Debt' in balance_sheet.index else None
-                current_assets = balance_sheet.loc['Current Assets', quarter_date] if 'Current Assets' in balance_sheet.index else None
-                current_liabilities = balance_sheet.loc['Current Liabilities', quarter_date] if 'Current Liabilities' in balance_sheet.index else None
-                
-                # 재무 건전성 지표
-                if current_assets and current_liabilities and current_liabilities != 0:
-                    metrics['current_ratio'] = float(current_assets / current_liabilities)
-                
-                if total_debt and total_equity and total_equity != 0:
-                    metrics['debt_to_equity'] = float(total_debt / total_equity)
-                
-                # ROE, ROA 계산
-                if net_income:
-                    if total_equity and total_equity != 0:
-                        metrics['roe'] = float(net_income / total_equity)
-                    if total_assets and total_assets != 0:
-                        metrics['roa'] = float(net_income / total_assets)
-                
-                # P/B 비율 계산
-                if total_equity and shares_outstanding and current_price:
-                    book_value_per_share = total_equity / shares_outstanding
-                    metrics['book_value_per_share'] = float(book_value_per_share)
-                    if book_value_per_share != 0:
-                        metrics['pb_ratio'] = float(current_price / book_value_per_share)
-            
-            # P/S 비율 계산
-            if total_revenue and market_cap:
-                # 연간화 (분기 데이터를 4배)
-                annual_revenue = total_revenue * 4
-                metrics['ps_ratio'] = float(market_cap / annual_revenue)
-            
-            # 성장률 계산 (연간 기준)
-            try:
-                prev_year_same_quarter = financials.columns[financials.columns.get_loc(quarter_date) + 4] \
-                    if financials.columns.get_loc(quarter_date) + 4 < len(financials.columns) else None
-                
-                if prev_year_same_quarter and total_revenue:
-                    prev_revenue = financials.loc['Total Revenue', prev_year_same_quarter] if 'Total Revenue' in financials.index else None
-                    if prev_revenue and prev_revenue != 0:
-                        metrics['revenue_growth'] = float((total_revenue - prev_revenue) / prev_revenue)
-                
-                if prev_year_same_quarter and net_income:
-                    prev_income = financials.loc['Net Income', prev_year_same_quarter] if 'Net Income' in financials.index else None
-                    if prev_income and prev_income != 0:
-                        metrics['earnings_growth'] = float((net_income - prev_income) / prev_income)
-            except:
-                pass  # 성장률 계산 실패는 무시
-            
-            # 배당 정보 (연간 데이터 사용)
-            dividend_yield = info.get('dividendYield')
-            if dividend_yield:
-                metrics['dividend_yield'] = float(dividend_yield)
-            
-            return metrics if metrics else None
-            
-        except Exception as e:
-            logger.warning(f"재무지표 추출 중 오류: {e}")
+        cashflow: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """
+        전체 분기의 재무지표를 배열 연산으로 한 번에 추출
+        
+        Returns:
+            분기 종료일(financials 컬럼 순서) 인덱스의 재무지표 DataFrame.
+            한 분기에서도 계산되지 않은 지표는 컬럼에서 빠지고, 지표가 하나도 없는 분기는 제외
+        """
+        quarters = financials.columns
+        n = len(quarters)
+        
+        # 현재 주가 정보에서 일부 비율 계산 (값이 없거나 0이면 해당 지표 계산 생략)
+        current_price = info.get('currentPrice', info.get('regularMarketPrice'))
+        shares_outstanding = info.get('sharesOutstanding')
+        market_cap = info.get('marketCap')
+        dividend_yield = info.get('trailingAnnualDividendYield')  # 최근 12개월 배당 / 현재가 (소수)
+        has_price = bool(current_price)
+        has_shares = bool(shares_outstanding)
+        
+        # 손익계산서 / 대차대조표 항목 (값 배열, 값이 있고 0이 아닌 분기 마스크), 재무제표별 한 번에 읽음
+        (total_revenue, net_income, operating_income), (has_revenue, has_income, has_operating) = \
+            _statement_rows(financials, ['Total Revenue', 'Net Income', 'Operating Income'], quarters)
+        (
+            (total_assets, total_equity, total_debt, current_assets, current_liabilities),
+            (has_assets, has_equity, has_debt, has_current_assets, has_current_liabilities),
+        ) = _statement_rows(
+            balance_sheet,
+            ['Total Assets', 'Total Stockholder Equity', 'Total Debt', 'Current Assets', 'Current Liabilities'],
+            quarters
+        )
+        
+        metrics = {}  # 지표명 -> (값 배열, 계산된 분기 마스크)
+        
+        # 수익성 지표
+        metrics['profit_margin'] = _masked_divide(net_income, total_revenue, has_revenue & has_income)
+        metrics['operating_margin'] = _masked_divide(operating_income, total_revenue, has_revenue & has_operating)
+        
+        # EPS 및 P/E 비율
+        eps, has_eps = _masked_divide(net_income, shares_outstanding if has_shares else np.nan, has_income & has_shares)
+        metrics['earnings_per_share'] = (eps, has_eps)
+        metrics['pe_ratio'] = _masked_divide(current_price if has_price else np.nan, eps, has_eps & has_price & (eps != 0))
+        
+        # 재무 건전성 지표
+        metrics['current_ratio'] = _masked_divide(current_assets, current_liabilities, has_current_assets & has_current_liabilities)
+        metrics['debt_to_equity'] = _masked_divide(total_debt, total_equity, has_debt & has_equity)
+        
+        # ROE, ROA
+        metrics['roe'] = _masked_divide(net_income, total_equity, has_income & has_equity)
+        metrics['roa'] = _masked_divide(net_income, total_assets, has_income & has_assets)
+        
+        # 주당 순자산 및 P/B 비율
+        bvps, has_bvps = _masked_divide(total_equity, shares_outstanding if has_shares else np.nan, has_equity & has_shares & has_price)
+        metrics['book_value_per_share'] = (bvps, has_bvps)
+        metrics['pb_ratio'] = _masked_divide(current_price if has_price else np.nan, bvps, has_bvps & (bvps != 0))
+        
+        # P/S 비율 (분기 매출을 4배하여 연간화)
+        metrics['ps_ratio'] = _masked_divide(market_cap if market_cap else np.nan, total_revenue * 4, has_revenue & bool(market_cap))
+        
+        # 성장률 (4분기 전 같은 분기 대비, 컬럼은 최신부터 과거 순서)
+        prev_revenue, has_prev_revenue = _shift_back(total_revenue, has_revenue, 4)
+        prev_income, has_prev_income = _shift_back(net_income, has_income, 4)
+        metrics['revenue_growth'] = _masked_divide(total_revenue - prev_revenue, prev_revenue, has_revenue & has_prev_revenue)
+        metrics['earnings_growth'] = _masked_divide(net_income - prev_income, prev_income, has_income & has_prev_income)
+        
+        # 배당 정보 (최근 12개월 배당수익률, 소수 단위)
+        if dividend_yield:
+            metrics['dividend_yield'] = (np.full(n, float(dividend_yield)), np.ones(n, dtype=bool))
+        
+        # 지표가 하나라도 계산된 분기만 남김
+        has_any = np.logical_or.reduce([mask for _, mask in metrics.values()])
+        if not has_any.any():
             return None
+        
+        return pd.DataFrame(
+            {name: values[has_any] for name, (values, mask) in metrics.items() if mask.any()},
+            index=quarters[has_any]
+        )
     
     def clear_cache(self):
         """캐시 초기화"""
         self._cache.clear()
+        self._report_dates.clear()
+        self._rows.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pkl"):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning(f"재무데이터 디스크 캐시 삭제 실패 ({path}): {e}")
         logger.info("Point-in-Time 재무데이터 캐시가 초기화되었습니다")
 
 
@@ -4,29 +4,82 @@
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Any
 import logging
+from ._kernels import iqr_clip, returns_and_volatility
 
 logger = logging.getLogger(__name__)
 
+# 인덱스별 시간 특성 캐시 (대부분 종목이 같은 거래일 달력을 공유하므로 재사용)
+_TIME_FEATURE_CACHE_SIZE = 32
+_time_feature_cache: "OrderedDict[tuple, Dict[str, np.ndarray]]" = OrderedDict()
+
+
+def _time_feature_arrays(index: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+    """인덱스의 시간 특성 배열을 반환합니다 (같은 인덱스는 캐시된 읽기 전용 배열 재사용)."""
+    key = (str(index.dtype), index.freqstr, index.asi8.tobytes())
+    features = _time_feature_cache.get(key)
+    if features is not None:
+        _time_feature_cache.move_to_end(key)
+        return features
+    
+    # 월말/월초는 일(day)과 그 달의 일수 비교로 판단
+    # (freq가 지정된 인덱스는 pandas가 영업일 기준 등으로 판단하므로 접근자 사용)
+    if index.freq is None:
+        day = index.day.to_numpy()
+        is_month_end = day == index.days_in_month.to_numpy()
+        is_month_start = day == 1
+    else:
+        is_month_end = index.is_month_end
+        is_month_start = index.is_month_start
+    
+    features = {
+        'Year': index.year.to_numpy(),
+        'Month': index.month.to_numpy(),
+        'Weekday': index.weekday.to_numpy(),
+        'Is_Month_End': np.asarray(is_month_end, dtype=int),
+        'Is_Month_Start': np.asarray(is_month_start, dtype=int),
+        'Quarter': index.quarter.to_numpy(),
+    }
+    for values in features.values():
+        values.flags.writeable = False
+    
+    _time_feature_cache[key] = features
+    if len(_time_feature_cache) > _TIME_FEATURE_CACHE_SIZE:
+        _time_feature_cache.popitem(last=False)
+    return features
+
+
+def _kernel_input(series: pd.Series) -> np.ndarray:
+    """커널에 넘길 1차원 C-연속 실수 배열 (실수 dtype은 유지, 그 외는 float64)
+
+    2차원 배열로 만든 DataFrame의 컬럼은 보폭(stride)이 있는 뷰이므로 연속 배열로 복사합니다.
+    """
+    values = series.to_numpy()
+    return np.ascontiguousarray(values, dtype=values.dtype if values.dtype.kind == 'f' else np.float64)
+
+
 class DataProcessor:
     @staticmethod
     def preprocess_price_data(df: pd.DataFrame) -> pd.DataFrame:
         """가격 데이터를 전처리합니다."""
         try:
-            # 결측치 처리 (새로운 방식 사용)
-            df = df.ffill().bfill()
+            # 결측치 처리 (결측치가 없으면 채우기 생략, 얕은 복사로 원본 DataFrame은 보존)
+            if df.isna().to_numpy().any():
+                df = df.ffill().bfill()
+            else:
+                df = df.copy(deep=False)
             
-            # 이상치 처리 (IQR 방법)
+            # 이상치 처리 (IQR 방법, 정렬 없이 선택 알고리즘으로 분위수 계산)
             for col in ['Open', 'High', 'Low', 'Close']:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
+                values = _kernel_input(df[col])
+                clipped = np.empty(values.size)
                 
-                # 이상치를 경계값으로 대체
-                df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
+                # 이상치를 경계값으로 대체 (경계값이 원래 dtype으로 정확히 표현되면 dtype 유지)
+                if iqr_clip(values, clipped, 1.5):
+                    narrowed = clipped.astype(df[col].dtype)
+                    df[col] = narrowed if np.array_equal(narrowed, clipped, equal_nan=True) else clipped
             
             # 거래량 음수 처리
             df['Volume'] = df['Volume'].clip(lower=0)
@@ -41,14 +94,13 @@ class DataProcessor:
     def calculate_returns(df: pd.DataFrame) -> pd.DataFrame:
         """수익률을 계산합니다."""
         try:
-            # 일간 수익률
-            df['Daily_Return'] = df['Close'].pct_change()
+            # 일간 수익률, 누적 수익률, 변동성(20일, 연율화)을 한 번의 순회로 계산
+            close = _kernel_input(df['Close'])
+            daily, cumulative, volatility = returns_and_volatility(close, 20, np.sqrt(252))
             
-            # 누적 수익률
-            df['Cumulative_Return'] = (1 + df['Daily_Return']).cumprod() - 1
-            
-            # 변동성
-            df['Volatility'] = df['Daily_Return'].rolling(window=20).std() * np.sqrt(252)
+            df['Daily_Return'] = daily
+            df['Cumulative_Return'] = cumulative
+            df['Volatility'] = volatility
             
             return df
             
@@ -60,17 +112,9 @@ class DataProcessor:
     def add_time_features(df: pd.DataFrame) -> pd.DataFrame:
         """시간 관련 특성을 추가합니다."""
         try:
-            # 연도, 월, 요일 추출
-            df['Year'] = df.index.year
-            df['Month'] = df.index.month
-            df['Weekday'] = df.index.weekday
-            
-            # 월말, 월초 여부
-            df['Is_Month_End'] = df.index.is_month_end.astype(int)
-            df['Is_Month_Start'] = df.index.is_month_start.astype(int)
-            
-            # 분기
-            df['Quarter'] = df.index.quarter
+            # 연도, 월, 요일, 월말/월초 여부(0/1), 분기 (같은 인덱스면 캐시된 배열 사용)
+            for name, values in _time_feature_arrays(df.index).items():
+                df[name] = values
             
             return df
             
@@ -0,0 +1,116 @@
+"""
+전략 공통 기술적 지표
+
+여러 전략이 같은 종목 데이터로 RSI/MACD/볼린저 밴드/ATR을 반복 계산하므로, 입력 값과
+파라미터가 같으면 캐시된 결과를 재사용합니다. 반환값은 호출한 Series의 인덱스를 가진
+새 Series이며 룩어헤드 방지용 shift는 호출하는 쪽에서 적용합니다.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._kernels import ewm_mean, rolling_rank_pct
+
+# (지표, 파라미터, 입력 값 지문) -> 결과 배열 튜플 (전략마다 DataFrame을 복사할 수 있으므로 값 기준으로 비교)
+_INDICATOR_CACHE_SIZE = 64
+_indicator_cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+
+
+def _cache_key(name: str, params: tuple, *series: pd.Series) -> tuple:
+    """입력 값 전체의 해시로 만든 캐시 키
+
+    값 내용으로 비교하므로 중간 값만 바뀐 데이터는 다른 키가 되고, 복사본끼리는 같은 키가 됩니다.
+    blake2b는 배열 메모리를 복사 없이 읽으므로 지표를 다시 계산하는 것보다 훨씬 저렴합니다.
+    """
+    fingerprints = []
+    for s in series:
+        values = s.to_numpy()
+        if values.dtype.kind not in 'biuf':  # 확장/객체 dtype은 pandas 행 해시로 대체
+            values = pd.util.hash_pandas_object(s, index=False).to_numpy()
+        values = np.ascontiguousarray(values)
+        digest = hashlib.blake2b(memoryview(values).cast('B'), digest_size=16).digest()
+        fingerprints.append((values.dtype.str, len(values), digest))
+    return (name, params, tuple(fingerprints))
+
+
+def _cached(key: tuple, compute) -> Tuple[np.ndarray, ...]:
+    """key에 해당하는 결과 배열을 캐시에서 찾고, 없으면 compute()로 계산해 저장합니다."""
+    result = _indicator_cache.get(key)
+    if result is not None:
+        _indicator_cache.move_to_end(key)
+        return result
+
+    result = tuple(s.to_numpy() for s in compute())
+    for values in result:
+        values.flags.writeable = False
+
+    _indicator_cache[key] = result
+    if len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+        _indicator_cache.popitem(last=False)
+    return result
+
+
+def rsi(close: pd.Series, period: int = 14) -> pd.Series:
+    """RSI (단순 이동평균 방식, 하락폭 평균이 0이면 NaN)"""
+    def compute():
+        # 상승폭/하락폭을 같은 변화량 배열에서 한 번씩만 계산 (NaN은 그대로 전파)
+        delta = close.diff().to_numpy()
+        gain = pd.Series(np.maximum(delta, 0)).rolling(period, min_periods=1).mean()
+        loss = pd.Series(np.maximum(-delta, 0)).rolling(period, min_periods=1).mean()
+        rs = gain / loss.replace(0, np.nan)
+        return (100 - (100 / (1 + rs)),)
+
+    (values,) = _cached(_cache_key('rsi', (period,), close), compute)
+    return pd.Series(values, index=close.index)
+
+
+def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9,
+         adjust: bool = True) -> Tuple[pd.Series, pd.Series]:
+    """MACD선과 시그널선 (pandas ewm(span, adjust).mean()과 같은 지수이동평균)"""
+    def compute():
+        values = close.to_numpy()
+        line = ewm_mean(values, fast, adjust) - ewm_mean(values, slow, adjust)
+        return pd.Series(line), pd.Series(ewm_mean(line, signal, adjust))
+
+    line, signal_line = _cached(_cache_key('macd', (fast, slow, signal, adjust), close), compute)
+    return pd.Series(line, index=close.index), pd.Series(signal_line, index=close.index)
+
+
+def bollinger(close: pd.Series, period: int = 20) -> Tuple[pd.Series, pd.Series]:
+    """볼린저 밴드 중심선(이동평균)과 이동 표준편차"""
+    def compute():
+        return (
+            close.rolling(period, min_periods=1).mean(),
+            close.rolling(period, min_periods=1).std(),
+        )
+
+    sma, std = _cached(_cache_key('bollinger', (period,), close), compute)
+    return pd.Series(sma, index=close.index), pd.Series(std, index=close.index)
+
+
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    """ATR (True Range의 단순 이동평균)"""
+    def compute():
+        # 가격 dtype(float32/float64) 그대로 True Range 계산 (rolling은 float64로 변환)
+        dtype = np.result_type(high.dtype, low.dtype, close.dtype, np.float32)
+        hi = high.to_numpy(dtype=dtype)
+        lo = low.to_numpy(dtype=dtype)
+        prev_close = np.full(len(close), np.nan, dtype=dtype)
+        prev_close[1:] = close.to_numpy(dtype=dtype)[:-1]
+        # fmax는 NaN을 건너뛰므로 DataFrame.max(axis=1)와 같이 첫 봉은 고가-저가가 됨
+        tr = np.fmax(np.fmax(hi - lo, np.abs(hi - prev_close)), np.abs(lo - prev_close))
+        return (pd.Series(tr).rolling(period, min_periods=1).mean(),)
+
+    (values,) = _cached(_cache_key('atr', (period,), high, low, close), compute)
+    return pd.Series(values, index=close.index)
+
+
+def rolling_rank(series: pd.Series, window: int, min_periods: int) -> pd.Series:
+    """rolling(window, min_periods).rank(pct=True)와 같은 구간 내 백분위 순위"""
+    if min_periods > window:
+        raise ValueError(f"min_periods {min_periods} must be <= window {window}")
+    values = rolling_rank_pct(series.to_numpy(dtype=np.float64), window, min_periods)
+    return pd.Series(values, index=series.index, name=series.name)
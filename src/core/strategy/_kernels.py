@@ -0,0 +1,181 @@
+"""
+전략 계산용 NumPy 커널
+
+numba가 설치되어 있으면 JIT 컴파일되어 실행되고, 없으면 동일한 코드가
+순수 Python으로 동작합니다.
+"""
+
+import numpy as np
+
+from ..utils.jit import njit, prange
+
+
+@njit(cache=True)
+def _cholesky_solve(a, b):
+    """대칭 양의 정부호 행렬 a에 대해 a @ x = b를 촐레스키 분해로 풉니다 (a는 덮어씀)"""
+    n = b.size
+    for j in range(n):
+        d = a[j, j]
+        for k in range(j):
+            d -= a[j, k] * a[j, k]
+        d = np.sqrt(d)
+        a[j, j] = d
+        for i in range(j + 1, n):
+            v = a[i, j]
+            for k in range(j):
+                v -= a[i, k] * a[j, k]
+            a[i, j] = v / d
+    x = b.copy()
+    for i in range(n):
+        for k in range(i):
+            x[i] -= a[i, k] * x[k]
+        x[i] /= a[i, i]
+    for i in range(n - 1, -1, -1):
+        for k in range(i + 1, n):
+            x[i] -= a[k, i] * x[k]
+        x[i] /= a[i, i]
+    return x
+
+
+@njit(cache=True)
+def _rank1_update(XtX, Xty, x, y, c):
+    """XtX += c * x x^T, Xty += c * x y"""
+    n = x.size
+    for f in range(n):
+        cx = c * x[f]
+        Xty[f] += cx * y
+        for g in range(n):
+            XtX[f, g] += cx * x[g]
+
+
+@njit(parallel=True, cache=True)
+def ensemble_ridge_predict(X_all, y_all, valid_rows, row_weights, start, stop, lookback,
+                           min_samples, max_sample_size, lam):
+    """시점별 이동 구간으로 부트스트랩 Ridge 앙상블을 학습하여 다음 값을 예측합니다.
+
+    i번째 시점은 [i - lookback, i) 구간의 유효 행으로 row_weights.shape[1]개 모델을 학습합니다.
+    k번째 모델의 부트스트랩 표본은 행마다 고정된 추출 횟수 row_weights[n, k]로 표현하므로,
+    가중 정규방정식 X^T diag(c) X, X^T diag(c) y를 구간이 한 칸 움직일 때마다 들어오는 행과
+    나가는 행의 rank-1 갱신으로 유지하고 (X^T diag(c) X + lam*I) w = X^T diag(c) y를 풉니다.
+    모델끼리는 독립이므로 모델 단위로 병렬 계산합니다. X_all/y_all은 float32도 받으며,
+    정규방정식은 행을 더하고 빼는 과정의 오차 누적을 막기 위해 float64로 유지합니다.
+
+    Returns:
+        (앙상블 평균 예측, 예측 일관성 신뢰도) 배열. 학습하지 않은 시점은 NaN
+    """
+    n, n_features = X_all.shape
+    n_models = row_weights.shape[1]
+    prediction = np.full(n, np.nan)
+    confidence = np.full(n, np.nan)
+    if n_models == 0 or stop <= start:
+        return prediction, confidence
+
+    # 시점별 학습 여부 (최소 유효 행 수, 피처 수보다 많은 표본, 현재 피처에 결측 없음)
+    fit = np.zeros(n, dtype=np.bool_)
+    n_valid = 0
+    for r in range(max(0, start - lookback), start):
+        n_valid += valid_rows[r]
+    for i in range(start, stop):
+        if i > start:
+            n_valid += valid_rows[i - 1]
+            if i - 1 - lookback >= 0:
+                n_valid -= valid_rows[i - 1 - lookback]
+        fit[i] = (n_valid >= min_samples and min(n_valid, max_sample_size) > n_features
+                  and not np.isnan(X_all[i]).any())
+
+    first = max(0, start - lookback)
+    preds = np.full((n_models, n), np.nan)
+    for k in prange(n_models):
+        XtX = np.zeros((n_features, n_features))
+        Xty = np.zeros(n_features)
+        for i in range(first, stop):
+            # 구간 [i - lookback + 1, i + 1)로 이동하기 전에 i 시점 예측
+            if i >= start and fit[i]:
+                A = XtX.copy()
+                for f in range(n_features):
+                    A[f, f] += lam
+                weights = _cholesky_solve(A, Xty)
+                preds[k, i] = (weights * X_all[i]).sum()
+            # 들어오는 행 i와 나가는 행 i - lookback 반영
+            if valid_rows[i] and row_weights[i, k] != 0:
+                _rank1_update(XtX, Xty, X_all[i], y_all[i], row_weights[i, k])
+            out = i - lookback
+            if out >= first and valid_rows[out] and row_weights[out, k] != 0:
+                _rank1_update(XtX, Xty, X_all[out], y_all[out], -row_weights[out, k])
+
+    for i in range(start, stop):
+        if fit[i]:
+            mean = preds[:, i].mean()
+            prediction[i] = mean
+            confidence[i] = max(0.0, 1 - preds[:, i].std() / (abs(mean) + 0.01))
+    return prediction, confidence
+
+
+@njit(cache=True)
+def rolling_rank_pct(x, window, min_periods):
+    """pandas rolling(window, min_periods).rank(pct=True) (method='average')와 동일
+
+    각 시점 값이 구간 내 유효값 중 몇 번째인지(동점은 평균 순위)를 유효값 개수로 나눕니다.
+    pandas와 같이 inf는 결측으로 취급하며, 현재 값이 결측이거나 유효값이 min_periods보다
+    적으면 NaN입니다.
+    """
+    n = x.size
+    out = np.full(n, np.nan)
+    for i in range(n):
+        v = x[i]
+        lo = max(0, i - window + 1)
+        nobs = 0
+        less = 0
+        equal = 0
+        for j in range(lo, i + 1):
+            w = x[j]
+            if not np.isfinite(w):
+                continue
+            nobs += 1
+            if w < v:
+                less += 1
+            elif w == v:
+                equal += 1
+        if nobs >= min_periods and nobs > 0 and np.isfinite(v):
+            out[i] = (less + (equal + 1) / 2) / nobs
+    return out
+
+
+@njit(cache=True)
+def ewm_mean(x, span, adjust):
+    """pandas ewm(span=span, adjust=adjust).mean()과 동일 (ignore_na=False)
+
+    pandas와 같은 가중치 갱신식을 그대로 따르므로 결과가 비트 단위로 같습니다. 결측값은
+    가중치 감쇠에만 반영되고 직전 평균을 그대로 유지하며, 첫 유효값 전까지는 NaN입니다.
+    """
+    n = x.size
+    out = np.empty(n)
+    if n == 0:
+        return out
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    new_wt = 1.0 if adjust else alpha
+    weighted = np.float64(x[0])
+    out[0] = weighted
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = np.float64(x[i])
+        is_observation = not np.isnan(cur)
+        if not np.isnan(weighted):
+            old_wt *= old_wt_factor
+            if is_observation:
+                # 같은 값이 이어질 때 반올림 오차가 생기지 않도록 그대로 유지
+                if weighted != cur:
+                    if not adjust and com == 1:
+                        # pandas와 같게 결측 구간 뒤 가중치 보정 (span=3일 때만 적용됨)
+                        new_wt = 1.0 - old_wt
+                    weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+                if adjust:
+                    old_wt += new_wt
+                else:
+                    old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted
+    return out
@@ -2,9 +2,13 @@
 전략 인터페이스 정의
 """
 from __future__ import annotations
-from typing import Dict, Any, Optional
+import hashlib
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+if TYPE_CHECKING:
+    from ..data.point_in_time_financials import PITFinancials
 
 @dataclass
 class Signal:
@@ -22,6 +26,7 @@ class Strategy:
     def __init__(self):
         self._ticker = None
         self._point_in_time_financials = None
+        self._latest_signal_memo = None  # (입력 키, Signal) - 같은 데이터로 반복 호출 시 재사용
     
     def set_ticker(self, ticker: str):
         """전략에서 사용할 종목 코드 설정"""
@@ -31,7 +36,7 @@ class Strategy:
         """Point-in-Time 재무데이터 소스 설정"""
         self._point_in_time_financials = financial_data_source
 
-    async def get_financial_data_at_date(self, date: pd.Timestamp) -> Optional[Dict[str, Any]]:
+    async def get_financial_data_at_date(self, date: pd.Timestamp) -> Optional[PITFinancials]:
         """특정 날짜의 Point-in-Time 재무데이터 조회"""
         if not self._point_in_time_financials or not self._ticker:
             return None
@@ -47,9 +52,22 @@ class Strategy:
         raise NotImplementedError
 
     def latest_signal(self, df: pd.DataFrame, params: Dict[str, Any] | None = None) -> Signal:
+        # 종목, 파라미터, 입력 데이터 전체(인덱스/컬럼/값)가 같으면 직전 결과를 재사용
+        # (과거 봉만 수정주가로 바뀐 경우도 해시가 달라져 다시 계산)
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        key = (
+            self._ticker,
+            tuple(df.columns),
+            hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest(),
+            repr(sorted(params.items())) if params else None,
+        )
+        memo = self._latest_signal_memo
+        if memo is not None and memo[0] == key:
+            return replace(memo[1])  # 호출자 간에 같은 인스턴스를 공유하지 않도록 복사
+        
         sigs = self.compute_signals(df, params)
         row = sigs.iloc[-1]
-        return Signal(
+        signal = Signal(
             date=row.name,
             action=row["action"],
             confidence=row["confidence"],
@@ -58,3 +76,5 @@ class Strategy:
             target=row.get("target"),
             size=row.get("size"),
         )
+        self._latest_signal_memo = (key, signal)
+        return replace(signal)
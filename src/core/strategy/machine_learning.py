@@ -6,6 +6,42 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
+from ._kernels import ensemble_ridge_predict
+
+# 모델 입력으로 쓰는 피처 컬럼 (정규화 후 "_norm" 접미사)
+_FEATURE_COLUMNS = (
+    "returns", "rsi", "macd", "bb_position", "momentum_5", "momentum_10", "momentum_20",
+    "volatility_5", "volatility_10", "volatility_20", "volume_ratio",
+    "higher_high", "lower_low", "daily_range", "gap",
+)
+
+def _rolling_zscore(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """각 컬럼을 rolling(window, min_periods) 평균/표준편차(ddof=1)로 정규화 (결과의 NaN은 0)
+
+    컬럼별 rolling 연산 대신 누적합 차분으로 모든 컬럼의 구간 합/제곱합을 한 번에 구합니다.
+    상쇄 오차를 줄이기 위해 컬럼 평균을 빼고 계산하며, 유한하지 않은 값은 구간 통계에서 제외합니다.
+    """
+    finite = np.isfinite(values)
+    center = np.where(finite, values, 0.0).sum(axis=0) / np.maximum(finite.sum(axis=0), 1)
+    x = np.where(finite, values - center, 0.0)
+    
+    def window_sum(a):
+        total = np.cumsum(a, axis=0)
+        total[window:] -= total[:-window].copy()
+        return total
+    
+    count = window_sum(finite.astype(np.float64))
+    s1 = window_sum(x)
+    s2 = window_sum(x * x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = s1 / count
+        ssq = s2 - s1 * mean
+        z = (np.where(finite, x, values) - mean) / np.sqrt(np.maximum(ssq, 0.0) / (count - 1))
+    # 같은 값만 있는 구간은 pandas와 같이 0/0(NaN -> 0)으로 처리 (차분 반올림 오차로 생기는 미세 분산 무시)
+    z[ssq <= 1e-12 * s2] = np.nan
+    z[count < min_periods] = np.nan
+    return np.where(np.isnan(z), 0.0, z)
 
 
 class MachineLearningStrategy(Strategy):
@@ -26,15 +62,16 @@ class MachineLearningStrategy(Strategy):
                 - ensemble_models: 앙상블 모델 수 (기본값: 3)
                 - lookback_window: 학습 데이터 윈도우 (기본값: 100)
                 - warmup: 워밍업 기간 (기본값: 120)
+                - random_state: 부트스트랩 난수 시드 (기본값: None)
         """
         p = {
             "feature_period": 20, "prediction_horizon": 5, "confidence_threshold": 0.6,
-            "ensemble_models": 3, "lookback_window": 100, "warmup": 120
+            "ensemble_models": 3, "lookback_window": 100, "warmup": 120, "random_state": None
         }
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -47,133 +84,78 @@ class MachineLearningStrategy(Strategy):
         lookback_window = int(p["lookback_window"])
         
         # 1. 피처 엔지니어링
-        
-        # Point-in-Time 재무데이터 추가 
-        s = self._add_financial_features(s, feature_period)
+        # 모든 피처는 당일 봉까지의 값으로 계산한 뒤 마지막에 한 번에 1봉 뒤로 미룸 (미래 정보 차단)
+        close, high, low, volume = s["Close"], s["High"], s["Low"], s["Volume"]
+        close_prev, high_prev, low_prev = close.shift(1), high.shift(1), low.shift(1)
+        features = {}
         
         # 가격 기반 피처
-        s["returns"] = s["Close"].pct_change().shift(1)
-        s["log_returns"] = np.log(s["Close"] / s["Close"].shift(1)).shift(1)
+        features["returns"] = close.pct_change()
+        features["log_returns"] = np.log(close / close_prev)
         
         # 기술적 지표 피처
-        s["rsi"] = self._calculate_rsi(s["Close"], 14).shift(1)
-        s["macd"], s["macd_signal"] = self._calculate_macd(s["Close"]).shift(1), self._calculate_macd_signal(s["Close"]).shift(1)
-        s["bb_position"] = self._calculate_bb_position(s["Close"], feature_period).shift(1)
+        features["rsi"] = indicators.rsi(close, 14)
+        features["macd"], features["macd_signal"] = indicators.macd(close)
+        features["bb_position"] = self._calculate_bb_position(close, feature_period)
         
-        # 모멘텀 피처
+        # 모멘텀 피처 (변동성은 1봉 미룬 수익률 기준)
+        returns_prev = features["returns"].shift(1)
         for period in [5, 10, 20]:
-            s[f"momentum_{period}"] = (s["Close"] / s["Close"].shift(period) - 1).shift(1)
-            s[f"volatility_{period}"] = s["returns"].rolling(period, min_periods=1).std().shift(1)
+            features[f"momentum_{period}"] = close / close.shift(period) - 1
+            features[f"volatility_{period}"] = returns_prev.rolling(period, min_periods=1).std()
         
-        # 거래량 피처
-        s["volume_ma"] = s["Volume"].rolling(feature_period, min_periods=1).mean().shift(1)
-        s["volume_ratio"] = (s["Volume"] / s["volume_ma"]).shift(1)
-        s["price_volume"] = (s["Close"] * s["Volume"]).rolling(10, min_periods=1).mean().shift(1)
+        # 거래량 피처 (거래량 비율은 1봉 미룬 거래량 평균 기준)
+        features["volume_ma"] = volume.rolling(feature_period, min_periods=1).mean()
+        features["volume_ratio"] = volume / features["volume_ma"].shift(1)
+        features["price_volume"] = (close * volume).rolling(10, min_periods=1).mean()
         
         # 패턴 피처 (간단한 패턴 인식)
-        s["higher_high"] = ((s["High"] > s["High"].shift(1)) & 
-                           (s["High"].shift(1) > s["High"].shift(2))).astype(float).shift(1)
-        s["lower_low"] = ((s["Low"] < s["Low"].shift(1)) & 
-                         (s["Low"].shift(1) < s["Low"].shift(2))).astype(float).shift(1)
+        features["higher_high"] = ((high > high_prev) & (high_prev > high.shift(2))).astype(float)
+        features["lower_low"] = ((low < low_prev) & (low_prev < low.shift(2))).astype(float)
         
         # 시장 구조 피처
-        s["daily_range"] = ((s["High"] - s["Low"]) / s["Close"]).shift(1)
-        s["gap"] = ((s["Open"] - s["Close"].shift(1)) / s["Close"].shift(1)).shift(1)
+        features["daily_range"] = (high - low) / close
+        features["gap"] = (s["Open"] - close_prev) / close_prev
+        
+        s[list(features)] = pd.DataFrame(features, index=s.index).shift(1)
         
         # 2. 타겟 변수 (미래 수익률)
         s[f"target_{prediction_horizon}d"] = (s["Close"].shift(-prediction_horizon) / s["Close"] - 1)
         
         # 3. 피처 선택 및 정규화
-        feature_columns = [
-            "returns", "rsi", "macd", "bb_position", "momentum_5", "momentum_10", "momentum_20",
-            "volatility_5", "volatility_10", "volatility_20", "volume_ratio", 
-            "higher_high", "lower_low", "daily_range", "gap"
-        ]
-        
         # 결측치 처리
-        for col in feature_columns:
+        for col in _FEATURE_COLUMNS:
             s[col] = s[col].fillna(s[col].median())
         
-        # 정규화 (Z-score)
-        for col in feature_columns:
-            if col in s.columns:
-                rolling_mean = s[col].rolling(50, min_periods=10).mean()
-                rolling_std = s[col].rolling(50, min_periods=10).std()
-                s[f"{col}_norm"] = ((s[col] - rolling_mean) / rolling_std).fillna(0)
+        # 정규화 (Z-score, 전체 피처를 한 번에 계산)
+        feature_columns = [col for col in _FEATURE_COLUMNS if col in s.columns]
+        s[[f"{col}_norm" for col in feature_columns]] = _rolling_zscore(
+            s[feature_columns].to_numpy(dtype=np.float64), 50, 10
+        )
         
         # 4. 단순 머신러닝 모델 (이동 윈도우 선형 회귀)
         
-        s["ml_prediction"] = np.nan
-        s["ml_confidence"] = np.nan
-        s["ensemble_prediction"] = np.nan
-        
         normalized_features = [f"{col}_norm" for col in feature_columns if f"{col}_norm" in s.columns]
+        rng = np.random.default_rng(p["random_state"])
+        
+        # 피처/타겟 배열과 결측 행 정보 (Z-score/수익률은 float32로 충분하여 읽는 바이트를 절반으로,
+        # 정규방정식 누적과 풀이는 커널에서 float64로 수행)
+        X_all = np.ascontiguousarray(s[normalized_features].to_numpy(dtype=np.float32))
+        y_all = s[f"target_{prediction_horizon}d"].to_numpy(dtype=np.float32)
+        valid_rows = ~(np.isnan(X_all).any(axis=1) | np.isnan(y_all))
+        
+        # 시점별 부트스트랩 Ridge 앙상블 (이동 구간 학습)
+        # 모델별 부트스트랩 추출 횟수를 행마다 고정(포아송 부트스트랩)하여 겹치는 구간의 정규방정식을
+        # 행 단위 갱신으로 재사용. 꽉 찬 구간의 기대 표본 수는 80으로 기존 추출 크기와 같음
+        row_weights = rng.poisson(80 / lookback_window, size=(len(s), ensemble_models)).astype(np.float64)
+        ml_prediction, ml_confidence = ensemble_ridge_predict(
+            X_all, y_all, valid_rows, row_weights, lookback_window, len(s) - prediction_horizon,
+            lookback_window, 20, 80, 0.1
+        )
         
-        for i in range(lookback_window, len(s) - prediction_horizon):
-            try:
-                # 학습 데이터 준비
-                start_idx = max(0, i - lookback_window)
-                end_idx = i
-                
-                # 피처와 타겟 추출
-                X = s[normalized_features].iloc[start_idx:end_idx].values
-                y = s[f"target_{prediction_horizon}d"].iloc[start_idx:end_idx].values
-                
-                # NaN 제거
-                valid_mask = ~(np.isnan(X).any(axis=1) | np.isnan(y))
-                if valid_mask.sum() < 20:  # 최소 학습 데이터
-                    continue
-                    
-                X_clean = X[valid_mask]
-                y_clean = y[valid_mask]
-                
-                # 현재 피처
-                X_current = s[normalized_features].iloc[i].values.reshape(1, -1)
-                
-                if np.isnan(X_current).any():
-                    continue
-                
-                # 앙상블 예측
-                predictions = []
-                
-                for model_idx in range(ensemble_models):
-                    # 부트스트랩 샘플링
-                    sample_size = min(len(X_clean), 80)
-                    sample_indices = np.random.choice(len(X_clean), size=sample_size, replace=True)
-                    X_sample = X_clean[sample_indices]
-                    y_sample = y_clean[sample_indices]
-                    
-                    # 단순 선형 회귀 (최소제곱법)
-                    if len(X_sample) > len(X_sample[0]):  # 피처 수보다 많은 샘플
-                        # Ridge 회귀 (L2 정규화)
-                        lambda_reg = 0.1
-                        XtX = X_sample.T @ X_sample + lambda_reg * np.eye(X_sample.shape[1])
-                        
-                        try:
-                            Xty = X_sample.T @ y_sample
-                            weights = np.linalg.solve(XtX, Xty)
-                            
-                            # 예측
-                            prediction = X_current @ weights
-                            predictions.append(prediction[0])
-                            
-                        except np.linalg.LinAlgError:
-                            continue
-                
-                if predictions:
-                    # 앙상블 평균
-                    ensemble_pred = np.mean(predictions)
-                    prediction_std = np.std(predictions)
-                    
-                    # 신뢰도 (예측 일관성)
-                    confidence = max(0, 1 - prediction_std / (abs(ensemble_pred) + 0.01))
-                    
-                    s.loc[s.index[i], "ml_prediction"] = ensemble_pred
-                    s.loc[s.index[i], "ml_confidence"] = confidence
-                    s.loc[s.index[i], "ensemble_prediction"] = ensemble_pred
-                    
-            except Exception as e:
-                continue
+        s["ml_prediction"] = ml_prediction
+        s["ml_confidence"] = ml_confidence
+        s["ensemble_prediction"] = ml_prediction
         
         # 5. 매매 신호 생성
         
@@ -225,11 +207,7 @@ class MachineLearningStrategy(Strategy):
         risk_multiplier = np.clip(prediction_magnitude * 10, 1, 3)  # 예측 크기에 따른 리스크 조정
         
         # ATR 계산
-        s["high_low"] = s["High"] - s["Low"]
-        s["high_close"] = abs(s["High"] - s["Close"].shift(1))
-        s["low_close"] = abs(s["Low"] - s["Close"].shift(1))
-        s["tr"] = s[["high_low", "high_close", "low_close"]].max(axis=1)
-        s["atr"] = s["tr"].rolling(14, min_periods=1).mean().shift(1)
+        s["atr"] = indicators.atr(s["High"], s["Low"], s["Close"], 14).shift(1)
         
         stop = np.where(action == "BUY", s["Close"] - risk_multiplier * s["atr"],
                        np.where(action == "SELL", s["Close"] + risk_multiplier * s["atr"], np.nan))
@@ -253,145 +231,9 @@ class MachineLearningStrategy(Strategy):
             return out.tail(1) if len(out) > 0 else out
         return out.iloc[warmup:]
     
-    def _calculate_rsi(self, prices, period=14):
-        """RSI 계산"""
-        delta = prices.diff()
-        gain = delta.clip(lower=0).rolling(period, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(period, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        return 100 - (100 / (1 + rs))
-    
-    def _calculate_macd(self, prices, fast=12, slow=26):
-        """MACD 계산"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        return ema_fast - ema_slow
-    
-    def _calculate_macd_signal(self, prices, fast=12, slow=26, signal=9):
-        """MACD Signal 계산"""
-        macd = self._calculate_macd(prices, fast, slow)
-        return macd.ewm(span=signal).mean()
-    
     def _calculate_bb_position(self, prices, period=20, std=2):
         """볼린저 밴드 위치 계산"""
-        sma = prices.rolling(period, min_periods=1).mean()
-        rolling_std = prices.rolling(period, min_periods=1).std()
+        sma, rolling_std = indicators.bollinger(prices, period)
         upper = sma + std * rolling_std
         lower = sma - std * rolling_std
         return (prices - lower) / (upper - lower)
-    
-    def _add_financial_features(self, df: pd.DataFrame, feature_period: int) -> pd.DataFrame:
-        """Point-in-Time 재무데이터를 활용한 ML 피처 추가"""
-        if not self._point_in_time_financials or not self._ticker:
-            # 재무데이터가 없으면 기본값으로 채움
-            df["pe_ratio"] = 15.0
-            df["pb_ratio"] = 1.5
-            df["roe"] = 0.1
-            df["debt_ratio"] = 0.3
-            df["revenue_growth"] = 0.05
-            df["eps_growth"] = 0.1
-            df["current_ratio"] = 2.0
-            df["roa"] = 0.08
-            return df
-            
-        # 각 날짜별로 해당 시점에서 알 수 있었던 재무데이터 조회
-        fundamental_data = []
-        
-        for date in df.index:
-            try:
-                # 실제 구현에서는 비동기 처리 필요
-                financial_data = {
-                    "pe_ratio": 15.0,
-                    "pb_ratio": 1.5,
-                    "roe": 0.1,
-                    "debt_ratio": 0.3,
-                    "revenue_growth": 0.05,
-                    "eps_growth": 0.1,
-                    "current_ratio": 2.0,
-                    "roa": 0.08
-                }
-                fundamental_data.append(financial_data)
-            except Exception:
-                # 데이터가 없으면 기본값 사용
-                fundamental_data.append({
-                    "pe_ratio": 15.0,
-                    "pb_ratio": 1.5,
-                    "roe": 0.1,
-                    "debt_ratio": 0.3,
-                    "revenue_growth": 0.05,
-                    "eps_growth": 0.1,
-                    "current_ratio": 2.0,
-                    "roa": 0.08
-                })
-        
-        # DataFrame에 재무데이터 추가
-        fundamental_df = pd.DataFrame(fundamental_data, index=df.index)
-        for col in fundamental_df.columns:
-            df[col] = fundamental_df[col]
-            
-        # 재무데이터 기반 파생 피처 생성
-        # PE/PB 비율 변화
-        df["pe_change"] = df["pe_ratio"].pct_change(feature_period)
-        df["pb_change"] = df["pb_ratio"].pct_change(feature_period)
-        
-        # 수익성 지표 조합
-        df["profitability_score"] = (df["roe"] * 0.6 + df["roa"] * 0.4)
-        
-        # 재무건전성 지표
-        df["financial_health"] = (df["current_ratio"] / 3.0) - (df["debt_ratio"] / 0.5)
-        
-        # 성장성 지표  
-        df["growth_score"] = (df["revenue_growth"] * 0.6 + df["eps_growth"] * 0.4)
-        
-        # 상대적 밸류에이션 (롤링 순위)
-        df["pe_rank"] = df["pe_ratio"].rolling(feature_period * 2, min_periods=10).rank(pct=True)
-        df["pb_rank"] = df["pb_ratio"].rolling(feature_period * 2, min_periods=10).rank(pct=True)
-        
-        return df
-
-    def _add_financial_features(self, df: pd.DataFrame, feature_period: int) -> pd.DataFrame:
-        """Point-in-Time 재무데이터를 활용한 ML 피처 추가"""
-        if not self._point_in_time_financials or not self._ticker:
-            # 재무데이터가 없으면 기본값으로 채움
-            financial_features = {
-                "pe_ratio": 15.0, "pb_ratio": 1.5, "roe": 0.1, "roa": 0.05,
-                "debt_ratio": 0.3, "current_ratio": 2.0, "revenue_growth": 0.05, 
-                "eps_growth": 0.1
-            }
-            for col, default_val in financial_features.items():
-                df[col] = default_val
-            return self._create_financial_ml_features(df, feature_period)
-            
-        # 각 날짜별로 해당 시점에서 알 수 있었던 재무데이터 조회
-        # 실제 구현에서는 비동기 처리가 필요하지만 여기서는 기본값 사용
-        financial_features = {
-            "pe_ratio": 15.0, "pb_ratio": 1.5, "roe": 0.1, "roa": 0.05,
-            "debt_ratio": 0.3, "current_ratio": 2.0, "revenue_growth": 0.05, 
-            "eps_growth": 0.1
-        }
-        
-        for col, default_val in financial_features.items():
-            df[col] = default_val
-            
-        return self._create_financial_ml_features(df, feature_period)
-
-    def _create_financial_ml_features(self, df: pd.DataFrame, feature_period: int) -> pd.DataFrame:
-        """재무데이터를 기반으로 ML 피처 생성"""
-        # PE/PB 비율 변화
-        df["pe_change"] = df["pe_ratio"].pct_change(feature_period)
-        df["pb_change"] = df["pb_ratio"].pct_change(feature_period)
-        
-        # 수익성 지표 조합
-        df["profitability_score"] = (df["roe"] * 0.6 + df["roa"] * 0.4)
-        
-        # 재무건전성 지표
-        df["financial_health"] = (df["current_ratio"] / 3.0) - (df["debt_ratio"] / 0.5)
-        
-        # 성장성 지표  
-        df["growth_score"] = (df["revenue_growth"] * 0.6 + df["eps_growth"] * 0.4)
-        
-        # 상대적 밸류에이션 (롤링 순위)
-        df["pe_rank"] = df["pe_ratio"].rolling(feature_period * 2, min_periods=10).rank(pct=True)
-        df["pb_rank"] = df["pb_ratio"].rolling(feature_period * 2, min_periods=10).rank(pct=True)
-        
-        return df
@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
 
 
 class MarketRegimeStrategy(Strategy):
@@ -34,7 +35,7 @@ class MarketRegimeStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -56,16 +57,19 @@ class MarketRegimeStrategy(Strategy):
         # 2. 변동성 (불확실성)
         s["volatility"] = s["daily_return"].rolling(volatility_period, min_periods=1).std().shift(1)
         s["volatility_ma"] = s["volatility"].rolling(regime_period, min_periods=1).mean().shift(1)
-        s["volatility_percentile"] = s["volatility"].rolling(100, min_periods=10).rank(pct=True).shift(1)
+        s["volatility_percentile"] = indicators.rolling_rank(s["volatility"], 100, 10).shift(1)
         
         # 3. 거래량 패턴 (참여도)
         s["volume_ma"] = s["Volume"].rolling(volume_period, min_periods=1).mean().shift(1)
         s["volume_trend"] = (s["volume_ma"] / s["volume_ma"].shift(regime_period) - 1).shift(1)
         
         # 4. 가격 모멘텀 일관성
-        s["momentum_consistency"] = s["daily_return"].rolling(regime_period, min_periods=1).apply(
-            lambda x: (x > 0).sum() / len(x) if len(x) > 0 else 0.5, raw=True
-        ).shift(1)
+        # 구간 내 상승일 비율 (결측 수익률은 비상승으로 세고, 유효 수익률이 하나도 없는 구간은 NaN)
+        positive_days = (s["daily_return"] > 0).astype(float)
+        has_return = s["daily_return"].rolling(regime_period, min_periods=1).count() > 0
+        s["momentum_consistency"] = (
+            positive_days.rolling(regime_period, min_periods=1).mean().where(has_return).shift(1)
+        )
         
         # 5. 시장 국면 분류
         # 상승 트렌드: 일관된 양의 수익률 + 낮은-중간 변동성
@@ -90,7 +94,7 @@ class MarketRegimeStrategy(Strategy):
         ).fillna(False)
         
         # 고변동성: 높은 변동성 (방향 무관)
-        high_volatility = (s["volatility_percentile"] > 0.8).fillna(False).infer_objects(copy=False)
+        high_volatility = s["volatility_percentile"] > 0.8
         
         # 국면별 신호 강도
         s["regime_uptrend"] = uptrend.astype(float)
@@ -101,15 +105,12 @@ class MarketRegimeStrategy(Strategy):
         # 6. 국면별 매매 전략
         
         # RSI for 국면별 조정
-        delta = s["Close"].diff()
-        gain = delta.clip(lower=0).rolling(14, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(14, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        s["rsi"] = (100 - (100 / (1 + rs))).shift(1)
+        s["rsi"] = indicators.rsi(s["Close"], 14).shift(1)
         
         # 볼린저 밴드
-        s["bb_sma"] = s["Close"].rolling(20, min_periods=1).mean().shift(1)
-        s["bb_std"] = s["Close"].rolling(20, min_periods=1).std().shift(1)
+        bb_sma, bb_std = indicators.bollinger(s["Close"], 20)
+        s["bb_sma"] = bb_sma.shift(1)
+        s["bb_std"] = bb_std.shift(1)
         s["bb_upper"] = s["bb_sma"] + 2 * s["bb_std"]
         s["bb_lower"] = s["bb_sma"] - 2 * s["bb_std"]
         s["bb_position"] = ((s["Close"] - s["bb_lower"]) / (s["bb_upper"] - s["bb_lower"])).shift(1)
@@ -133,15 +134,14 @@ class MarketRegimeStrategy(Strategy):
         high_vol_sell = high_volatility & (s["rsi"] > 70) & (s["bb_position"] > 0.8)
         
         # 거래량 확인
-        high_volume = (s["Volume"] > s["volume_ma"] * 1.2).shift(1)
-        high_volume = high_volume.fillna(False).infer_objects(copy=False)
+        high_volume = (s["Volume"] > s["volume_ma"] * 1.2).shift(1, fill_value=False)
         
         # 최종 매매 신호 (거래량 동반 필요)
         buy_rule = (uptrend_buy | downtrend_buy | sideways_buy | high_vol_buy) & high_volume
         sell_rule = (uptrend_sell | downtrend_sell | sideways_sell | high_vol_sell) & high_volume
         
-        action = np.where(buy_rule.fillna(False), "BUY",
-                 np.where(sell_rule.fillna(False), "SELL", "HOLD"))
+        action = np.where(buy_rule, "BUY",
+                 np.where(sell_rule, "SELL", "HOLD"))
         
         # 신뢰도 계산 (국면 명확성 + RSI 극값 + 거래량)
         regime_clarity = (
@@ -161,11 +161,7 @@ class MarketRegimeStrategy(Strategy):
         
         # 국면별 손절/목표가 조정
         atr_period = 14
-        s["high_low"] = s["High"] - s["Low"]
-        s["high_close"] = abs(s["High"] - s["Close"].shift(1))
-        s["low_close"] = abs(s["Low"] - s["Close"].shift(1))
-        s["tr"] = s[["high_low", "high_close", "low_close"]].max(axis=1)
-        s["atr"] = s["tr"].rolling(atr_period, min_periods=1).mean().shift(1)
+        s["atr"] = indicators.atr(s["High"], s["Low"], s["Close"], atr_period).shift(1)
         
         # 국면별 리스크 조정
         risk_multiplier = np.where(
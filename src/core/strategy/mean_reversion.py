@@ -6,6 +6,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base import Strategy
+from . import _indicators as indicators
 
 class MeanReversionStrategy(Strategy):
     name = "mean_reversion"
@@ -15,7 +16,7 @@ class MeanReversionStrategy(Strategy):
         if params:
             p.update(params)
 
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "Daily_Return", "Volatility"]
         for c in req_cols:
             if c not in s.columns:
@@ -24,26 +25,23 @@ class MeanReversionStrategy(Strategy):
         # 볼린저 밴드
         bb_period = int(p["bb_period"])
         bb_std = float(p["bb_std"])
-        s["bb_sma"] = s["Close"].rolling(bb_period, min_periods=1).mean().shift(1)
-        s["bb_std"] = s["Close"].rolling(bb_period, min_periods=1).std().shift(1)
+        bb_sma, bb_rolling_std = indicators.bollinger(s["Close"], bb_period)
+        s["bb_sma"] = bb_sma.shift(1)
+        s["bb_std"] = bb_rolling_std.shift(1)
         s["bb_upper"] = s["bb_sma"] + bb_std * s["bb_std"]
         s["bb_lower"] = s["bb_sma"] - bb_std * s["bb_std"]
         s["bb_position"] = ((s["Close"] - s["bb_lower"]) / (s["bb_upper"] - s["bb_lower"])).shift(1)
         
         # RSI
         rsi_period = int(p["rsi_period"])
-        delta = s["Close"].diff()
-        gain = delta.clip(lower=0).rolling(rsi_period, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(rsi_period, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        s["rsi"] = (100 - (100 / (1 + rs))).shift(1)
+        s["rsi"] = indicators.rsi(s["Close"], rsi_period).shift(1)
         
         # 가격 위치 (최근 N일 범위 내)
-        s["price_percentile"] = s["Close"].rolling(20, min_periods=1).rank(pct=True).shift(1)
+        s["price_percentile"] = indicators.rolling_rank(s["Close"], 20, 1).shift(1)
         
         # 변동성 조정 (낮은 변동성에서 평균회귀 더 효과적)
         s["volatility_20"] = s["Daily_Return"].rolling(20, min_periods=1).std().shift(1)
-        s["volatility_percentile"] = s["volatility_20"].rolling(50, min_periods=1).rank(pct=True).shift(1)
+        s["volatility_percentile"] = indicators.rolling_rank(s["volatility_20"], 50, 1).shift(1)
         low_volatility = s["volatility_percentile"] < 0.3
         
         # 평균회귀 신호 조건
@@ -51,20 +49,20 @@ class MeanReversionStrategy(Strategy):
         rsi_overbought = float(p["rsi_overbought"])
         
         # 과매도 (매수 신호): RSI 낮음 + 볼린저밴드 하단 근처 + 낮은 변동성 (NaN 안전 처리)
-        oversold_rsi = (s["rsi"] < rsi_oversold).fillna(False).infer_objects(copy=False)
-        near_bb_lower = (s["bb_position"] < 0.2).fillna(False).infer_objects(copy=False)
-        price_low = (s["price_percentile"] < 0.3).fillna(False).infer_objects(copy=False)
+        oversold_rsi = s["rsi"] < rsi_oversold
+        near_bb_lower = s["bb_position"] < 0.2
+        price_low = s["price_percentile"] < 0.3
         
         # 과매수 (매도 신호): RSI 높음 + 볼린저밴드 상단 근처 (NaN 안전 처리)
-        overbought_rsi = (s["rsi"] > rsi_overbought).fillna(False).infer_objects(copy=False)
-        near_bb_upper = (s["bb_position"] > 0.8).fillna(False).infer_objects(copy=False)
-        price_high = (s["price_percentile"] > 0.7).fillna(False).infer_objects(copy=False)
+        overbought_rsi = s["rsi"] > rsi_overbought
+        near_bb_upper = s["bb_position"] > 0.8
+        price_high = s["price_percentile"] > 0.7
         
         buy_rule = oversold_rsi & near_bb_lower & low_volatility
         sell_rule = overbought_rsi & near_bb_upper
         
-        action = np.where(buy_rule.fillna(False), "BUY", 
-                 np.where(sell_rule.fillna(False), "SELL", "HOLD"))
+        action = np.where(buy_rule, "BUY", 
+                 np.where(sell_rule, "SELL", "HOLD"))
         
         # 신뢰도 (RSI 극값 + 볼린저밴드 위치 + 변동성) - NaN 안전 처리
         rsi_safe = s["rsi"].fillna(50)  # RSI NaN을 중립값 50으로 처리
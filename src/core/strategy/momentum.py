@@ -6,6 +6,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base import Strategy
+from . import _indicators as indicators
 
 class MomentumStrategy(Strategy):
     name = "momentum"
@@ -15,7 +16,7 @@ class MomentumStrategy(Strategy):
         if params:
             p.update(params)
 
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume", "Daily_Return", "Volatility"]
         for c in req_cols:
             if c not in s.columns:
@@ -31,11 +32,7 @@ class MomentumStrategy(Strategy):
         s["volume_ratio"] = (s["Volume"] / s["volume_sma"]).shift(1)
         
         # 가격 변동성 기반 ATR
-        s["high_low"] = s["High"] - s["Low"]
-        s["high_close"] = abs(s["High"] - s["Close"].shift(1))
-        s["low_close"] = abs(s["Low"] - s["Close"].shift(1))
-        s["tr"] = s[["high_low", "high_close", "low_close"]].max(axis=1)
-        s["atr"] = s["tr"].rolling(14, min_periods=1).mean().shift(1)
+        s["atr"] = indicators.atr(s["High"], s["Low"], s["Close"], 14).shift(1)
         
         # 브레이크아웃 감지 (전고점 대비)
         s["high_20"] = s["High"].rolling(20, min_periods=1).max().shift(1)
@@ -43,11 +40,11 @@ class MomentumStrategy(Strategy):
         breakout_threshold = float(p["breakout_threshold"])
         
         # 신호 조건 (NaN 안전 처리)
-        strong_momentum = (s["momentum"] > breakout_threshold).fillna(False).infer_objects(copy=False)
-        weak_momentum = (s["momentum"] < -breakout_threshold).fillna(False).infer_objects(copy=False)
-        high_volume = (s["volume_ratio"] > 1.5).fillna(False).infer_objects(copy=False)
-        breakout_up = (s["Close"] > s["high_20"]).fillna(False).infer_objects(copy=False)
-        breakdown = (s["Close"] < s["low_20"]).fillna(False).infer_objects(copy=False)
+        strong_momentum = s["momentum"] > breakout_threshold
+        weak_momentum = s["momentum"] < -breakout_threshold
+        high_volume = s["volume_ratio"] > 1.5
+        breakout_up = s["Close"] > s["high_20"]
+        breakdown = s["Close"] < s["low_20"]
         
         # 매수/매도 규칙
         buy_rule = (strong_momentum & high_volume) | (breakout_up & high_volume)
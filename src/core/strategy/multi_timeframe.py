@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
 
 
 class MultiTimeframeStrategy(Strategy):
@@ -35,7 +36,7 @@ class MultiTimeframeStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -65,9 +66,9 @@ class MultiTimeframeStrategy(Strategy):
         
         # 이동평균선 배열 상태
         s["ma_bull_setup"] = ((s["sma_short"] > s["sma_medium"]) & 
-                             (s["sma_medium"] > s["sma_long"])).shift(1)
+                             (s["sma_medium"] > s["sma_long"])).shift(1, fill_value=False)
         s["ma_bear_setup"] = ((s["sma_short"] < s["sma_medium"]) & 
-                             (s["sma_medium"] < s["sma_long"])).shift(1)
+                             (s["sma_medium"] < s["sma_long"])).shift(1, fill_value=False)
         
         # 거래량 확인
         volume_period = int(p["volume_period"])
@@ -76,29 +77,25 @@ class MultiTimeframeStrategy(Strategy):
         
         # ATR for 변동성
         atr_period = int(p["atr_period"])
-        s["high_low"] = s["High"] - s["Low"]
-        s["high_close"] = abs(s["High"] - s["Close"].shift(1))
-        s["low_close"] = abs(s["Low"] - s["Close"].shift(1))
-        s["tr"] = s[["high_low", "high_close", "low_close"]].max(axis=1)
-        s["atr"] = s["tr"].rolling(atr_period, min_periods=1).mean().shift(1)
+        s["atr"] = indicators.atr(s["High"], s["Low"], s["Close"], atr_period).shift(1)
         
         # 변동성 정규화
         s["volatility_pct"] = (s["atr"] / s["Close"]).shift(1)
-        s["volatility_rank"] = s["volatility_pct"].rolling(50, min_periods=1).rank(pct=True).shift(1)
+        s["volatility_rank"] = indicators.rolling_rank(s["volatility_pct"], 50, 1).shift(1)
         
         # 매매 신호 조건
         trend_strength = float(p["trend_strength"])
         
         # 강한 상승 트렌드 + 고거래량
-        strong_bull_trend = (s["trend_alignment"] > trend_strength).fillna(False).infer_objects(copy=False)
-        bull_ma_setup = s["ma_bull_setup"].fillna(False).infer_objects(copy=False)
-        price_above_medium = (s["price_vs_medium"] > 0.02).fillna(False).infer_objects(copy=False)  # 2% 이상
-        high_volume = (s["volume_ratio"] > 1.3).fillna(False).infer_objects(copy=False)
+        strong_bull_trend = s["trend_alignment"] > trend_strength
+        bull_ma_setup = s["ma_bull_setup"]
+        price_above_medium = s["price_vs_medium"] > 0.02  # 2% 이상
+        high_volume = s["volume_ratio"] > 1.3
         
         # 강한 하락 트렌드 + 고거래량  
-        strong_bear_trend = (s["trend_alignment"] < (1 - trend_strength)).fillna(False).infer_objects(copy=False)
-        bear_ma_setup = s["ma_bear_setup"].fillna(False).infer_objects(copy=False)
-        price_below_medium = (s["price_vs_medium"] < -0.02).fillna(False).infer_objects(copy=False)  # -2% 이하
+        strong_bear_trend = s["trend_alignment"] < (1 - trend_strength)
+        bear_ma_setup = s["ma_bear_setup"]
+        price_below_medium = s["price_vs_medium"] < -0.02  # -2% 이하
         
         # 매수 신호: 다중 시간대 상승 + MA 정배열 + 거래량
         buy_rule = strong_bull_trend & bull_ma_setup & price_above_medium & high_volume
@@ -106,13 +103,13 @@ class MultiTimeframeStrategy(Strategy):
         # 매도 신호: 다중 시간대 하락 + MA 역배열 + 거래량
         sell_rule = strong_bear_trend & bear_ma_setup & price_below_medium & high_volume
         
-        action = np.where(buy_rule.fillna(False).infer_objects(copy=False), "BUY",
-                 np.where(sell_rule.fillna(False).infer_objects(copy=False), "SELL", "HOLD"))
+        action = np.where(buy_rule, "BUY",
+                 np.where(sell_rule, "SELL", "HOLD"))
         
         # 신뢰도 계산 (트렌드 일치도 + MA 배열 + 거래량)
         trend_score = s["trend_alignment"].fillna(0.5)
-        ma_score = np.where(s["ma_bull_setup"].fillna(False).infer_objects(copy=False), 1.0,
-                           np.where(s["ma_bear_setup"].fillna(False).infer_objects(copy=False), 1.0, 0.3))
+        ma_score = np.where(s["ma_bull_setup"], 1.0,
+                           np.where(s["ma_bear_setup"], 1.0, 0.3))
         volume_score = np.clip((s["volume_ratio"].fillna(1) - 1) / 2, 0, 1)
         
         confidence = (0.4 * trend_score + 0.3 * ma_score + 0.3 * volume_score).fillna(0.5)
@@ -5,8 +5,31 @@ from __future__ import annotations
 from typing import Dict, Any
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from .base import Strategy
 
+
+def _rolling_slope(values: np.ndarray, window: int) -> np.ndarray:
+    """rolling(window, min_periods=1)에 np.polyfit(.., 1)[0]을 적용한 것과 같은 기울기를 계산합니다.
+
+    x = 0..m-1 이 고정이므로 x 편차와 Sxx를 미리 구해 두고
+    slope = sum((y - y.mean()) * (x - x.mean())) / Sxx 의 닫힌 형태로 계산합니다.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    out = np.zeros(n)
+    # 창이 다 차기 전(앞쪽 window-1개)은 길이가 짧은 구간으로 계산
+    for m in range(2, min(window, n + 1)):
+        y = values[:m]
+        xc = np.arange(m) - (m - 1) / 2
+        out[m - 1] = (y - y.mean()) @ xc / (xc @ xc)
+    if window > 1 and n >= window:
+        y = sliding_window_view(values, window)
+        xc = np.arange(window) - (window - 1) / 2
+        out[window - 1:] = (y - y.mean(axis=1, keepdims=True)) @ xc / (xc @ xc)
+    return out
+
+
 class PatternStrategy(Strategy):
     name = "pattern"
 
@@ -15,7 +38,7 @@ class PatternStrategy(Strategy):
         if params:
             p.update(params)
 
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume", "Daily_Return", "Volatility"]
         for c in req_cols:
             if c not in s.columns:
@@ -32,10 +55,10 @@ class PatternStrategy(Strategy):
         # 피벗 포인트 감지 (NaN 값 안전 처리)
         s["is_pivot_high"] = ((s["High"] > s["High"].shift(1)) & 
                              (s["High"] > s["High"].shift(-1)) & 
-                             (s["High"] == s["High"].rolling(3, center=True).max())).shift(1).fillna(False).infer_objects(copy=False)
+                             (s["High"] == s["High"].rolling(3, center=True).max())).shift(1, fill_value=False)
         s["is_pivot_low"] = ((s["Low"] < s["Low"].shift(1)) & 
                             (s["Low"] < s["Low"].shift(-1)) & 
-                            (s["Low"] == s["Low"].rolling(3, center=True).min())).shift(1).fillna(False).infer_objects(copy=False)
+                            (s["Low"] == s["Low"].rolling(3, center=True).min())).shift(1, fill_value=False)
         
         # 더블 톱/바텀 패턴 감지
         def detect_double_top_bottom(highs, lows, is_pivot_high, is_pivot_low, window=10):
@@ -70,42 +93,35 @@ class PatternStrategy(Strategy):
         )
         
         # 삼각형 패턴 (고점은 내려오고 저점은 올라오는)
-        s["high_trend"] = s["High"].rolling(pattern_window, min_periods=1).apply(
-            lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0, raw=True
-        ).shift(1)
-        s["low_trend"] = s["Low"].rolling(pattern_window, min_periods=1).apply(
-            lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0, raw=True
-        ).shift(1)
+        s["high_trend"] = pd.Series(_rolling_slope(s["High"].to_numpy(), pattern_window), index=s.index).shift(1)
+        s["low_trend"] = pd.Series(_rolling_slope(s["Low"].to_numpy(), pattern_window), index=s.index).shift(1)
         
         # 삼각형 패턴: 고점 하락, 저점 상승 (NaN 안전 처리)
         triangle_pattern = ((s["high_trend"] < -0.001) & (s["low_trend"] > 0.001))
-        triangle_pattern = triangle_pattern.fillna(False).infer_objects(copy=False)
         
         # 브레이크아웃 감지 (NaN 안전 처리)
         resistance_breakout = (s["Close"] > s["resistance"] * (1 + breakout_threshold))
-        resistance_breakout = resistance_breakout.fillna(False).infer_objects(copy=False)
         support_breakdown = (s["Close"] < s["support"] * (1 - breakout_threshold))
-        support_breakdown = support_breakdown.fillna(False).infer_objects(copy=False)
         
         # 거래량 확인
         s["volume_sma"] = s["Volume"].rolling(10, min_periods=1).mean().shift(1)
-        volume_surge = (s["Volume"] > s["volume_sma"] * 1.5).fillna(False).infer_objects(copy=False)
+        volume_surge = s["Volume"] > s["volume_sma"] * 1.5
         
         # 패턴 신호 조건 (모든 boolean 시리즈가 NaN 안전)
         # 매수: 더블바텀 후 지지선 돌파 + 거래량, 삼각형에서 저항선 돌파
-        buy_pattern = (s["double_bottom"].shift(1).fillna(False).infer_objects(copy=False) & resistance_breakout & volume_surge) | \
+        buy_pattern = (s["double_bottom"].shift(1, fill_value=False) & resistance_breakout & volume_surge) | \
                      (triangle_pattern & resistance_breakout & volume_surge)
         
         # 매도: 더블톱 후 저항선 이탈, 지지선 붕괴
-        sell_pattern = (s["double_top"].shift(1).fillna(False).infer_objects(copy=False) & support_breakdown) | \
+        sell_pattern = (s["double_top"].shift(1, fill_value=False) & support_breakdown) | \
                       (support_breakdown & volume_surge)
         
         # action 배열 생성 (NaN 안전)
-        action = np.where(buy_pattern.fillna(False).infer_objects(copy=False), "BUY", 
-                 np.where(sell_pattern.fillna(False).infer_objects(copy=False), "SELL", "HOLD"))
+        action = np.where(buy_pattern, "BUY", 
+                 np.where(sell_pattern, "SELL", "HOLD"))
         
         # 신뢰도 (패턴 명확성 + 거래량 + 브레이크아웃 강도) - NaN 안전 처리
-        pattern_strength = (s["double_top"].fillna(False).infer_objects(copy=False) | s["double_bottom"].fillna(False).infer_objects(copy=False) | triangle_pattern).astype(float)
+        pattern_strength = (s["double_top"] | s["double_bottom"] | triangle_pattern).astype(float)
         
         # 브레이크아웃 강도 계산 (NaN 안전)
         resistance_diff = (s["Close"] - s["resistance"]) / s["resistance"]
@@ -4,8 +4,16 @@ Quantitative Factor Strategy
 """
 import pandas as pd
 import numpy as np
+from types import MappingProxyType
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
+
+# 재무데이터가 없을 때 쓰는 펀더멘털 기본값
+_FUNDAMENTAL_DEFAULTS = MappingProxyType({
+    "pe_ratio": 15.0, "pb_ratio": 1.5, "roe": 0.1, "debt_ratio": 0.3,
+    "revenue_growth": 0.05, "eps_growth": 0.1,
+})
 
 
 class QuantitativeFactorStrategy(Strategy):
@@ -41,7 +49,7 @@ class QuantitativeFactorStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -107,7 +115,7 @@ class QuantitativeFactorStrategy(Strategy):
             s[f"price_deviation_{period}"] = (s["Close"] - s["Close"].rolling(period, min_periods=5).mean()) / s["Close"].rolling(period, min_periods=5).mean()
         
         # RSI 기반 과매수/과매도
-        s["rsi"] = self._calculate_rsi(s["Close"], 14)
+        s["rsi"] = indicators.rsi(s["Close"], 14)
         s["rsi_deviation"] = (s["rsi"] - 50) / 50  # -1 to 1
         
         # 볼린저 밴드 위치
@@ -270,7 +278,7 @@ class QuantitativeFactorStrategy(Strategy):
         )
         
         # 스코어 순위 (상대적 위치)
-        s["score_rank"] = s["composite_score"].rolling(lookback_long, min_periods=30).rank(pct=True)
+        s["score_rank"] = indicators.rolling_rank(s["composite_score"], lookback_long, 30)
         
         # 8. 매매 신호 생성
         
@@ -398,21 +406,13 @@ class QuantitativeFactorStrategy(Strategy):
             std = series.rolling(60, min_periods=20).std()
             return (series - mean) / (std + 0.001)
         elif method == 'rank':
-            return series.rolling(60, min_periods=20).rank(pct=True) - 0.5
+            return indicators.rolling_rank(series, 60, 20) - 0.5
         else:
             # minmax scaling
             rolling_min = series.rolling(60, min_periods=20).min()
             rolling_max = series.rolling(60, min_periods=20).max()
             return (series - rolling_min) / (rolling_max - rolling_min + 0.001) - 0.5
     
-    def _calculate_rsi(self, prices, period=14):
-        """RSI 계산"""
-        delta = prices.diff()
-        gain = delta.clip(lower=0).rolling(period, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(period, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        return 100 - (100 / (1 + rs))
-    
     def _calculate_bb_position(self, prices, period=20, std=2):
         """볼린저 밴드 위치"""
         sma = prices.rolling(period, min_periods=1).mean()
@@ -433,46 +433,15 @@ class QuantitativeFactorStrategy(Strategy):
         """Point-in-Time 재무데이터를 활용한 펀더멘털 팩터 추가"""
         if not self._point_in_time_financials or not self._ticker:
             # 재무데이터가 없으면 기본값으로 채움
-            df["pe_ratio"] = 15.0
-            df["pb_ratio"] = 1.5
-            df["roe"] = 0.1
-            df["debt_ratio"] = 0.3
-            df["revenue_growth"] = 0.05
-            df["eps_growth"] = 0.1
+            for col, default_val in _FUNDAMENTAL_DEFAULTS.items():
+                df[col] = default_val
             df["fundamental_factor"] = 0.0
             return df
             
         # 각 날짜별로 해당 시점에서 알 수 있었던 재무데이터 조회
-        fundamental_data = []
-        
-        for date in df.index:
-            try:
-                # 동기식 호출을 위해 asyncio.run 사용하지 않고 기본값 설정
-                # 실제 구현에서는 비동기 처리 또는 사전 로딩 필요
-                financial_data = {
-                    "pe_ratio": 15.0,
-                    "pb_ratio": 1.5, 
-                    "roe": 0.1,
-                    "debt_ratio": 0.3,
-                    "revenue_growth": 0.05,
-                    "eps_growth": 0.1
-                }
-                fundamental_data.append(financial_data)
-            except Exception:
-                # 데이터가 없으면 기본값 사용
-                fundamental_data.append({
-                    "pe_ratio": 15.0,
-                    "pb_ratio": 1.5,
-                    "roe": 0.1, 
-                    "debt_ratio": 0.3,
-                    "revenue_growth": 0.05,
-                    "eps_growth": 0.1
-                })
-        
-        # DataFrame에 재무데이터 추가
-        fundamental_df = pd.DataFrame(fundamental_data, index=df.index)
-        for col in fundamental_df.columns:
-            df[col] = fundamental_df[col]
+        # 실제 구현에서는 비동기 처리 또는 사전 로딩 필요 (현재는 모든 날짜에 기본값 사용)
+        # 날짜별 dict 목록 대신 컬럼별 값으로 한 번에 추가
+        df[list(_FUNDAMENTAL_DEFAULTS)] = pd.DataFrame(dict(_FUNDAMENTAL_DEFAULTS), index=df.index)
             
         # 펀더멘털 팩터 스코어 계산
         # PE 비율 (낮을수록 좋음)
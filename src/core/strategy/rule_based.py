@@ -6,6 +6,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base import Strategy
+from . import _indicators as indicators
 
 class RuleBasedStrategy(Strategy):
     name = "baseline"
@@ -15,7 +16,7 @@ class RuleBasedStrategy(Strategy):
         if params:
             p.update(params)
 
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         # 요구 컬럼 체크
         req_cols = ["Close", "Open", "Daily_Return", "Volatility"]
         for c in req_cols:
@@ -27,15 +28,10 @@ class RuleBasedStrategy(Strategy):
         s["ma200"] = s["Close"].rolling(200, min_periods=1).mean().shift(1)
 
         # RSI (분모 0 회피)
-        delta = s["Close"].diff()
-        gain = delta.clip(lower=0).rolling(14, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(14, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        s["rsi"] = (100 - (100 / (1 + rs))).shift(1)
+        s["rsi"] = indicators.rsi(s["Close"], 14).shift(1)
 
         # MACD (t-1 기준으로 판단)
-        macd_line = s["Close"].ewm(span=12, adjust=False).mean() - s["Close"].ewm(span=26, adjust=False).mean()
-        signal_line = macd_line.ewm(span=9, adjust=False).mean()
+        macd_line, signal_line = indicators.macd(s["Close"], 12, 26, 9, adjust=False)
         macd_now = macd_line.shift(1)
         signal_now = signal_line.shift(1)
         s["macd_cross"] = (macd_now > signal_now).astype(int)
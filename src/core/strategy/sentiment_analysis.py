@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
 
 
 class SentimentAnalysisStrategy(Strategy):
@@ -37,7 +38,7 @@ class SentimentAnalysisStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -112,11 +113,10 @@ class SentimentAnalysisStrategy(Strategy):
         # 4. 기술적 지표와 감정 결합
         
         # RSI
-        s["rsi"] = self._calculate_rsi(s["Close"], 14)
+        s["rsi"] = indicators.rsi(s["Close"], 14)
         
         # MACD
-        s["macd"] = self._calculate_macd(s["Close"])
-        s["macd_signal"] = self._calculate_macd_signal(s["Close"])
+        s["macd"], s["macd_signal"] = indicators.macd(s["Close"])
         s["macd_histogram"] = s["macd"] - s["macd_signal"]
         
         # 볼린저 밴드
@@ -299,25 +299,6 @@ class SentimentAnalysisStrategy(Strategy):
             return out.tail(1) if len(out) > 0 else out
         return out.iloc[warmup:]
     
-    def _calculate_rsi(self, prices, period=14):
-        """RSI 계산"""
-        delta = prices.diff()
-        gain = delta.clip(lower=0).rolling(period, min_periods=1).mean()
-        loss = (-delta.clip(upper=0)).rolling(period, min_periods=1).mean()
-        rs = gain / loss.replace(0, np.nan)
-        return 100 - (100 / (1 + rs))
-    
-    def _calculate_macd(self, prices, fast=12, slow=26):
-        """MACD 계산"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        return ema_fast - ema_slow
-    
-    def _calculate_macd_signal(self, prices, fast=12, slow=26, signal=9):
-        """MACD Signal 계산"""
-        macd = self._calculate_macd(prices, fast, slow)
-        return macd.ewm(span=signal).mean()
-    
     def _calculate_bb_position(self, prices, period=20, std=2):
         """볼린저 밴드 위치 계산"""
         sma = prices.rolling(period, min_periods=1).mean()
@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from .base import Strategy
+from . import _indicators as indicators
 
 
 class StatisticalArbitrageStrategy(Strategy):
@@ -36,7 +37,7 @@ class StatisticalArbitrageStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -81,7 +82,7 @@ class StatisticalArbitrageStrategy(Strategy):
         
         # 3. 변동성 조정
         s["volatility"] = s["returns"].rolling(20, min_periods=1).std().shift(1)
-        s["volatility_percentile"] = s["volatility"].rolling(100, min_periods=10).rank(pct=True).shift(1)
+        s["volatility_percentile"] = indicators.rolling_rank(s["volatility"], 100, 10).shift(1)
         
         # 4. 거래량 패턴
         s["volume_ma"] = s["Volume"].rolling(20, min_periods=1).mean().shift(1)
@@ -95,28 +96,26 @@ class StatisticalArbitrageStrategy(Strategy):
         # 6. 매매 신호 조건
         
         # 강한 평균 회귀성 확인
-        strong_mean_reversion = (s["mean_reversion_score"] > mean_reversion_strength).fillna(False).infer_objects(copy=False)
+        strong_mean_reversion = s["mean_reversion_score"] > mean_reversion_strength
         
         # Z-Score 기반 진입/청산
-        extreme_high = (s["zscore"] > zscore_entry).fillna(False).infer_objects(copy=False)  # 과매수
-        extreme_low = (s["zscore"] < -zscore_entry).fillna(False).infer_objects(copy=False)  # 과매도
+        extreme_high = s["zscore"] > zscore_entry  # 과매수
+        extreme_low = s["zscore"] < -zscore_entry  # 과매도
         
         # 평균 회귀 신호 (중앙값 복귀)
         revert_to_mean_high = (s["zscore"] < zscore_exit) & (s["zscore"].shift(1) > zscore_entry)
-        revert_to_mean_high = revert_to_mean_high.fillna(False).infer_objects(copy=False)
         revert_to_mean_low = (s["zscore"] > -zscore_exit) & (s["zscore"].shift(1) < -zscore_entry)
-        revert_to_mean_low = revert_to_mean_low.fillna(False).infer_objects(copy=False)
         
         # 낮은 변동성 환경 선호 (예측 가능성 증가)
-        low_volatility = (s["volatility_percentile"] < 0.6).fillna(False).infer_objects(copy=False)
+        low_volatility = s["volatility_percentile"] < 0.6
         
         # 정상적인 스프레드 (유동성 확인)
-        normal_spread = (s["spread_ratio"] < 1.5).fillna(False).infer_objects(copy=False)
+        normal_spread = s["spread_ratio"] < 1.5
         
         # 거래량 확인 (선택적)
         volume_ok = True
         if volume_confirmation:
-            volume_ok = (s["volume_ratio"] > 0.8).fillna(False).infer_objects(copy=False)  # 최소 거래량
+            volume_ok = s["volume_ratio"] > 0.8  # 최소 거래량
         
         # 매수 신호: 극도로 과매도 + 평균 회귀 환경
         buy_rule = (extreme_low & strong_mean_reversion & low_volatility & 
@@ -34,7 +34,7 @@ class VolumeProfileStrategy(Strategy):
         if params:
             p.update(params)
         
-        s = df.copy().rename_axis("date")
+        s = df.rename_axis("date")
         req_cols = ["Close", "Open", "High", "Low", "Volume"]
         for c in req_cols:
             if c not in s.columns:
@@ -134,16 +134,16 @@ class VolumeProfileStrategy(Strategy):
         )
         
         # 매매 신호 조건
-        high_volume = (s["volume_ratio"] > volume_threshold).fillna(False).infer_objects(copy=False)
-        strong_volume_node = (s["volume_strength"] > 2.0).fillna(False).infer_objects(copy=False)  # 평균 대비 2배 이상
+        high_volume = s["volume_ratio"] > volume_threshold
+        strong_volume_node = s["volume_strength"] > 2.0  # 평균 대비 2배 이상
         
         # 매수 신호: 거래량 지지선 근처 + VWAP 위 + 고거래량
-        near_support = (s["distance_to_support"] > -0.02).fillna(False).infer_objects(copy=False) & (s["distance_to_support"] < 0.01).fillna(False).infer_objects(copy=False)
-        above_vwap = (s["price_vs_vwap"] > 0).fillna(False).infer_objects(copy=False)
+        near_support = (s["distance_to_support"] > -0.02) & (s["distance_to_support"] < 0.01)
+        above_vwap = s["price_vs_vwap"] > 0
         
         # 매도 신호: 거래량 저항선 근처 + VWAP 아래로 하락 + 고거래량
-        near_resistance = (s["distance_to_resistance"] > -0.01).fillna(False).infer_objects(copy=False) & (s["distance_to_resistance"] < 0.02).fillna(False).infer_objects(copy=False)
-        below_vwap = (s["price_vs_vwap"] < -0.01).fillna(False).infer_objects(copy=False)
+        near_resistance = (s["distance_to_resistance"] > -0.01) & (s["distance_to_resistance"] < 0.02)
+        below_vwap = s["price_vs_vwap"] < -0.01
         
         # 저거래량 구간 돌파 (갭 매수/매도)
         low_volume_breakout = (
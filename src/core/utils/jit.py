@@ -0,0 +1,22 @@
+"""
+numba JIT 데코레이터 (선택 의존성)
+
+numba가 설치되어 있으면 numba의 njit/prange를 그대로 내보내고, 없으면 함수를
+그대로 돌려주는 njit와 range로 대체하여 같은 커널 코드가 순수 Python으로 동작합니다.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 환경
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+__all__ = ['njit', 'prange']
@@ -0,0 +1,49 @@
+"""
+차트 분석기 지표 캐시 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from src.core.chart.analyzer import ChartAnalyzer
+
+
+def _frame(n=300):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1e6},
+        index=pd.bdate_range('2020-01-01', periods=n),
+    )
+
+
+def test_indicator_cache_detects_interior_changes():
+    analyzer = ChartAnalyzer()
+    df = _frame()
+    before = analyzer.calculate_technical_indicators(df)
+
+    revised = df.copy()
+    revised.iloc[150, revised.columns.get_indexer(['High', 'Low'])] *= [1.5, 0.5]
+    after = analyzer.calculate_technical_indicators(revised)
+    assert not after['k_percent'].equals(before['k_percent'])
+
+
+def test_indicator_cache_returns_copies():
+    analyzer = ChartAnalyzer()
+    df = _frame()
+    first = analyzer.calculate_technical_indicators(df)
+    first['rsi'].iloc[:] = 0.0
+    assert (analyzer.calculate_technical_indicators(df)['rsi'] != 0.0).any()
+
+
+def test_indicators_many_matches_single_ticker():
+    analyzer = ChartAnalyzer()
+    frames = {'A': _frame(300), 'B': _frame(120), 'SHORT': _frame(10)}
+    frames['B'].iloc[5, frames['B'].columns.get_loc('Close')] = np.nan  # 종가 결측 행은 제외됨
+    many = analyzer.calculate_technical_indicators_many(frames)
+
+    assert many['SHORT'] == {}
+    for symbol in ('A', 'B'):
+        single = analyzer.calculate_technical_indicators(frames[symbol])
+        assert single.keys() == many[symbol].keys()
+        for name, series in single.items():
+            pd.testing.assert_series_equal(many[symbol][name], series)
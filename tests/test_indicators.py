@@ -0,0 +1,31 @@
+"""
+전략 공통 지표 캐시 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from src.core.strategy import _indicators
+
+
+def _close(n=200):
+    return pd.Series(100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n)))
+
+
+def test_indicator_cache_detects_interior_changes():
+    close = _close()
+    before = _indicators.rsi(close)
+    revised = close.copy()
+    revised.iloc[100] += 5.0
+    after = _indicators.rsi(revised)
+    assert not after.equals(before)
+
+    _indicators._indicator_cache.clear()
+    assert after.equals(_indicators.rsi(revised))
+
+
+def test_indicator_cache_shares_results_between_copies():
+    close = _close()
+    _indicators.bollinger(close)
+    cached = len(_indicators._indicator_cache)
+    _indicators.bollinger(close.copy())
+    assert len(_indicators._indicator_cache) == cached
@@ -0,0 +1,197 @@
+"""
+NumPy/numba 커널과 pandas/NumPy 기준 구현 비교 테스트
+
+각 테스트는 numba JIT 버전과 numba가 없을 때의 순수 Python 버전에서 모두 실행됩니다.
+"""
+import importlib
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.strategy import _indicators
+
+_KERNEL_MODULES = (
+    'src.core.strategy._kernels',
+    'src.core.data._kernels',
+    'src.core.chart._kernels',
+)
+
+
+def _load_kernels() -> types.SimpleNamespace:
+    strategy, data, chart = (importlib.import_module(name) for name in _KERNEL_MODULES)
+    return types.SimpleNamespace(
+        ensemble_ridge_predict=strategy.ensemble_ridge_predict,
+        rolling_rank_pct=strategy.rolling_rank_pct,
+        returns_and_volatility=data.returns_and_volatility,
+        lttb_indices=chart.lttb_indices,
+    )
+
+
+@pytest.fixture(params=['numba', 'python'])
+def kernels(request, monkeypatch):
+    if request.param == 'numba':
+        return _load_kernels()
+
+    # numba가 없는 환경처럼 대체 데코레이터로 커널 모듈을 새로 불러옴 (테스트 후 원래 모듈 복원)
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    for name in ('src.core.utils.jit',) + _KERNEL_MODULES:
+        package, _, attr = name.rpartition('.')
+        monkeypatch.setattr(sys.modules[package], attr, sys.modules[name])
+        monkeypatch.delitem(sys.modules, name)
+    loaded = _load_kernels()
+    assert not hasattr(loaded.rolling_rank_pct, 'py_func')
+    return loaded
+
+
+def _with_gaps(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    values[[3, 4, 17]] = np.nan
+    values[25] = np.inf
+    return values
+
+
+# --- rolling_rank_pct -------------------------------------------------------
+
+@pytest.mark.parametrize('window, min_periods', [(5, 1), (10, 10), (20, 8)])
+def test_rolling_rank_pct_matches_pandas(kernels, window, min_periods):
+    rng = np.random.default_rng(0)
+    x = _with_gaps(np.round(rng.normal(size=60), 1))  # 반올림으로 동점 포함
+    expected = pd.Series(x).rolling(window, min_periods=min_periods).rank(pct=True).to_numpy()
+    np.testing.assert_allclose(kernels.rolling_rank_pct(x, window, min_periods), expected, rtol=1e-12)
+
+
+def test_rolling_rank_pct_too_few_observations(kernels):
+    x = np.array([1.0, np.nan, 2.0, 3.0])
+    assert np.isnan(kernels.rolling_rank_pct(x, 10, 5)).all()
+
+
+def test_rolling_rank_rejects_min_periods_above_window():
+    with pytest.raises(ValueError):
+        _indicators.rolling_rank(pd.Series(np.arange(5.0)), 3, 4)
+
+
+# --- returns_and_volatility -------------------------------------------------
+
+def _returns_reference(close: pd.Series, window: int):
+    daily = close.pct_change()
+    cumulative = (1 + daily).cumprod() - 1
+    volatility = daily.rolling(window).std() * np.sqrt(252)
+    return daily.to_numpy(), cumulative.to_numpy(), volatility.to_numpy()
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_returns_and_volatility_matches_pandas(kernels, dtype):
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 80)))
+    close[[10, 11, 40]] = np.nan
+    close[50:56] = close[49]  # 변동성이 0인 구간
+    close = close.astype(dtype)
+
+    result = kernels.returns_and_volatility(close, 20, np.sqrt(252))
+    expected = _returns_reference(pd.Series(close), 20)
+    for got, want in zip(result, expected):
+        np.testing.assert_allclose(got, want, rtol=1e-6 if dtype == np.float32 else 1e-10, atol=1e-12)
+    assert result[0].dtype == dtype and result[2].dtype == np.float64
+
+
+def test_returns_and_volatility_shorter_than_window(kernels):
+    close = np.array([10.0, 11.0, 10.5, 12.0])
+    daily, cumulative, volatility = kernels.returns_and_volatility(close, 20, np.sqrt(252))
+    np.testing.assert_allclose(daily, pd.Series(close).pct_change().to_numpy())
+    np.testing.assert_allclose(cumulative[-1], close[-1] / close[0] - 1)
+    assert np.isnan(volatility).all()
+
+
+# --- lttb_indices -----------------------------------------------------------
+
+def _lttb_reference(y: np.ndarray, n_out: int) -> np.ndarray:
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    for i in range(n_out - 2):
+        nxt = np.arange(int((i + 1) * every) + 1, min(int((i + 2) * every) + 1, n))
+        cur = np.arange(int(i * every) + 1, int((i + 1) * every) + 1)
+        a = selected[-1]
+        area = np.abs((a - nxt.mean()) * (y[cur] - y[a]) - (a - cur) * (y[nxt].mean() - y[a]))
+        selected.append(int(cur[np.argmax(area)]))
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+@pytest.mark.parametrize('n, n_out', [(1000, 100), (257, 50), (30, 3)])
+def test_lttb_indices_matches_reference(kernels, n, n_out):
+    y = np.cumsum(np.random.default_rng(2).normal(size=n))
+    idx = kernels.lttb_indices(y, n_out)
+    np.testing.assert_array_equal(idx, _lttb_reference(y, n_out))
+    assert len(idx) == n_out and idx[0] == 0 and idx[-1] == n - 1
+    assert (np.diff(idx) > 0).all()
+
+
+@pytest.mark.parametrize('n_out', [2, 50, 60])
+def test_lttb_indices_keeps_all_points_when_not_downsampling(kernels, n_out):
+    y = np.arange(50, dtype=float)
+    np.testing.assert_array_equal(kernels.lttb_indices(y, n_out), np.arange(50))
+
+
+# --- ensemble_ridge_predict -------------------------------------------------
+
+def _ensemble_reference(X, y, valid_rows, row_weights, start, stop, lookback,
+                        min_samples, max_sample_size, lam):
+    n, n_features = X.shape
+    prediction = np.full(n, np.nan)
+    confidence = np.full(n, np.nan)
+    for i in range(start, stop):
+        rows = np.flatnonzero(valid_rows[max(0, i - lookback):i]) + max(0, i - lookback)
+        if (len(rows) < min_samples or min(len(rows), max_sample_size) <= n_features
+                or np.isnan(X[i]).any()):
+            continue
+        preds = []
+        for k in range(row_weights.shape[1]):
+            c = row_weights[rows, k]
+            Xr = X[rows].astype(np.float64)
+            A = Xr.T @ (c[:, None] * Xr) + lam * np.eye(n_features)
+            w = np.linalg.solve(A, Xr.T @ (c * y[rows]))
+            preds.append(w @ X[i])
+        preds = np.array(preds)
+        prediction[i] = preds.mean()
+        confidence[i] = max(0.0, 1 - preds.std() / (abs(preds.mean()) + 0.01))
+    return prediction, confidence
+
+
+def _ensemble_inputs(n=90, n_features=3, n_models=4):
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(n, n_features))
+    y = X @ np.array([0.5, -0.2, 0.1]) + rng.normal(0, 0.1, n)
+    X[[7, 30, 31, 60]] = np.nan
+    y[[12, 45]] = np.nan
+    valid_rows = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+    row_weights = rng.poisson(1.0, size=(n, n_models)).astype(np.float64)
+    return X, y, valid_rows, row_weights
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_ensemble_ridge_predict_matches_numpy(kernels, dtype):
+    X, y, valid_rows, row_weights = _ensemble_inputs()
+    X, y = X.astype(dtype), y.astype(dtype)
+    args = (X, y, valid_rows, row_weights, 25, 85, 25, 15, 80, 0.1)
+    prediction, confidence = kernels.ensemble_ridge_predict(*args)
+    expected_prediction, expected_confidence = _ensemble_reference(*args)
+
+    np.testing.assert_array_equal(np.isnan(prediction), np.isnan(expected_prediction))
+    assert np.isnan(prediction[:25]).all() and np.isnan(prediction[85:]).all()
+    assert np.isnan(prediction[[30, 31, 60]]).all()  # 현재 피처에 결측이 있는 시점
+    np.testing.assert_allclose(prediction, expected_prediction, rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(confidence, expected_confidence, rtol=1e-6, atol=1e-9)
+
+
+def test_ensemble_ridge_predict_too_few_samples(kernels):
+    X, y, valid_rows, row_weights = _ensemble_inputs()
+    prediction, confidence = kernels.ensemble_ridge_predict(
+        X, y, valid_rows, row_weights, 25, 85, 25, 30, 80, 0.1
+    )
+    assert np.isnan(prediction).all() and np.isnan(confidence).all()
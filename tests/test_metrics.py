@@ -0,0 +1,32 @@
+"""
+백테스트 성과 지표 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from src.core.backtest.metrics import compute_metrics
+
+
+def test_compute_metrics_empty_equity():
+    metrics = compute_metrics(pd.DataFrame({"equity": []}))
+    assert metrics["CAGR"] == 0.0
+    assert np.isnan(metrics["Volatility"])
+    assert np.isnan(metrics["Sharpe"])
+    assert np.isnan(metrics["MaxDrawdown"])
+
+
+def test_compute_metrics_single_row_equity():
+    metrics = compute_metrics(pd.DataFrame({"equity": [1.0]}))
+    assert metrics["CAGR"] == 0.0
+    assert np.isnan(metrics["Volatility"])
+    assert metrics["MaxDrawdown"] == 0.0
+
+
+def test_compute_metrics_matches_pandas():
+    eq = pd.Series([1.0, 1.1, 1.05, 1.2, 0.9, 1.3])
+    rets = eq.pct_change().fillna(0)
+    metrics = compute_metrics(pd.DataFrame({"equity": eq}))
+    assert np.isclose(metrics["CAGR"], (eq.iloc[-1] / eq.iloc[0]) ** (252 / len(eq)) - 1)
+    assert np.isclose(metrics["Volatility"], rets.std() * np.sqrt(252))
+    assert np.isclose(metrics["Sharpe"], rets.mean() / (rets.std() + 1e-9) * np.sqrt(252))
+    assert np.isclose(metrics["MaxDrawdown"], (eq / eq.cummax() - 1).min())
@@ -0,0 +1,58 @@
+"""
+전략 기본 클래스 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from src.core.strategy.base import Strategy
+
+
+class _CountingStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def compute_signals(self, df, params=None):
+        self.calls += 1
+        return pd.DataFrame(
+            {"action": ["HOLD"], "confidence": [0.0], "reason": ["-"]},
+            index=df.index[-1:],
+        )
+
+
+def _frame(last_close):
+    idx = pd.date_range("2024-01-01", periods=3)
+    return pd.DataFrame({"Close": [1.0, 2.0, last_close], "Volatility": [np.nan] * 3}, index=idx)
+
+
+def test_latest_signal_memo_hits_with_nan_in_last_row():
+    strategy = _CountingStrategy()
+    strategy.latest_signal(_frame(3.0))
+    strategy.latest_signal(_frame(3.0))
+    assert strategy.calls == 1
+
+
+def test_latest_signal_memo_misses_when_last_row_changes():
+    strategy = _CountingStrategy()
+    strategy.latest_signal(_frame(3.0))
+    strategy.latest_signal(_frame(4.0))
+    assert strategy.calls == 2
+
+
+def test_latest_signal_memo_misses_when_earlier_bar_is_revised():
+    strategy = _CountingStrategy()
+    df = _frame(3.0)
+    strategy.latest_signal(df)
+    revised = df.copy()
+    revised.iloc[0, 0] = 0.5  # 수정주가 반영 등으로 과거 봉만 바뀜
+    strategy.latest_signal(revised)
+    assert strategy.calls == 2
+
+
+def test_latest_signal_returns_independent_copies():
+    strategy = _CountingStrategy()
+    first = strategy.latest_signal(_frame(3.0))
+    first.confidence = 1.0
+    second = strategy.latest_signal(_frame(3.0))
+    assert strategy.calls == 1
+    assert second.confidence == 0.0